@@ -0,0 +1,121 @@
+#  Copyright 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+"""Benchmarks of the conversion of .NET `DataTable` instances to `pandas` `DataFrame` instances.
+
+These benchmarks convert synthetic tables created by `tests.stub_net_data_table`; consequently, unlike the
+other benchmarks, they require no Orchid training data.
+"""
+
+import functools
+import random
+import uuid
+
+import pendulum
+import pytest
+import toolz.curried as toolz
+
+from orchid import native_data_frame_adapter as dfa
+
+from tests import (
+    stub_net as tsn,
+    stub_net_data_table as tsdt,
+)
+
+
+SMALL_ROW_COUNT = 10_000
+MEDIUM_ROW_COUNT = 100_000
+LARGE_ROW_COUNT = 1_000_000
+
+ROW_COUNTS = [
+    SMALL_ROW_COUNT,
+    pytest.param(MEDIUM_ROW_COUNT, marks=pytest.mark.slow),
+    pytest.param(LARGE_ROW_COUNT, marks=pytest.mark.slow),
+]
+
+
+def _synthetic_row(randomizer: random.Random, row_no: int) -> dict:
+    start = pendulum.datetime(2023, 1, 1, tz='UTC')
+    result = {
+        'pressure': randomizer.uniform(0.0, 10000.0),
+        'stage_no': row_no % 50 + 1,
+        'well_name': f'Demo_{row_no % 4 + 1}H',
+        'pick_time': start.add(seconds=row_no, microseconds=randomizer.randrange(0, 1000000, 1000)),
+        'elapsed': pendulum.duration(seconds=randomizer.randrange(0, 86400), microseconds=row_no % 1000),
+        'object_id': uuid.UUID(int=randomizer.getrandbits(128)),
+    }
+    # Every seventh row has missing values (`DBNull` in the .NET `DataTable`) in two of its columns.
+    if row_no % 7 == 0:
+        result['pressure'] = None
+        result['object_id'] = None
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _synthetic_data_table(row_count: int):
+    randomizer = random.Random(row_count)
+    table_data_dto = tsn.TableDataDto([float, int, str, pendulum.DateTime, pendulum.Duration, uuid.UUID],
+                                      [_synthetic_row(randomizer, row_no) for row_no in range(row_count)],
+                                      toolz.identity)
+    return tsdt.populate_data_table(table_data_dto)
+
+
+@pytest.mark.parametrize('row_count', ROW_COUNTS)
+def test_table_to_data_frame(benchmark, row_count):
+    data_table = _synthetic_data_table(row_count)
+    actual = benchmark.pedantic(dfa._table_to_data_frame, args=(data_table,), rounds=3, iterations=1)
+    assert len(actual) == row_count
+
+
+@pytest.mark.parametrize('row_count', ROW_COUNTS)
+def test_table_to_compact_data_frame(benchmark, row_count):
+    data_table = _synthetic_data_table(row_count)
+    actual = benchmark.pedantic(dfa._table_to_data_frame, args=(data_table,), kwargs={'compact': True},
+                                rounds=3, iterations=1)
+    assert len(actual) == row_count
+
+
+@functools.lru_cache(maxsize=None)
+def _synthetic_guid_cells(row_count: int) -> tuple:
+    data_table = _synthetic_data_table(row_count)
+    object_id_column_no = data_table.Columns['object_id'].Ordinal
+    return tuple(row[object_id_column_no] for row in dfa._read_data_table(data_table))
+
+
+@pytest.mark.parametrize('row_count', ROW_COUNTS)
+def test_guid_cells_to_uuids_cell_by_cell(benchmark, row_count):
+    # The conversion of GUID columns before the bulk conversion: one .NET string and one parse for each cell.
+    guid_cells = _synthetic_guid_cells(row_count)
+    actual = benchmark.pedantic(lambda cells: [dfa.net_cell_value_to_pandas_cell_value(cell) for cell in cells],
+                                args=(guid_cells,), rounds=3, iterations=1)
+    assert len(actual) == row_count
+
+
+@pytest.mark.parametrize('row_count', ROW_COUNTS)
+def test_guid_cells_to_bytes(benchmark, row_count):
+    guid_cells = _synthetic_guid_cells(row_count)
+    actual = benchmark.pedantic(dfa.net_guids_to_bytes, args=(guid_cells,), rounds=3, iterations=1)
+    assert len(actual) == row_count
+
+
+@pytest.mark.parametrize('row_count', ROW_COUNTS)
+def test_guid_cells_to_uuids_in_bulk(benchmark, row_count):
+    guid_cells = _synthetic_guid_cells(row_count)
+    object_id_column = dfa.NetColumnDto(0, 'object_id', 'System.Guid')
+    actual = benchmark.pedantic(dfa._net_column_to_array, args=(object_id_column, guid_cells), rounds=3, iterations=1)
+    assert len(actual) == row_count
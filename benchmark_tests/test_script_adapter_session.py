@@ -0,0 +1,49 @@
+#  Copyright 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+"""Benchmarks of the overhead of initializing the .NET `ScriptAdapter` with and without `orchid.session()`."""
+
+import pytest
+
+import orchid
+from orchid import script_adapter_context as sac
+
+
+CALL_COUNT = 20
+
+
+def _enter_contexts(call_count):
+    # Each context models a single operation (for example, `data_points()`) requiring the `ScriptAdapter`.
+    for _ in range(call_count):
+        with sac.ScriptAdapterContext():
+            pass
+
+
+def _enter_contexts_in_session(call_count):
+    with orchid.session():
+        _enter_contexts(call_count)
+
+
+@pytest.mark.slow
+def test_script_adapter_contexts_without_session(benchmark):
+    benchmark.pedantic(_enter_contexts, args=(CALL_COUNT,), rounds=5, iterations=1)
+
+
+@pytest.mark.slow
+def test_script_adapter_contexts_in_session(benchmark):
+    benchmark.pedantic(_enter_contexts_in_session, args=(CALL_COUNT,), rounds=5, iterations=1)
@@ -24,7 +24,9 @@ from .dot_net import prepare_imports
 prepare_imports()
 
 # High-level API
-from .core import load_project, save_project, optimized_but_possibly_unsafe_save
+from .core import load_project, load_project_async, save_project, optimized_but_possibly_unsafe_save
+from .script_adapter_context import session
+from .project_cache import enable_project_cache, disable_project_cache
 
 # Helpful constants
 from .native_treatment_curve_adapter import TreatmentCurveTypes
@@ -36,6 +38,7 @@ from .convert import to_unit
 from .measurement import registry as unit_registry
 from .native_treatment_calculations import (median_treating_pressure, pumped_fluid_volume, total_proppant_mass)
 from .reference_origins import WellReferenceFrameXy
+from .time_series_alignment import align_time_series
 from .unit_system import abbreviation, make_measurement
 
 # Only for training data
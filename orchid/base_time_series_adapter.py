@@ -14,15 +14,24 @@
 
 
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Union
+import math
+from typing import Callable, Optional, Tuple, Union
 
+import deal
 import numpy as np
 import pandas as pd
+import pendulum
 
 from orchid import (
+    compact_time_series as cts,
+    convert as oc,
     dom_project_object as dpo,
     dot_net_dom_access as dna,
+    net_array,
     project_store as loader,
+    time_series_cache as tsc,
+    time_series_decimation as tsd,
+    time_series_view as tsv,
     unit_system as units,
 )
 
@@ -74,18 +83,208 @@ class BaseTimeSeriesAdapter(dpo.DomProjectObject, metaclass=ABCMeta):
         quantity_name_unit_map = self.quantity_name_unit_map(self.expect_project_units)
         return quantity_name_unit_map[self.sampled_quantity_name]
 
-    def data_points(self) -> pd.Series:
+    @deal.pre(lambda _self, start=None, stop=None, max_points=None, method='minmax', in_unit=None, dtype=None:
+              method in tsd.DECIMATION_METHODS)
+    @deal.pre(lambda _self, start=None, stop=None, max_points=None, method='minmax', in_unit=None, dtype=None:
+              max_points is None or max_points > 2)
+    def data_points(self, start: Optional[pendulum.DateTime] = None,
+                    stop: Optional[pendulum.DateTime] = None,
+                    max_points: Optional[int] = None,
+                    method: str = 'minmax',
+                    in_unit: Optional[Union[units.UsOilfield, units.Metric]] = None,
+                    dtype=np.float64) -> pd.Series:
         """
         Return the time series for this curve.
 
+        If either `start` or `stop` is supplied, this method only returns the samples in the (closed) interval
+        from `start` to `stop`. It locates this window by a binary search of the sample time stamps and only
+        copies the sample magnitudes in this window into Python.
+
+        If a `time_series_cache.TimeSeriesCache` is registered for the project of this curve, this method reads
+        the samples from that cache (if available) instead of from .NET.
+
+        If `max_points` is supplied, this method returns at most `max_points` samples chosen (by `method`) to
+        preserve the visual appearance of the curve. This reduction occurs on the raw sample arrays before the
+        creation of the `pandas` `Series`. The available methods are:
+
+        - 'minmax': Retain the minimum and the maximum sample of each of `max_points / 2` buckets of samples.
+        - 'lttb': Retain the samples chosen by the Largest-Triangle-Three-Buckets algorithm.
+
+        If `in_unit` is supplied, this method returns the sample magnitudes converted from
+        `sampled_quantity_unit()` to `in_unit`. It applies the (scale and, for temperatures, offset) conversion
+        to the whole array of magnitudes; it creates no `pint` `Quantity` for the individual samples.
+
+        Args:
+            start: The earliest time of a returned sample. If `None`, start with the first sample.
+            stop: The latest time of a returned sample. If `None`, stop with the last sample.
+            max_points: The maximum number of returned samples (greater than two). If `None`, return all samples.
+            method: The decimation method used if `max_points` is supplied.
+            in_unit: The unit of the returned sample magnitudes. If `None`, return magnitudes in the unit,
+            `sampled_quantity_unit()`, of this curve.
+            dtype: The `numpy` type of the returned sample magnitudes; for example, `numpy.float32` to halve the
+            memory occupied by the magnitudes.
+
         Returns
             The `pandas` time `Series` for this curve.
         """
-        python_time_series_arrays = loader.as_python_time_series_arrays(self.dom_object)
+        unix_time_stamps, magnitudes = self.sample_arrays(start, stop)
+        if max_points is not None:
+            retained = tsd.DECIMATION_METHODS[method](unix_time_stamps, magnitudes, max_points)
+            unix_time_stamps, magnitudes = unix_time_stamps[retained], magnitudes[retained]
+        if in_unit is not None:
+            magnitudes = oc.magnitudes_to_unit(in_unit, self.sampled_quantity_unit(), magnitudes)
+        if magnitudes.dtype != dtype:
+            magnitudes = magnitudes.astype(dtype)
+        result = _as_time_series(unix_time_stamps, magnitudes, self.name)
+        return result
+
+    def compact_data_points(self, start: Optional[pendulum.DateTime] = None,
+                            stop: Optional[pendulum.DateTime] = None,
+                            in_unit: Optional[Union[units.UsOilfield, units.Metric]] = None,
+                            dtype=np.float32) -> cts.CompactTimeSeries:
+        """
+        Return the samples of this curve in a memory-lean representation.
 
-        result = pd.Series(data=np.fromiter(python_time_series_arrays.SampleMagnitudes, dtype='float'),
-                           index=pd.DatetimeIndex(np.fromiter(python_time_series_arrays.UnixTimeStampsInSeconds,
-                                                              dtype='datetime64[s]'), tz='UTC'),
-                           name=self.name)
+        Unlike `data_points()`, this method creates no `pandas` objects. The returned instance stores the
+        sample times as a start time and either a sampling interval (for regularly sampled curves) or `int32`
+        offsets. It calculates the sample times only when requested; for example, by its `to_series()` method.
 
-        return result
+        Args:
+            start: The earliest time of a returned sample. See `data_points()`.
+            stop: The latest time of a returned sample. See `data_points()`.
+            in_unit: The unit of the returned sample magnitudes. See `data_points()`.
+            dtype: The `numpy` type of the returned sample magnitudes.
+
+        Returns:
+            The compact representation of the samples of this curve.
+        """
+        unix_time_stamps, magnitudes = self.sample_arrays(start, stop)
+        if in_unit is not None:
+            magnitudes = oc.magnitudes_to_unit(in_unit, self.sampled_quantity_unit(), magnitudes)
+        return cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, magnitudes, self.name, dtype)
+
+    def data_points_in_time_range(self, time_range: pendulum.Period) -> pd.Series:
+        """
+        Return the samples of this curve inside `time_range`.
+
+        For example, `curve.data_points_in_time_range(stage.time_range)` returns the samples of `curve` recorded
+        during the treatment of `stage`.
+
+        Args:
+            time_range: The time range (for example, of a stage or of a monitor) of interest.
+
+        Returns
+            The `pandas` time `Series` of the samples of this curve in `time_range` (including its end points).
+        """
+        return self.data_points(start=time_range.start, stop=time_range.end)
+
+    def view(self) -> tsv.TimeSeriesView:
+        """
+        Return a lazy view of all the samples of this curve.
+
+        Creating (or slicing) the view reads no samples. For example,
+        `curve.view()[stage.start_time:stage.stop_time].max()` only reads the samples recorded during `stage`.
+
+        Returns:
+            The `TimeSeriesView` of this curve.
+        """
+        return tsv.TimeSeriesView(self)
+
+    def sample_arrays(self, start: Optional[pendulum.DateTime] = None,
+                      stop: Optional[pendulum.DateTime] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the raw sample arrays of this curve without creating a `pandas` `Series`.
+
+        Args:
+            start: The earliest time of a returned sample. See `data_points()`.
+            stop: The latest time of a returned sample. See `data_points()`.
+
+        Returns:
+            A tuple of two `numpy` arrays: the `int64` Unix time stamps (in seconds) of the samples and the
+            `float64` sample magnitudes. Arrays read from a `time_series_cache.TimeSeriesCache` are read-only.
+        """
+        def load_all_samples():
+            return _as_numpy_arrays(loader.as_python_time_series_arrays(self.dom_object))
+
+        maybe_cache = self._maybe_time_series_cache()
+        if maybe_cache is None:
+            return _as_numpy_arrays(loader.as_python_time_series_arrays(self.dom_object), start, stop)
+
+        cache, fingerprint = maybe_cache
+        unix_time_stamps, magnitudes = cache.get_or_load(tsc.series_key(fingerprint, self.object_id),
+                                                         load_all_samples)
+        start_index, stop_index = _window_indices(unix_time_stamps, start, stop)
+        return unix_time_stamps[start_index:stop_index], magnitudes[start_index:stop_index]
+
+    def _maybe_time_series_cache(self) -> Optional[Tuple[tsc.TimeSeriesCache, str]]:
+        if self._net_project_callable is None:
+            return None
+
+        return tsc.project_cache(dna.NetObjectIdentity(self._net_project_callable()))
+
+
+def _as_numpy_arrays(python_time_series_arrays,
+                     start: Optional[pendulum.DateTime] = None,
+                     stop: Optional[pendulum.DateTime] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Copy the .NET arrays of a `PythonTimeSeriesArraysDto` into `numpy` arrays.
+
+    Both .NET arrays (the `double[]` sample magnitudes and the `long[]` Unix time stamps) are copied into `numpy`
+    in bulk; no sample crosses the boundary between .NET and Python as an individual Python object.
+
+    Args:
+        python_time_series_arrays: The arrays of sample magnitudes and of Unix time stamps (in seconds).
+        start: The earliest time of a copied sample (if any).
+        stop: The latest time of a copied sample (if any).
+
+    Returns:
+        A tuple of the `int64` Unix time stamps and the `float64` sample magnitudes.
+    """
+    unix_time_stamps = net_array.as_numpy_array(python_time_series_arrays.UnixTimeStampsInSeconds, np.int64)
+    start_index, stop_index = _window_indices(unix_time_stamps, start, stop)
+    magnitudes = net_array.as_numpy_array(python_time_series_arrays.SampleMagnitudes, np.float64,
+                                          start_index, stop_index)
+    return unix_time_stamps[start_index:stop_index], magnitudes
+
+
+def _as_time_series(unix_time_stamps: np.ndarray, magnitudes: np.ndarray, name: str) -> pd.Series:
+    """
+    Convert the sample arrays of a time series into a `pandas` time `Series`.
+
+    The index is created by reinterpreting the `int64` time stamps as `datetime64[s]` values.
+
+    Args:
+        unix_time_stamps: The Unix time stamps (in seconds) of the samples.
+        magnitudes: The magnitudes of the samples.
+        name: The name of the resulting `Series`.
+
+    Returns:
+        The `pandas` time `Series`.
+    """
+    if not magnitudes.flags.writeable:
+        # Do not share (read-only) cached magnitudes with the caller
+        magnitudes = magnitudes.copy()
+    result = pd.Series(data=magnitudes,
+                       index=pd.DatetimeIndex(unix_time_stamps.view('datetime64[s]'), tz='UTC'),
+                       name=name)
+    return result
+
+
+def _window_indices(unix_time_stamps: np.ndarray, start: Optional[pendulum.DateTime],
+                    stop: Optional[pendulum.DateTime]):
+    """
+    Calculate the indices of the samples in the (closed) interval from `start` to `stop`.
+
+    Args:
+        unix_time_stamps: The (sorted) Unix time stamps, in seconds, of the samples.
+        start: The earliest time of interest. If `None`, start with the first sample.
+        stop: The latest time of interest. If `None`, stop with the last sample.
+
+    Returns:
+        A tuple of the index of the first sample in the window and the index following the last sample.
+    """
+    start_index = (np.searchsorted(unix_time_stamps, math.ceil(start.timestamp()), side='left')
+                   if start is not None else 0)
+    stop_index = (np.searchsorted(unix_time_stamps, math.floor(stop.timestamp()), side='right')
+                  if stop is not None else len(unix_time_stamps))
+    return int(start_index), int(max(stop_index, start_index))
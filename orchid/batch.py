@@ -0,0 +1,184 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""Functions to analyze many projects in parallel using a pool of worker processes."""
+
+import dataclasses
+import multiprocessing
+import multiprocessing.connection
+import os
+import pathlib
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import deal
+
+import orchid_batch_worker
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectResult:
+    path: pathlib.Path
+    value: Any = None
+    """The value returned by the analysis function; `None` if the analysis failed or timed out."""
+    error: Optional[str] = None
+    """The formatted traceback (or other description) of the failure; `None` if the analysis succeeded."""
+    timed_out: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class _Worker:
+    def __init__(self, context, func: Callable, load: Optional[Callable]):
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=orchid_batch_worker.run_worker, args=(worker_connection, func, load),
+                                       daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.project_pathname: Optional[str] = None
+        self.started_at = 0.0
+
+    def assign(self, project_pathname: str) -> None:
+        self.project_pathname = project_pathname
+        self.started_at = time.monotonic()
+        self.connection.send(project_pathname)
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+@deal.pre(lambda paths, func, processes=None, timeout=None, load=None: processes is None or processes > 0)
+@deal.pre(lambda paths, func, processes=None, timeout=None, load=None: timeout is None or timeout > 0)
+def map_projects(paths: Iterable[Union[str, pathlib.Path]], func: Callable[[Any], Any],
+                 processes: Optional[int] = None, timeout: Optional[float] = None,
+                 load: Optional[Callable[[str], Any]] = None) -> Iterator[ProjectResult]:
+    """
+    Analyze many projects in parallel, one project at a time in each of a pool of worker processes.
+
+    If `load` is `None`, each worker process imports `orchid` (initializing .NET) once and keeps the
+    `ScriptAdapter` initialized (see `orchid.session()`) while it analyzes its projects. The main loop of the
+    workers is defined in the top-level module, `orchid_batch_worker`, so that a worker given some other `load`
+    function (and an analysis function that does not use `orchid`) never initializes .NET. The workers take the
+    next unanalyzed path as soon as they finish their current project. For each path, a worker loads the project
+    and calls `func` with the loaded project. The value returned by `func` is sent back to this process; it must,
+    therefore, be picklable.
+
+    Because the workers are started using the "spawn" method, `func` (and `load`) must be picklable; for example,
+    functions defined at the top level of a module. Scripts calling this function must also protect their entry
+    point with `if __name__ == '__main__':`.
+
+    Failures are reported per project. If loading or analyzing a project raises an exception, its result
+    contains the formatted traceback. If analyzing a project takes longer than `timeout` seconds, or if its
+    worker process dies (for example, because it exhausts its memory), this function terminates the worker,
+    reports the failure and starts a new worker for the remaining projects. (For the first project analyzed by
+    each worker, the timeout includes the time to start that worker and to import `orchid`.)
+
+    Example:
+
+    > def stage_count(project):
+    >     return sum(len(well.stages()) for well in project.wells().all_objects())
+    >
+    > for result in orchid.batch.map_projects(archive.rglob('*.ifrac'), stage_count, processes=8, timeout=600):
+    >     print(result.path, result.value if result.succeeded else result.error)
+
+    Args:
+        paths: The paths of the `.ifrac` files of the projects to analyze.
+        func: The analysis function called with each loaded project.
+        processes: The number of worker processes. If `None`, use the number of CPUs.
+        timeout: The maximum seconds to load and analyze a single project. If `None`, wait indefinitely.
+        load: The function to load a project from its (`str`) path; for example,
+        `orchid_ifrac_index.read_summary`. If `None`, use `orchid.load_project`.
+
+    Returns:
+        An iterator over the results of the analyses (one `ProjectResult` per path) in the order in which the
+        analyses finish.
+    """
+    pending = [str(path) for path in paths]
+    pending.reverse()  # pop from the end to analyze in the supplied order
+    if not pending:
+        return
+
+    context = multiprocessing.get_context('spawn')
+    worker_count = min(processes if processes is not None else (os.cpu_count() or 1), len(pending))
+    workers: List[_Worker] = [_Worker(context, func, load) for _ in range(worker_count)]
+    try:
+        for worker in workers:
+            if pending:
+                worker.assign(pending.pop())
+
+        while any(worker.project_pathname is not None for worker in workers):
+            busy: Dict[multiprocessing.connection.Connection, _Worker] = {
+                worker.connection: worker for worker in workers if worker.project_pathname is not None
+            }
+            ready = multiprocessing.connection.wait(list(busy), timeout=_wait_timeout(busy.values(), timeout))
+
+            for connection in ready:
+                worker = busy[connection]
+                try:
+                    project_pathname, value, error = connection.recv()
+                    result = ProjectResult(pathlib.Path(project_pathname), value, error)
+                except (EOFError, OSError):
+                    worker.process.join(timeout=1)
+                    result = ProjectResult(pathlib.Path(worker.project_pathname),
+                                           error=f'Worker process exited with code {worker.process.exitcode}.')
+                    worker = _replace(workers, worker, context, func, load)
+                worker.project_pathname = None
+                yield result
+                if pending:
+                    worker.assign(pending.pop())
+
+            if timeout is not None:
+                now = time.monotonic()
+                for worker in [w for w in workers if w.project_pathname is not None and w.connection not in ready]:
+                    if now - worker.started_at > timeout:
+                        timed_out_pathname = worker.project_pathname
+                        worker = _replace(workers, worker, context, func, load)
+                        yield ProjectResult(pathlib.Path(timed_out_pathname),
+                                            error=f'Analysis exceeded {timeout} seconds.', timed_out=True)
+                        if pending:
+                            worker.assign(pending.pop())
+    finally:
+        for worker in workers:
+            worker.stop()
+
+
+def _wait_timeout(busy_workers: Iterable[_Worker], timeout: Optional[float]) -> Optional[float]:
+    if timeout is None:
+        return None
+
+    now = time.monotonic()
+    return max(0.0, min(worker.started_at + timeout - now for worker in busy_workers))
+
+
+def _replace(workers: List[_Worker], worker: _Worker, context, func: Callable, load: Optional[Callable]) -> _Worker:
+    worker.kill()
+    result = _Worker(context, func, load)
+    workers[workers.index(worker)] = result
+    return result
@@ -0,0 +1,124 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""A memory-lean representation of the samples of a time series (curve)."""
+
+import dataclasses
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class CompactTimeSeries:
+    """
+    The samples of a time series stored as a start time and small offsets instead of full time stamps.
+
+    A regularly sampled series stores only its `start`, its sampling `interval` and its magnitudes (much like a
+    `pandas` `RangeIndex`). Any other series stores its `start` and the offsets (in seconds) of each sample from
+    `start`. These offsets are `int32` values unless the series spans more than about 68 years.
+
+    The time stamps of the samples are only calculated when requested (by `unix_time_stamps()`, `time_index()`
+    or `to_series()`).
+    """
+    name: str
+    start: int
+    """The Unix time stamp (in seconds) of the first sample."""
+    magnitudes: np.ndarray
+    interval: Optional[int] = None
+    """The seconds between consecutive samples of a regularly sampled series; otherwise, `None`."""
+    offsets: Optional[np.ndarray] = None
+    """The seconds from `start` of each sample of an irregularly sampled series; otherwise, `None`."""
+
+    @classmethod
+    def from_sample_arrays(cls, unix_time_stamps: np.ndarray, magnitudes: np.ndarray, name: str,
+                           dtype=np.float32) -> 'CompactTimeSeries':
+        """
+        Create a compact time series from the raw sample arrays of a curve.
+
+        Args:
+            unix_time_stamps: The (sorted) `int64` Unix time stamps (in seconds) of the samples.
+            magnitudes: The magnitudes of the samples.
+            name: The name of the time series.
+            dtype: The `numpy` type of the stored magnitudes.
+
+        Returns:
+            The compact time series.
+        """
+        stored_magnitudes = np.array(magnitudes, dtype=dtype)
+        if len(unix_time_stamps) == 0:
+            return cls(name, 0, stored_magnitudes, offsets=np.empty(0, dtype=np.int32))
+
+        start = int(unix_time_stamps[0])
+        intervals = np.diff(unix_time_stamps)
+        if len(intervals) > 0 and intervals[0] > 0 and np.all(intervals == intervals[0]):
+            return cls(name, start, stored_magnitudes, interval=int(intervals[0]))
+
+        offsets = np.asarray(unix_time_stamps, dtype=np.int64) - start
+        offsets_dtype = np.int32 if offsets[-1] <= _INT32_MAX else np.int64
+        return cls(name, start, stored_magnitudes, offsets=offsets.astype(offsets_dtype))
+
+    def __len__(self):
+        return len(self.magnitudes)
+
+    def __eq__(self, other):
+        # The generated `__eq__` compares the `numpy` arrays using `==` which produces an array (and not a `bool`)
+        if not isinstance(other, CompactTimeSeries):
+            return NotImplemented
+        return (self.name == other.name and self.start == other.start and self.interval == other.interval and
+                np.array_equal(self.magnitudes, other.magnitudes, equal_nan=True) and
+                (self.offsets is None) == (other.offsets is None) and
+                (self.offsets is None or np.array_equal(self.offsets, other.offsets)))
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes occupied by the sample arrays of this time series."""
+        return self.magnitudes.nbytes + (self.offsets.nbytes if self.offsets is not None else 0)
+
+    def unix_time_stamps(self) -> np.ndarray:
+        """
+        Calculate the Unix time stamps of the samples.
+
+        Returns:
+            The `int64` Unix time stamps (in seconds) of the samples.
+        """
+        if self.offsets is not None:
+            return self.offsets.astype(np.int64) + self.start
+
+        return np.arange(len(self), dtype=np.int64) * self.interval + self.start
+
+    def time_index(self) -> pd.DatetimeIndex:
+        """
+        Calculate the (UTC) times of the samples.
+
+        Returns:
+            The `pandas` `DatetimeIndex` of the sample times.
+        """
+        return pd.DatetimeIndex(self.unix_time_stamps().view('datetime64[s]'), tz='UTC')
+
+    def to_series(self) -> pd.Series:
+        """
+        Expand this compact time series into a `pandas` time `Series`.
+
+        Returns:
+            The `pandas` time `Series` with the (stored) magnitudes of the samples indexed by the sample times.
+        """
+        return pd.Series(data=self.magnitudes, index=self.time_index(), name=self.name)
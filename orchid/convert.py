@@ -12,8 +12,9 @@
 # and may not be used in any way not expressly authorized by the Company.
 #
 
-from typing import Union
+from typing import Tuple, Union
 
+import numpy as np
 import toolz.curried as toolz
 
 from orchid import (
@@ -42,3 +43,50 @@ def to_unit(target_unit: Union[units.UsOilfield, units.Metric], source_measureme
         target_unit: The units to which I convert `source_measurement`.
     """
     return source_measurement.to(target_unit.value.unit)
+
+
+def linear_conversion(source_unit: Union[units.UsOilfield, units.Metric],
+                      target_unit: Union[units.UsOilfield, units.Metric]) -> Tuple[float, float]:
+    """
+    Calculate the scale and offset converting magnitudes in `source_unit` to magnitudes in `target_unit`.
+
+    Every conversion between the units in `unit_system` is (at most) affine; that is, a target magnitude is
+    `scale * source_magnitude + offset`. The offset is non-zero only for units with different zero points; for
+    example, conversions between degrees Fahrenheit and degrees Celsius. This function calculates the scale and
+    the offset by converting exactly two measurements.
+
+    Args:
+        source_unit: The unit of the magnitudes to convert.
+        target_unit: The unit to which the magnitudes are converted.
+
+    Returns:
+        A tuple of the scale and the offset of the conversion.
+    """
+    offset = units.make_measurement(source_unit, 0.0).to(target_unit.value.unit).magnitude
+    scale = units.make_measurement(source_unit, 1.0).to(target_unit.value.unit).magnitude - offset
+    return scale, offset
+
+
+@toolz.curry
+def magnitudes_to_unit(target_unit: Union[units.UsOilfield, units.Metric],
+                       source_unit: Union[units.UsOilfield, units.Metric],
+                       source_magnitudes: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of magnitudes in `source_unit` to an array of magnitudes in `target_unit`.
+
+    Unlike `to_unit`, this function creates no `Measurement` instance for each magnitude. It calculates the
+    conversion once (see `linear_conversion`) and applies it to the whole array.
+
+    Args:
+        target_unit: The unit to which `source_magnitudes` are converted.
+        source_unit: The unit of `source_magnitudes`.
+        source_magnitudes: The magnitudes to convert.
+
+    Returns:
+        A new array of the converted magnitudes.
+    """
+    scale, offset = linear_conversion(source_unit, target_unit)
+    result = np.asarray(source_magnitudes, dtype=np.float64) * scale
+    if offset != 0.0:
+        result += offset
+    return result
@@ -18,11 +18,18 @@
 #
 
 
-from typing import Optional
+import concurrent.futures
+import enum
+import threading
+from typing import Callable, Optional
 
 import deal
 import option
 
+from orchid import (
+    project_cache as pc,
+    script_adapter_context as sac,
+)
 from orchid.project import Project
 from orchid.project_store import ProjectStore
 
@@ -39,6 +46,15 @@ def load_project(ifrac_pathname: str) -> Project:
     """
     Return the project for the specified `.ifrac` file.
 
+    If a project cache is enabled (see `orchid.enable_project_cache()`), this function returns the cached project
+    loaded from the same (unchanged) `.ifrac` file, if any, instead of loading that file again.
+
+    The Orchid SDK reads the **entire** `.ifrac` file; it offers no means to read only part of a project. However,
+    this function converts no bulk data to Python. The samples of a curve are only converted when requested (for
+    example, by `data_points()`, by `sample_arrays()` or by operations on a `view()`). Workloads that only need
+    summary metadata (project name, well names and stage counts) can avoid .NET entirely by using the
+    top-level module, `orchid_ifrac_index`.
+
     Args:
         ifrac_pathname: The path identifying the data file of the project of interest.
 
@@ -51,11 +67,95 @@ def load_project(ifrac_pathname: str) -> Project:
         >>> loaded_project.name
         'frankNstein_Bakken_UTM13_FEET'
     """
-    loader = ProjectStore(ifrac_pathname.strip())
+    maybe_cache = pc.process_project_cache()
+    if maybe_cache is not None:
+        return maybe_cache.get_or_load(ifrac_pathname.strip(), _load_project)
+
+    return _load_project(ifrac_pathname.strip())
+
+
+def _load_project(ifrac_pathname: str) -> Project:
+    loader = ProjectStore(ifrac_pathname)
     result = Project(loader)
     return result
 
 
+class LoadProgress(enum.Enum):
+    QUEUED = 'queued'
+    LOADING = 'loading'
+    LOADED = 'loaded'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+
+_project_loading_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_project_loading_executor_lock = threading.Lock()
+
+
+def _loading_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _project_loading_executor
+    with _project_loading_executor_lock:
+        if _project_loading_executor is None:
+            _project_loading_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='orchid-project-loader')
+        return _project_loading_executor
+
+
+@deal.pre(lambda ifrac_pathname, progress_callback=None: ifrac_pathname is not None)
+@deal.pre(lambda ifrac_pathname, progress_callback=None: len(ifrac_pathname.strip()) != 0)
+def load_project_async(ifrac_pathname: str,
+                       progress_callback: Optional[Callable[[str, LoadProgress], None]] = None
+                       ) -> concurrent.futures.Future:
+    """
+    Start loading the project for the specified `.ifrac` file without waiting for the load to finish.
+
+    A single, dedicated worker thread loads the requested projects in order. The worker does not hold a
+    `ScriptAdapter` session between loads; instead, each load enters its own session (see
+    `script_adapter_context.session()`) for the duration of that load. The calling thread is free to continue
+    its work while the project loads.
+
+    To cancel a request, call `cancel()` on the returned future. Requests waiting for the worker thread are
+    cancelled immediately. A request whose load has already started cannot be cancelled because the .NET read
+    of the project file cannot be interrupted.
+
+    To await the project in `asyncio` code, wrap the returned future: `await asyncio.wrap_future(future)`.
+
+    Args:
+        ifrac_pathname: The path identifying the data file of the project of interest.
+        progress_callback: An optional callable invoked with `ifrac_pathname` and a `LoadProgress` member when the
+        request is queued, when its load starts and when it finishes (is loaded, fails or is cancelled). It is
+        invoked on the worker thread except when the request is queued or cancelled before its load starts.
+        These coarse state transitions are the only progress reported; because the Orchid SDK reads the project
+        file in a single call, no progress is reported during a load.
+
+    Returns:
+        A `concurrent.futures.Future` whose result is the loaded project.
+    """
+    pathname = ifrac_pathname.strip()
+
+    def notify(progress: LoadProgress):
+        if progress_callback is not None:
+            progress_callback(pathname, progress)
+
+    def load():
+        notify(LoadProgress.LOADING)
+        with sac.session():
+            return load_project(pathname)
+
+    def notify_done(future: concurrent.futures.Future):
+        if future.cancelled():
+            notify(LoadProgress.CANCELLED)
+        elif future.exception() is not None:
+            notify(LoadProgress.FAILED)
+        else:
+            notify(LoadProgress.LOADED)
+
+    notify(LoadProgress.QUEUED)
+    result = _loading_executor().submit(load)
+    result.add_done_callback(notify_done)
+    return result
+
+
 # TODO: change `ifrac_pathname` to be `str` or `pathlib.Path`
 @deal.pre(lambda project, _: project is not None)
 @deal.pre(lambda _, ifrac_pathname: ifrac_pathname is not None)
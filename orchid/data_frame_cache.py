@@ -0,0 +1,137 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""A bounded, least-recently-used cache of converted `pandas` data frames."""
+
+import collections
+import threading
+from typing import Callable, Hashable
+
+import deal
+import pandas as pd
+
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+"""The default memory budget (in bytes) of a `DataFrameCache`."""
+
+
+def _copy_for_caller(data_frame: pd.DataFrame) -> pd.DataFrame:
+    # If `pandas` copy-on-write is enabled, a shallow copy is sufficient to protect the cached instance; otherwise,
+    # only a deep copy protects the cached instance from changes by the caller.
+    return data_frame.copy(deep=not pd.get_option('mode.copy_on_write'))
+
+
+def _memory_usage(data_frame: pd.DataFrame) -> int:
+    return int(data_frame.memory_usage(index=True, deep=True).sum())
+
+
+class DataFrameCache:
+    """
+    Caches converted `pandas` `DataFrame` instances up to a memory budget.
+
+    When adding a data frame would exceed the memory budget, the cache evicts the least recently used data frames.
+    A data frame larger than the entire budget is never cached. Callers always receive a copy of the cached data
+    frame so that they cannot corrupt the cached instance.
+
+    All methods of this class are thread-safe.
+    """
+
+    @deal.pre(lambda _self, max_bytes=DEFAULT_MAX_BYTES: max_bytes > 0)
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Construct an empty cache.
+
+        Args:
+            max_bytes: The memory budget of this cache in bytes.
+        """
+        self._max_bytes = max_bytes
+        self._current_bytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        """The memory (in bytes) currently used by all the cached data frames."""
+        with self._lock:
+            return self._current_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """The memory budget (in bytes) of this cache."""
+        return self._max_bytes
+
+    def clear(self) -> None:
+        """Remove all data frames from this cache."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def evict(self, key: Hashable) -> None:
+        """
+        Remove the data frame identified by `key` (if any) from this cache.
+
+        Args:
+            key: Identifies the data frame to remove.
+        """
+        with self._lock:
+            if key in self._entries:
+                _, size = self._entries.pop(key)
+                self._current_bytes -= size
+
+    def get_or_convert(self, key: Hashable, convert: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return a copy of the data frame identified by `key`, invoking `convert` if that data frame is not cached.
+
+        Args:
+            key: Identifies the data frame of interest.
+            convert: A callable of no arguments that returns the data frame if it is not cached.
+
+        Returns:
+            A copy of the cached (or newly converted) data frame.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                cached, _ = self._entries[key]
+                return _copy_for_caller(cached)
+
+        # Convert outside the lock so that (possibly lengthy) conversions of different data frames do not wait on
+        # one another.
+        converted = convert()
+        self._add(key, converted)
+        return _copy_for_caller(converted)
+
+    def _add(self, key: Hashable, data_frame: pd.DataFrame) -> None:
+        size = _memory_usage(data_frame)
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            self.evict(key)
+            while self._entries and self._current_bytes + size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+            self._entries[key] = (data_frame, size)
+            self._current_bytes += size
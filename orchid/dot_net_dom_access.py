@@ -27,7 +27,9 @@ from orchid import (
 )
 
 # noinspection PyUnresolvedReferences
-from System import Guid
+from System import Guid, Object
+# noinspection PyUnresolvedReferences
+from System.Runtime.CompilerServices import RuntimeHelpers
 
 # These methods in this module are based on the StackOverflow post:
 # https://stackoverflow.com/questions/36580931/python-property-factory-or-descriptor-class-for-wrapping-an-external-library
@@ -147,6 +149,40 @@ def as_object_id(guid: Guid):
     return uuid.UUID(str(guid))
 
 
+class NetObjectIdentity:
+    """
+    Identifies a .NET object by reference so that the object can be used as a key of a Python `dict`.
+
+    Unlike the .NET object itself, whose Python hash and equality use the .NET `GetHashCode` and `Equals` methods,
+    two instances of this class are equal only if they refer to the **same** .NET object. For example, two
+    projects loaded from copies of one `.ifrac` file have the same object ID but different identities.
+    """
+
+    def __init__(self, net_object):
+        self._net_object = net_object
+
+    def __eq__(self, other):
+        if not isinstance(other, NetObjectIdentity):
+            return False
+
+        if self._net_object is other._net_object:
+            return True
+
+        # Python.NET may wrap a single .NET object in many different Python objects
+        return (self._is_net_object() and other._is_net_object() and
+                Object.ReferenceEquals(self._net_object, other._net_object))
+
+    def __hash__(self):
+        if self._is_net_object():
+            return RuntimeHelpers.GetHashCode(self._net_object)
+
+        # For example, the stub (Python) objects used in tests
+        return id(self._net_object)
+
+    def _is_net_object(self):
+        return isinstance(type(self._net_object), type(Object))
+
+
 class DotNetAdapter:
     @deal.pre(lambda _self, adaptee, _net_project_callable=None: adaptee is not None)
     def __init__(self, adaptee):
@@ -12,33 +12,37 @@
 # and may not be used in any way not expressly authorized by the Company.
 #
 
+import concurrent.futures
 import dataclasses
+import multiprocessing
+import pathlib
 import uuid
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import deal
 import functools
+import numpy as np
 import option
 import pandas as pd
 import toolz.curried as toolz
 
+import orchid_data_frame_assembly as dfas
+# Re-exported so that callers of `net_guids_to_bytes()` find its inverse in this module.
+from orchid_data_frame_assembly import guid_bytes_to_uuids
+
 from orchid import (
     base,
+    data_frame_cache as dfc,
     dot_net_dom_access as dna,
     dot_net_disposable as dnd,
+    net_array,
     net_date_time as net_dt,
 )
 
 # noinspection PyUnresolvedReferences
-from System import DateTime, DateTimeOffset, DBNull, Guid, TimeSpan
+from System import Array, DateTime, DateTimeOffset, DBNull, Guid, Object, String, TimeSpan
 # noinspection PyUnresolvedReferences
-from System.Data import DataTable
-
-
-@dataclasses.dataclass
-class CellDto:
-    row: int
-    column: str
-    value: object
+from System.Data import DataTable, DataView
 
 
 @dataclasses.dataclass
@@ -50,10 +54,27 @@ class DateTimeOffsetSentinelRange:
         return self.lower <= to_test <= self.upper
 
 
+DEFAULT_CHUNK_ROWS = 10000
+"""The default maximum number of rows of each chunk of `NativeDataFrameAdapterIdentified.iter_pandas_chunks`."""
+
+
 _MAX_SENTINEL_RANGE = DateTimeOffsetSentinelRange(DateTimeOffset.MaxValue.Subtract(TimeSpan(9999999)),
                                                   DateTimeOffset.MaxValue)
 """The range used to determine equality to the .NET `DateTimeOffset.MaxValue` sentinel."""
 
+# Constants supporting the conversion of .NET ticks (100 ns intervals since 0001-01-01T00:00:00) to `numpy` values.
+_MIN_DATE_TIME_OFFSET_TICKS = DateTimeOffset.MinValue.UtcTicks
+_MAX_SENTINEL_RANGE_LOWER_TICKS = _MAX_SENTINEL_RANGE.lower.UtcTicks
+_MIN_NANOSECOND_TICKS = dfas.UNIX_EPOCH_TICKS + (np.iinfo(np.int64).min + 1) // dfas.NANOSECONDS_PER_TICK + 1
+_MAX_NANOSECOND_TICKS = dfas.UNIX_EPOCH_TICKS + np.iinfo(np.int64).max // dfas.NANOSECONDS_PER_TICK
+_MIN_NANOSECOND_TIME_SPAN_TICKS = (np.iinfo(np.int64).min + 1) // dfas.NANOSECONDS_PER_TICK + 1
+_TOO_LARGE_TIME_SPAN_TICKS = 36525 * TimeSpan.TicksPerDay  # ~ 100 years
+
+_GUID_SIZE = 16
+# `Guid.ToByteArray()` stores the first three fields of a GUID in little-endian byte order; this permutation
+# produces the (big-endian) RFC 4122 byte order of `uuid.UUID.bytes`.
+_NET_GUID_TO_RFC_4122_BYTE_ORDER = np.array([3, 2, 1, 0, 5, 4, 7, 6, 8, 9, 10, 11, 12, 13, 14, 15])
+
 
 class DataFrameAdapterDateTimeError(TypeError):
     pass
@@ -72,8 +93,17 @@ def transform_display_name(net_display_name):
 
 
 class NativeDataFrameAdapterIdentified(dna.IdentifiedDotNetAdapter):
-    def __init__(self, net_data_frame):
+    def __init__(self, net_data_frame, conversion_cache: Optional[dfc.DataFrameCache] = None):
+        """
+        Construct an instance adapting a .NET `IStaticDataFrame`.
+
+        Args:
+            net_data_frame: The .NET data frame to be adapted.
+            conversion_cache: An optional cache of previously converted `pandas` data frames. If supplied,
+            `pandas_data_frame()` returns a copy of the cached conversion if the .NET data frame is unchanged.
+        """
         super().__init__(net_data_frame, base.constantly(net_data_frame.Project))
+        self._conversion_cache = conversion_cache
 
     name = dna.dom_property('name', 'The name of this data frame.')
     display_name = dna.transformed_dom_property('display_name', 'The display name of this data frame.',
@@ -83,14 +113,214 @@ class NativeDataFrameAdapterIdentified(dna.IdentifiedDotNetAdapter):
     def is_potentially_corrupt(self):
         return self.name.endswith(' (Potentially Corrupted)')
 
-    def pandas_data_frame(self) -> pd.DataFrame:
+    def pandas_data_frame(self, columns: Optional[Sequence[str]] = None,
+                          row_filter: Optional[str] = None, compact: bool = False) -> pd.DataFrame:
         """
         Return the `pandas` `DataFrame` built from the native `IStaticDataFrame`.
 
+        Both the column selection and the row filter are performed by .NET **before** any conversion; that is,
+        unselected columns and filtered rows never cross the boundary between .NET and Python.
+
+        Args:
+            columns: The names of the columns to convert (in the order of the resulting columns). If `None`,
+            convert all the columns of the native data frame.
+            row_filter: An optional .NET `DataView.RowFilter` expression, for example,
+            "[Stage Number] > 7 AND [Well Name] = 'Demo_1H'". If `None`, convert all the rows of the native
+            data frame. See the
+            [.NET documentation](https://learn.microsoft.com/en-us/dotnet/api/system.data.datacolumn.expression)
+            for the syntax of these expressions.
+            compact: If `True`, reduce the memory used by the resulting `DataFrame`. Low-cardinality string
+            and GUID columns have the `category` dtype (whose categories are `str` or `uuid.UUID` instances),
+            and numeric columns are downcast to the smallest dtype that exactly represents their values. (A
+            null cell of a categorical column is missing, `NaN`.)
+
         Returns:
             A `pandas` `DataFrame`.
+
+        Raises:
+            KeyError if any name in `columns` does not identify a column of the native data frame.
+        """
+        def convert():
+            return _table_to_data_frame(_select_from_table(self.dom_object.DataTable, columns, row_filter),
+                                        compact=compact)
+
+        return self._get_or_convert(convert, columns, row_filter, compact)
+
+    @deal.pre(lambda _self, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None, row_filter=None: chunk_rows > 0)
+    def iter_pandas_chunks(self, chunk_rows: int = DEFAULT_CHUNK_ROWS, columns: Optional[Sequence[str]] = None,
+                           row_filter: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the native `IStaticDataFrame` as a sequence of `pandas` `DataFrame` instances.
+
+        Unlike `pandas_data_frame()`, this method only converts `chunk_rows` rows at a time; consequently, a
+        caller can process (write, aggregate) an arbitrarily large data frame in (approximately) constant memory.
+
+        The dtype of each column is identical in every chunk. It depends only on the .NET type of the column (and
+        not on the values in any one chunk). For example, integral columns have the nullable `Int64` dtype and
+        boolean columns have the nullable `boolean` dtype. (The one exception: a date-time or time span column in a
+        chunk containing a value outside the range of the `pandas` nanosecond dtypes has the `object` dtype.) The
+        index of each chunk continues the index of the previous chunk.
+
+        Args:
+            chunk_rows: The maximum number of rows in each yielded `DataFrame`.
+            columns: The names of the columns to convert. See `pandas_data_frame()`.
+            row_filter: An optional .NET `DataView.RowFilter` expression. See `pandas_data_frame()`.
+
+        Returns:
+            Yields consecutive `pandas` `DataFrame` instances.
         """
-        return _table_to_data_frame(self.dom_object.DataTable)
+        return _iter_table_chunks(_select_from_table(self.dom_object.DataTable, columns, row_filter), chunk_rows)
+
+    def to_arrow(self, columns: Optional[Sequence[str]] = None, row_filter: Optional[str] = None):
+        """
+        Return the Apache Arrow `Table` built from the native `IStaticDataFrame`.
+
+        This method builds each Arrow array directly from the converted .NET column without first creating a
+        `pandas` `DataFrame`. The metadata of the resulting table includes the object ID, the name and the display
+        name of this data frame.
+
+        This method requires the optional `pyarrow` package.
+
+        Args:
+            columns: The names of the columns to convert. See `pandas_data_frame()`.
+            row_filter: An optional .NET `DataView.RowFilter` expression. See `pandas_data_frame()`.
+
+        Returns:
+            A `pyarrow.Table`.
+        """
+        metadata = {
+            'orchid.object_id': str(self.object_id),
+            'orchid.name': self.name,
+            'orchid.display_name': option.maybe(self.dom_object.DisplayName).unwrap_or(''),
+        }
+        return _table_to_arrow(_select_from_table(self.dom_object.DataTable, columns, row_filter), metadata)
+
+    def guid_bytes_column(self, name: str, row_filter: Optional[str] = None) -> np.ndarray:
+        """
+        Return the values of a single GUID column of the native `IStaticDataFrame` as 16-byte values.
+
+        Unlike `pandas_data_frame()`, this method creates no `uuid.UUID` instances. Each 16-byte value has the
+        byte order of `uuid.UUID.bytes`; consequently, one can join the rows of this data frame to project objects
+        (for example, stages) by their object IDs using `numpy` alone. For example,
+
+            is_stage_row = np.isin(data_frame.guid_bytes_column('Stage ID'),
+                                   native_data_frame_adapter.uuids_to_guid_bytes([stage.object_id]))
+
+        A caller needing `uuid.UUID` instances can convert the result (or a subset of the result) using
+        `guid_bytes_to_uuids()`.
+
+        Args:
+            name: The name of the GUID column.
+            row_filter: An optional .NET `DataView.RowFilter` expression. See `pandas_data_frame()`.
+
+        Returns:
+            The `numpy` array of `V16` values in row order. A null cell becomes 16 zero bytes (the nil UUID).
+
+        Raises:
+            KeyError if `name` does not identify a column of the native data frame.
+            TypeError if the column, `name`, is not a GUID column.
+        """
+        data_table = _select_from_table(self.dom_object.DataTable, [name], row_filter)
+        net_column = _net_columns(data_table)[0]
+        if net_column.type_name != 'System.Guid':
+            raise TypeError(f'Column, "{name}", of type, {net_column.type_name}, is not a GUID column.')
+
+        return net_guids_to_bytes([row[0] for row in _read_data_table(data_table)])
+
+    def _get_or_convert(self, convert: Callable[[], pd.DataFrame], columns: Optional[Sequence[str]] = None,
+                        row_filter: Optional[str] = None, compact: bool = False) -> pd.DataFrame:
+        if self._conversion_cache is None:
+            return convert()
+
+        return self._conversion_cache.get_or_convert(self._conversion_cache_key(columns, row_filter, compact),
+                                                     convert)
+
+    def _is_conversion_cached(self) -> bool:
+        return (self._conversion_cache is not None and
+                self._conversion_cache_key(None, None) in self._conversion_cache)
+
+    def _conversion_cache_key(self, columns: Optional[Sequence[str]], row_filter: Optional[str],
+                              compact: bool = False) -> tuple:
+        """
+        Calculate the key identifying a conversion of this data frame in a `dfc.DataFrameCache`.
+
+        Because data frames with duplicate object IDs are a known issue, the key includes the name of this data
+        frame in addition to its object ID. The key also includes a "change token" calculated from the .NET
+        `DataTable` (its row count and the names and types of its columns) so that changes to the .NET data frame
+        invalidate any previously cached conversion.
+
+        Args:
+            columns: The names of the converted columns (if any).
+            row_filter: The .NET `DataView.RowFilter` expression (if any).
+            compact: `True` if the conversion is compact.
+
+        Returns:
+            The (hashable) key identifying the conversion.
+        """
+        data_table = self.dom_object.DataTable
+        change_token = (data_table.Rows.Count,
+                        tuple((net_column.name, net_column.type_name) for net_column in _net_columns(data_table)))
+        return (self.object_id, self.name, change_token,
+                tuple(columns) if columns is not None else None, row_filter, compact)
+
+
+def all_pandas_data_frames(data_frames: Iterable[NativeDataFrameAdapterIdentified],
+                           max_workers: Optional[int] = None) -> Dict[uuid.UUID, pd.DataFrame]:
+    """
+    Convert many native data frames to `pandas` `DataFrame` instances using a pool of worker processes.
+
+    This function reads the cells of each .NET `DataTable` in this process (the process hosting .NET), copying each
+    column into a picklable buffer (typically, a `numpy` array of raw values such as .NET ticks or GUID bytes). The
+    worker processes type those buffers and assemble each `DataFrame` while this process reads the next table.
+    The functions called by the workers are defined in the top-level module, `orchid_data_frame_assembly`;
+    consequently, the workers never initialize .NET.
+
+    A data frame whose conversion is already cached (see `orchid.project.Project.data_frame_cache`) is not read
+    again; the conversion of any other data frame is added to the cache (if any).
+
+    Because the workers are started using the "spawn" method, scripts calling this function must protect their
+    entry point with `if __name__ == '__main__':`.
+
+    Args:
+        data_frames: The native data frames to convert.
+        max_workers: The maximum number of worker processes. If `None`, use the default of
+        `concurrent.futures.ProcessPoolExecutor`.
+
+    Returns:
+        A dictionary mapping the object ID of each data frame to its `pandas` `DataFrame`.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                mp_context=multiprocessing.get_context('spawn')) as executor:
+        conversions = [(data_frame,
+                        None if data_frame._is_conversion_cached()
+                        else executor.submit(dfas.assemble_data_frame,
+                                             *_read_table_buffers(data_frame.dom_object.DataTable)))
+                       for data_frame in data_frames]
+        # If a cached conversion is evicted before its data frame is reached, `pandas_data_frame()` converts that
+        # data frame (again) in this process.
+        return {data_frame.object_id: (data_frame._get_or_convert(assembled.result) if assembled is not None
+                                       else data_frame.pandas_data_frame())
+                for data_frame, assembled in conversions}
+
+
+def _read_table_buffers(data_table: DataTable) -> Tuple[List[str], List[dfas.ColumnBuffer]]:
+    """
+    Read all the cells of a .NET `DataTable` into a (picklable) buffer for each column.
+
+    Args:
+        data_table: The .NET `DataTable` to read.
+
+    Returns:
+        A tuple containing the name of each column and the buffer of each column. (Both lists are empty if
+        `data_table` has no rows.)
+    """
+    if data_table.Rows.Count == 0:
+        return [], []
+
+    net_columns = _net_columns(data_table)
+    column_cells = list(zip(*_read_data_table(data_table)))
+    return ([net_column.name for net_column in net_columns],
+            [_read_net_column(net_column, cells) for net_column, cells in zip(net_columns, column_cells)])
 
 
 @functools.singledispatch
@@ -159,44 +389,324 @@ def _(cell_value):
     return net_dt.as_duration(cell_value)
 
 
-def _table_to_data_frame(data_table: DataTable):
+@dataclasses.dataclass(frozen=True)
+class NetColumnDto:
+    no: int
+    name: str
+    type_name: str
+
+
+def _table_to_data_frame(data_table: DataTable, compact: bool = False):
     """
     Converts a .NET `DataTable` to a `pandas` `DataFrame`.
 
+    This function converts the table column by column. It reads all the cells of the table once, resolves the
+    reader for each column from the `DataType` of that column once, copies all the cells of that column into a
+    buffer, and then types that buffer as a single array (see `orchid_data_frame_assembly`).
+
     Args:
         data_table: The .NET `DataTable` to convert.
+        compact: If `True`, compact the converted `DataFrame` (see `_compact_data_frame`).
 
     Returns:
         The `pandas` `DataFrame` converted from the .NET `DataTable`.
     """
-    result = toolz.pipe(data_table,
-                        _read_data_table,
-                        toolz.map(toolz.keymap(lambda e: e[1])),
-                        list,
-                        lambda rs: pd.DataFrame(data=rs),
-                        )
+    result = dfas.assemble_data_frame(*_read_table_buffers(data_table))
+    if compact and not result.empty:
+        result = _compact_data_frame(_net_columns(data_table), result)
+    return result
+
+
+def _select_from_table(data_table: DataTable, columns: Optional[Sequence[str]],
+                       row_filter: Optional[str]) -> DataTable:
+    """
+    Select the columns and filter the rows of a .NET `DataTable` using .NET.
+
+    Args:
+        data_table: The .NET `DataTable` of interest.
+        columns: The names of the selected columns. If `None`, select all columns.
+        row_filter: A .NET `DataView.RowFilter` expression. If `None`, select all rows.
+
+    Returns:
+        `data_table` itself if neither `columns` nor `row_filter` is supplied; otherwise, a new .NET `DataTable`
+        containing only the selected columns and rows.
+    """
+    if columns is None and row_filter is None:
+        return data_table
+
+    column_names = (list(columns) if columns is not None
+                    else [column.ColumnName for column in data_table.Columns])
+    unknown_column_names = [name for name in column_names if not data_table.Columns.Contains(name)]
+    if unknown_column_names:
+        raise KeyError(f'Unknown column(s), {unknown_column_names}, of Orchid `DataFrame`.')
+
+    with dnd.disposable(DataView(data_table)) as view:
+        if row_filter is not None:
+            view.RowFilter = row_filter
+        result = view.ToTable(False, Array[String](column_names))
+    return result
+
+
+def _iter_table_chunks(data_table: DataTable, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Converts a .NET `DataTable` to a sequence of `pandas` `DataFrame` instances each with at most `chunk_rows` rows.
+
+    Each chunk is converted column by column (like `_table_to_data_frame`); however, the dtype of each chunk
+    column depends **only** on the .NET `DataType` of that column (and not on the values in that chunk). For
+    example, integral columns always have the nullable `Int64` dtype. The index of each chunk continues the
+    index of the previous chunk so that concatenating all chunks produces a single consistently indexed
+    `DataFrame`.
+
+    Args:
+        data_table: The .NET `DataTable` to convert.
+        chunk_rows: The maximum number of rows in each chunk.
+
+    Returns:
+        Yields each converted chunk.
+    """
+    net_columns = _net_columns(data_table)
+    first_row_no = 0
+    for chunk in toolz.partition_all(chunk_rows, _read_data_table(data_table)):
+        yield _rows_to_data_frame(net_columns, chunk, first_row_no=first_row_no, stable_dtypes=True)
+        first_row_no += len(chunk)
+
+
+def _rows_to_data_frame(net_columns: Sequence[NetColumnDto], rows: Sequence[tuple],
+                        first_row_no: int = 0, stable_dtypes: bool = False) -> pd.DataFrame:
+    """
+    Convert a sequence of rows read from a .NET `DataTable` into a `pandas` `DataFrame`.
+
+    Args:
+        net_columns: Describes the columns of each row.
+        rows: The rows of .NET cell values to convert.
+        first_row_no: The row number in the .NET `DataTable` of the first item in `rows`.
+        stable_dtypes: If `True`, convert each column to a dtype determined only by the .NET column type.
+
+    Returns:
+        The `pandas` `DataFrame` whose index starts at `first_row_no`.
+    """
+    column_cells = list(zip(*rows))
+    index = pd.RangeIndex(first_row_no, first_row_no + len(rows))
+
+    def convert_column(net_column, cells):
+        result = _net_column_to_array(net_column, cells, first_row_no)
+        if isinstance(result, list):
+            # The column was converted cell by cell (for example, because a value is outside the range of the
+            # stable dtype); casting it to the stable dtype would fail, so keep the `object` dtype instead.
+            return pd.array(result, dtype=object) if stable_dtypes else result
+        stable_dtype = _STABLE_DTYPES.get(net_column.type_name) if stable_dtypes else None
+        return pd.array(result, dtype=stable_dtype) if stable_dtype is not None else result
+
+    result = pd.DataFrame(data={net_column.name: convert_column(net_column, cells)
+                                for net_column, cells in zip(net_columns, column_cells)},
+                          columns=[net_column.name for net_column in net_columns],
+                          index=index)
     return result
 
 
-def _read_data_table(data_table: DataTable) -> Iterable[dict]:
+_CATEGORY_MAX_UNIQUE_RATIO = 0.5
+"""The maximum ratio of distinct values to rows of a string or GUID column converted to the `category` dtype."""
+
+
+def _compact_data_frame(net_columns: Sequence[NetColumnDto], data_frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce the memory used by a `pandas` `DataFrame` converted from a .NET `DataTable`.
+
+    Args:
+        net_columns: Describes the columns of the .NET `DataTable`.
+        data_frame: The `DataFrame` converted from the .NET `DataTable`.
+
+    Returns:
+        A `DataFrame` with the same columns and index as `data_frame` but with compact column dtypes.
+    """
+    result = pd.DataFrame(data={net_column.name: _compact_column(net_column, data_frame[net_column.name])
+                                for net_column in net_columns},
+                          columns=data_frame.columns,
+                          index=data_frame.index)
+    return result
+
+
+def _compact_column(net_column: NetColumnDto, column: pd.Series) -> pd.Series:
+    """
+    Convert a single column to a compact dtype (if any) that loses no information.
+
+    Args:
+        net_column: Describes the .NET column from which `column` was converted.
+        column: The converted column.
+
+    Returns:
+        The compacted column; `column` itself if no compact dtype applies.
+    """
+    # `pandas` supports neither the `V16` dtype nor a nullable GUID dtype; consequently, GUID columns, like
+    # string columns, are compacted only by sharing the distinct (`uuid.UUID`) values as categories.
+    if net_column.type_name in ('System.String', 'System.Guid') and column.dtype == object:
+        if column.nunique() <= _CATEGORY_MAX_UNIQUE_RATIO * len(column):
+            return column.astype('category')
+        return column
+
+    if pd.api.types.is_integer_dtype(column.dtype):
+        return pd.to_numeric(column, downcast='integer')
+
+    if column.dtype == np.float64:
+        downcast = column.astype(np.float32)
+        if np.array_equal(downcast.to_numpy(dtype=np.float64), column.to_numpy(), equal_nan=True):
+            return downcast
+
+    return column
+
+
+ARROW_FILE_SUFFIXES = {'arrow': '.arrow', 'parquet': '.parquet'}
+"""Maps each supported Arrow export format to the suffix of the exported file."""
+
+
+@deal.pre(lambda table, path, file_format: file_format in ARROW_FILE_SUFFIXES)
+def write_arrow_table(table, path: pathlib.Path, file_format: str) -> None:
+    """
+    Write an Apache Arrow `Table` to `path` in the specified format.
+
+    Args:
+        table: The `pyarrow.Table` to write.
+        path: The path of the file to write.
+        file_format: Either 'parquet' for an Apache Parquet file or 'arrow' for an (uncompressed and, therefore,
+        memory-mappable) Arrow IPC (Feather V2) file.
+    """
+    _import_pyarrow()
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, str(path))
+    else:
+        import pyarrow.feather as pf
+        pf.write_feather(table, str(path), compression='uncompressed')
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError as ie:
+        raise ImportError('Exporting Orchid data frames to Apache Arrow requires the `pyarrow` package.') from ie
+
+
+def _table_to_arrow(data_table: DataTable, metadata: Dict[str, str]):
     """
-    Read each row of the .NET `DataTable` into an `Iterable` of  `dicts`.
+    Converts a .NET `DataTable` to an Apache Arrow `Table` column by column.
+
+    Args:
+        data_table: The .NET `DataTable` to convert.
+        metadata: The metadata of the resulting table.
+
+    Returns:
+        The `pyarrow.Table` converted from the .NET `DataTable`.
+    """
+    pa = _import_pyarrow()
+    net_columns = _net_columns(data_table)
+    rows = list(_read_data_table(data_table))
+    column_cells = list(zip(*rows)) if rows else [()] * len(net_columns)
+    arrays = [_column_to_arrow_array(pa, net_column, cells) for net_column, cells in zip(net_columns, column_cells)]
+    return pa.Table.from_arrays(arrays, names=[net_column.name for net_column in net_columns], metadata=metadata)
+
+
+def _arrow_type(pa, net_type_name: str):
+    arrow_type_factories = {
+        'System.Boolean': pa.bool_,
+        'System.Byte': pa.uint8,
+        'System.DateTimeOffset': lambda: pa.timestamp('ns', tz='UTC'),
+        'System.Double': pa.float64,
+        'System.Guid': lambda: pa.binary(16),
+        'System.Int16': pa.int16,
+        'System.Int32': pa.int32,
+        'System.Int64': pa.int64,
+        'System.SByte': pa.int8,
+        'System.Single': pa.float32,
+        'System.String': pa.string,
+        'System.TimeSpan': lambda: pa.duration('ns'),
+        'System.UInt16': pa.uint16,
+        'System.UInt32': pa.uint32,
+    }
+    return toolz.get(net_type_name, arrow_type_factories, lambda: None)()
+
+
+def _column_to_arrow_array(pa, net_column: NetColumnDto, cells: Sequence):
+    """
+    Convert the .NET cell values of a single column to an Arrow array.
+
+    Args:
+        pa: The `pyarrow` module.
+        net_column: Describes the .NET column.
+        cells: The .NET cell values of the column in row order.
+
+    Returns:
+        The equivalent Arrow array.
+    """
+    column_buffer = _read_net_column(net_column, cells)
+    if column_buffer.typer is dfas.guid_array:
+        # Build the array directly from the 16-byte values; that is, without creating any `uuid.UUID` instances.
+        return pa.array(column_buffer.values.view(f'S{_GUID_SIZE}'),
+                        type=_arrow_type(pa, net_column.type_name), mask=column_buffer.is_missing)
+
+    return _to_arrow_array(pa, net_column, column_buffer.to_array())
+
+
+def _to_arrow_array(pa, net_column: NetColumnDto, converted):
+    """
+    Convert a single converted column to an Arrow array whose type is determined by the .NET column type.
+
+    Args:
+        pa: The `pyarrow` module.
+        net_column: Describes the .NET column.
+        converted: The values of the column converted by `_net_column_to_array`.
+
+    Returns:
+        The equivalent Arrow array.
+    """
+    arrow_type = _arrow_type(pa, net_column.type_name)
+    if arrow_type is None or isinstance(converted, list):
+        return pa.array(converted, from_pandas=True)
+
+    if isinstance(converted, (pd.arrays.DatetimeArray, pd.arrays.TimedeltaArray)):
+        return pa.array(converted.asi8, type=arrow_type, mask=np.asarray(converted.isna()))
+
+    if converted.dtype == object:
+        return pa.array(converted, type=arrow_type, from_pandas=True)
+
+    return pa.array(converted, from_pandas=True).cast(arrow_type)
+
+
+def _net_columns(data_table: DataTable) -> List[NetColumnDto]:
+    """
+    Calculate the description of each column of a .NET `DataTable`.
+
+    Args:
+        data_table: The .NET `DataTable` whose columns are sought.
+
+    Returns:
+        A list of `NetColumnDto` instances in column order.
+    """
+    return [NetColumnDto(column.Ordinal, column.ColumnName, column.DataType.FullName)
+            for column in data_table.Columns]
+
+
+def _read_data_table(data_table: DataTable) -> Iterable[tuple]:
+    """
+    Read each row of the .NET `DataTable` into an `Iterable` of `tuples`.
 
     Args:
         data_table: The .NET `DataTable` to read.
 
     Returns:
-        Yields a
+        Yields a `tuple` of the (unconverted) .NET cell values for each row of `data_table`.
     """
     # Adapted from code at
     # https://docs.microsoft.com/en-us/dotnet/framework/data/adonet/dataset-datatable-dataview/creating-a-datareader
     # retrieved on 18-Apr-2021.
     with dnd.disposable(data_table.CreateDataReader()) as reader:
+        row_values = Array.CreateInstance(Object, reader.FieldCount)
         while True:
             if reader.HasRows:
                 has_row = reader.Read()
                 while has_row:
-                    yield _table_row_to_dict(reader)
+                    reader.GetValues(row_values)
+                    yield tuple(row_values)
                     has_row = reader.Read()
             else:
                 return
@@ -204,39 +714,221 @@ def _read_data_table(data_table: DataTable) -> Iterable[dict]:
                 break
 
 
-def _table_row_to_dict(reader):
-    @toolz.curry
-    def get_value(dt_reader, cell_location):
-        _, column_name = cell_location
-        return cell_location, dt_reader[column_name]
-
-    def add_to_dict(so_far, to_accumulate):
-        column_name, cell_value = to_accumulate
-        return toolz.assoc(so_far, column_name, cell_value)
-
-    def to_dict(pairs):
-        dict_result = toolz.reduce(add_to_dict, pairs, {})
-        return dict_result
-
-    def net_value_to_python_value(cell_location_value_pair):
-        (column_no, column_name), value = cell_location_value_pair
-        try:
-            converted = dataclasses.replace(CellDto(column_no, column_name, value),
-                                            value=net_cell_value_to_pandas_cell_value(value))
-            return (converted.row, converted.column), converted.value
-        except ValueError as ve:
-            if 'DateTimeOffset.MinValue' in str(ve):
-                raise DataFrameAdapterDateTimeOffsetMinValueError(column_no, column_name)
-        except TypeError as te:
-            if 'System.DateTime' in str(te):
-                raise DataFrameAdapterDateTimeError(value.GetType())
-
-    result = toolz.pipe(
-        reader.FieldCount,
-        range,
-        toolz.map(lambda column_no: (column_no, reader.GetName(column_no))),
-        toolz.map(get_value(reader)),
-        to_dict,
-        toolz.itemmap(net_value_to_python_value),
-    )
-    return result
+def _is_db_null(cell_value) -> bool:
+    return isinstance(cell_value, DBNull)
+
+
+def _read_net_column(net_column: NetColumnDto, cells: Sequence, first_row_no: int = 0) -> dfas.ColumnBuffer:
+    """
+    Copy all the .NET cell values of a single column into a (picklable) buffer.
+
+    Args:
+        net_column: Describes the .NET column being read.
+        cells: The .NET cell values of the column in row order.
+        first_row_no: The row number in the .NET `DataTable` of the first item in `cells`.
+
+    Returns:
+        The buffer whose `to_array()` method returns the converted cell values.
+    """
+    is_null = np.fromiter(map(_is_db_null, cells), dtype=np.bool_, count=len(cells))
+    if is_null.all():
+        return dfas.ColumnBuffer(dfas.missing_values_array, None, is_null)
+
+    column_reader = _COLUMN_READERS.get(net_column.type_name, _read_cell_by_cell)
+    return column_reader(net_column, cells, is_null, first_row_no)
+
+
+def _net_column_to_array(net_column: NetColumnDto, cells: Sequence, first_row_no: int = 0):
+    """
+    Convert all the .NET cell values of a single column to a typed array.
+
+    Args:
+        net_column: Describes the .NET column being converted.
+        cells: The .NET cell values of the column in row order.
+        first_row_no: The row number in the .NET `DataTable` of the first item in `cells`.
+
+    Returns:
+        An array (a `numpy` array or a `pandas` extension array) containing the converted cell values.
+    """
+    return _read_net_column(net_column, cells, first_row_no).to_array()
+
+
+def _read_floating(_net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                   _first_row_no: int) -> dfas.ColumnBuffer:
+    values = np.fromiter((np.nan if null else cell for null, cell in zip(is_null, cells)),
+                         dtype=np.float64, count=len(cells))
+    return dfas.ColumnBuffer(dfas.values_array, values, is_null)
+
+
+def _read_integral(net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                   first_row_no: int) -> dfas.ColumnBuffer:
+    # Consistent with `pandas` inference, an integral column containing missing values becomes a floating point
+    # column with `NaN` values.
+    if is_null.any():
+        return _read_floating(net_column, cells, is_null, first_row_no)
+
+    return dfas.ColumnBuffer(dfas.values_array, np.fromiter(cells, dtype=np.int64, count=len(cells)), is_null)
+
+
+def _read_boolean(_net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                  _first_row_no: int) -> dfas.ColumnBuffer:
+    if is_null.any():
+        values = np.array([None if null else cell for null, cell in zip(is_null, cells)], dtype=object)
+    else:
+        values = np.fromiter(cells, dtype=np.bool_, count=len(cells))
+    return dfas.ColumnBuffer(dfas.values_array, values, is_null)
+
+
+def _read_string(_net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                 _first_row_no: int) -> dfas.ColumnBuffer:
+    values = np.empty(len(cells), dtype=object)
+    values[:] = [None if null else cell for null, cell in zip(is_null, cells)]
+    return dfas.ColumnBuffer(dfas.values_array, values, is_null)
+
+
+def _read_date_time(_net_column: NetColumnDto, cells: Sequence, _is_null: np.ndarray, _first_row_no: int):
+    first_value = toolz.first(toolz.remove(_is_db_null, cells))
+    raise DataFrameAdapterDateTimeError(first_value.GetType())
+
+
+def _net_ticks(cells: Sequence, is_null: np.ndarray, ticks_of: Callable) -> np.ndarray:
+    """
+    Extract the raw .NET ticks from each cell of a column in a single pass.
+
+    Args:
+        cells: The .NET cell values of the column in row order.
+        is_null: The boolean mask identifying the `DBNull` cells.
+        ticks_of: A callable returning the (integral) ticks of a single non-null .NET cell.
+
+    Returns:
+        The `int64` ticks of each cell (0 for `DBNull` cells).
+    """
+    return np.fromiter((0 if null else ticks_of(cell) for null, cell in zip(is_null, cells)),
+                       dtype=np.int64, count=len(cells))
+
+
+def _read_date_time_offset(net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                           first_row_no: int) -> dfas.ColumnBuffer:
+    utc_ticks = _net_ticks(cells, is_null, lambda cell: cell.UtcTicks)
+
+    is_min_value = ~is_null & (utc_ticks == _MIN_DATE_TIME_OFFSET_TICKS)
+    if is_min_value.any():
+        raise DataFrameAdapterDateTimeOffsetMinValueError(first_row_no + int(np.flatnonzero(is_min_value)[0]),
+                                                          net_column.name)
+
+    is_nat = is_null | (utc_ticks >= _MAX_SENTINEL_RANGE_LOWER_TICKS)
+    if ((utc_ticks < _MIN_NANOSECOND_TICKS) | (utc_ticks > _MAX_NANOSECOND_TICKS))[~is_nat].any():
+        # The `pandas` dtype cannot represent these time points; fall back to the cell by cell conversion.
+        return _read_cell_by_cell(net_column, cells, is_null, first_row_no)
+
+    return dfas.ColumnBuffer(dfas.date_time_offset_array, utc_ticks, is_nat)
+
+
+def _read_time_span(net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                    first_row_no: int) -> dfas.ColumnBuffer:
+    ticks = _net_ticks(cells, is_null, lambda cell: cell.Ticks)
+
+    # TODO: TimeSpan 3 Mdays calculation work-around
+    # See `net_cell_value_to_pandas_cell_value(TimeSpan)` for details.
+    is_nat = (is_null |
+              (ticks == TimeSpan.MaxValue.Ticks) |
+              (ticks == TimeSpan.MinValue.Ticks) |
+              (ticks > _TOO_LARGE_TIME_SPAN_TICKS))
+    if (ticks < _MIN_NANOSECOND_TIME_SPAN_TICKS)[~is_nat].any():
+        # The `pandas` dtype cannot represent these time spans; fall back to the cell by cell conversion.
+        return _read_cell_by_cell(net_column, cells, is_null, first_row_no)
+
+    return dfas.ColumnBuffer(dfas.time_span_array, ticks, is_nat)
+
+
+_GUID_BYTES_DTYPE = np.dtype(f'V{_GUID_SIZE}')
+
+
+def net_guids_to_bytes(net_guids: Sequence) -> np.ndarray:
+    """
+    Convert a sequence of .NET `Guid` values to a `numpy` array of 16-byte values.
+
+    This function creates a single .NET `Guid[]` from all the `Guid` values and then copies that (blittable)
+    array into `numpy` in one block. Unlike the conversion of individual `Guid` values, it makes no .NET call for
+    each value, creates no intermediate .NET strings and parses no text.
+
+    Each 16-byte value has the byte order of `uuid.UUID.bytes`. Consequently, one can compare the result to (the
+    object IDs of) other project objects using `numpy`; for example,
+    `guid_bytes == uuids_to_guid_bytes([stage.object_id])[0]`. (Because `pandas` does not support the `V16`
+    dtype, keep the result in `numpy`; do not store it in a `DataFrame` column.)
+
+    Args:
+        net_guids: The .NET `Guid` values to convert. A `DBNull` value becomes 16 zero bytes (the nil UUID).
+
+    Returns:
+        The `numpy` array of `V16` values.
+    """
+    net_guid_array = Array[Guid]([Guid.Empty if _is_db_null(net_guid) else net_guid for net_guid in net_guids])
+    net_ordered_bytes = net_array.as_numpy_struct_array(net_guid_array, _GUID_SIZE).view(np.uint8).reshape(
+        -1, _GUID_SIZE)
+    result = np.ascontiguousarray(net_ordered_bytes[:, _NET_GUID_TO_RFC_4122_BYTE_ORDER]).view(_GUID_BYTES_DTYPE)
+    return result.reshape(-1)
+
+
+def uuids_to_guid_bytes(uuids: Iterable[Optional[uuid.UUID]]) -> np.ndarray:
+    """
+    Convert `uuid.UUID` instances to an array of 16-byte values comparable to the result of `net_guids_to_bytes()`.
+
+    Args:
+        uuids: The `uuid.UUID` instances to convert. A `None` value becomes 16 zero bytes (the nil UUID).
+
+    Returns:
+        The `numpy` array of `V16` values.
+    """
+    return np.array([bytes(_GUID_SIZE) if value is None else value.bytes for value in uuids], dtype=_GUID_BYTES_DTYPE)
+
+
+def _read_guid(_net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+               _first_row_no: int) -> dfas.ColumnBuffer:
+    return dfas.ColumnBuffer(dfas.guid_array, net_guids_to_bytes(cells), is_null)
+
+
+def _read_cell_by_cell(_net_column: NetColumnDto, cells: Sequence, is_null: np.ndarray,
+                       _first_row_no: int) -> dfas.ColumnBuffer:
+    # Columns of an unrecognized type are converted cell by cell allowing `pandas` to infer the resulting dtype.
+    return dfas.ColumnBuffer(dfas.values_array, [net_cell_value_to_pandas_cell_value(cell) for cell in cells],
+                             is_null)
+
+
+_COLUMN_READERS = {
+    'System.Boolean': _read_boolean,
+    'System.Byte': _read_integral,
+    'System.DateTime': _read_date_time,
+    'System.DateTimeOffset': _read_date_time_offset,
+    'System.Double': _read_floating,
+    'System.Guid': _read_guid,
+    'System.Int16': _read_integral,
+    'System.Int32': _read_integral,
+    'System.Int64': _read_integral,
+    'System.SByte': _read_integral,
+    'System.Single': _read_floating,
+    'System.String': _read_string,
+    'System.TimeSpan': _read_time_span,
+    'System.UInt16': _read_integral,
+    'System.UInt32': _read_integral,
+}
+"""Maps the full name of the .NET `DataType` of a column to the function reading the cells of that column."""
+
+
+_STABLE_DTYPES = {
+    'System.Boolean': 'boolean',
+    'System.Byte': 'Int64',
+    'System.DateTimeOffset': pd.DatetimeTZDtype(tz=net_dt.UTC),
+    'System.Double': 'float64',
+    'System.Guid': 'object',
+    'System.Int16': 'Int64',
+    'System.Int32': 'Int64',
+    'System.Int64': 'Int64',
+    'System.SByte': 'Int64',
+    'System.Single': 'float64',
+    'System.String': 'object',
+    'System.TimeSpan': 'timedelta64[ns]',
+    'System.UInt16': 'Int64',
+    'System.UInt32': 'Int64',
+}
+"""Maps the full name of the .NET `DataType` of a column to the dtype of that column independent of its values."""
@@ -49,8 +49,8 @@ class NativeMonitorAdapter(dpo.DomProjectObject):
         contain samples either before or after `time_range()`.
         
         Another consequence of this definition is that if a client wants to access sample inside 
-        `time_range()`, one must write code to manually filter the series samples to only include the samples
-        in `time_range()`.
+        `time_range()`, one must filter the series samples to only include the samples in `time_range()`; for
+        example, by calling `well_time_series.data_points_in_time_range(monitor.time_range)`.
         """,
         tsa.NativeTimeSeriesAdapter)
 
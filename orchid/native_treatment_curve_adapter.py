@@ -16,11 +16,17 @@
 #
 
 import enum
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import toolz.curried as toolz
 
 import orchid.base
 from orchid import (
     base_time_series_adapter as bca,
     dot_net_dom_access as dna,
+    script_adapter_context as sac,
 )
 
 # noinspection PyUnresolvedReferences
@@ -58,3 +64,62 @@ class NativeTreatmentCurveAdapter(bca.BaseTimeSeriesAdapter):
             TreatmentCurveTypes.SLURRY_RATE.value: project_units.SLURRY_RATE,
         }
         return result
+
+
+def treatment_curve_frame(stages: Iterable,
+                          curve_types: Optional[Iterable[TreatmentCurveTypes]] = None) -> pd.DataFrame:
+    """
+    Gather the treatment curves of many stages into a single, long-format `pandas` `DataFrame`.
+
+    This function reads the samples of all requested curves inside a single `ScriptAdapter` session and copies
+    the samples of each curve into `numpy` in bulk. It then concatenates these arrays into the columns of the
+    resulting `DataFrame`; it never creates an intermediate `pandas` `Series` for an individual curve.
+
+    Args:
+        stages: The stages (`NativeStageAdapter` instances) whose treatment curves are sought. A repeated stage
+        (one with the same object ID as an earlier stage) is gathered only once.
+        curve_types: The types of treatment curves sought. If `None`, gather all the treatment curves of each stage.
+        A repeated curve type is gathered only once.
+
+    Returns:
+        A `DataFrame` with one row per sample and the columns:
+        - `stage_id`: The object ID of the stage (a categorical column)
+        - `curve_type`: The `TreatmentCurveTypes` value of the curve (a categorical column)
+        - `timestamp`: The (UTC) time of the sample
+        - `value`: The magnitude of the sample in project units
+    """
+    # The categories of a `pandas.Categorical` must be unique
+    requested_curve_types = list(toolz.unique(curve_types if curve_types is not None else TreatmentCurveTypes))
+
+    stage_ids = []
+    stage_codes = []
+    curve_type_codes = []
+    unix_time_stamps = []
+    magnitudes = []
+    with sac.session():
+        for stage in toolz.unique(stages, key=lambda s: s.object_id):
+            stage_code = len(stage_ids)
+            stage_ids.append(stage.object_id)
+            stage_curves = stage.treatment_curves()
+            for curve_type_code, curve_type in enumerate(requested_curve_types):
+                if curve_type not in stage_curves:
+                    continue
+
+                curve_time_stamps, curve_magnitudes = stage_curves[curve_type].sample_arrays()
+                stage_codes.append(np.full(len(curve_time_stamps), stage_code, dtype=np.int32))
+                curve_type_codes.append(np.full(len(curve_time_stamps), curve_type_code, dtype=np.int8))
+                unix_time_stamps.append(curve_time_stamps)
+                magnitudes.append(curve_magnitudes)
+
+    def concatenate(arrays, dtype):
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+    result = pd.DataFrame(data={
+        'stage_id': pd.Categorical.from_codes(concatenate(stage_codes, np.int32),
+                                              categories=pd.Index(stage_ids, dtype=object)),
+        'curve_type': pd.Categorical.from_codes(concatenate(curve_type_codes, np.int8),
+                                                categories=[curve_type.value for curve_type in requested_curve_types]),
+        'timestamp': pd.DatetimeIndex(concatenate(unix_time_stamps, np.int64).view('datetime64[s]'), tz='UTC'),
+        'value': concatenate(magnitudes, np.float64),
+    })
+    return result
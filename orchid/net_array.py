@@ -0,0 +1,99 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+"""
+Functions to copy the contents of .NET arrays of primitive values (or of blittable structures) into `numpy` arrays.
+"""
+
+
+import ctypes
+from typing import Optional
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System import Buffer
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System.Runtime.InteropServices import GCHandle, GCHandleType, Marshal
+
+
+def as_numpy_array(net_array, dtype, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+    """
+    Copy a .NET array of primitive values into a new `numpy` array.
+
+    This function pins `net_array` and copies its contents in a single block of memory. Unlike iterating over
+    `net_array`, no element crosses the boundary between .NET and Python as a (boxed) Python object.
+
+    Args:
+        net_array: The .NET array (for example, `double[]`, `long[]` or `byte[]`) to copy.
+        dtype: The `numpy` dtype having the same size and layout as the elements of `net_array`; for example,
+        `np.float64` for `double[]`, `np.int64` for `long[]` and `np.uint8` for `byte[]`.
+        start: The index of the first element to copy.
+        stop: The index following the last element to copy. If `None`, copy all elements following `start`.
+
+    Returns:
+        The one-dimensional `numpy` array containing a copy of the elements of `net_array[start:stop]`.
+
+    Raises:
+        ValueError: If the size of the elements of `net_array` differs from the size of `dtype`.
+    """
+    item_size = np.dtype(dtype).itemsize
+    net_byte_length = Buffer.ByteLength(net_array)
+    if net_byte_length != net_array.Length * item_size:
+        raise ValueError(f'The elements of the .NET array ({net_byte_length} bytes for {net_array.Length} elements)'
+                         f' do not have the size of `{np.dtype(dtype)}` ({item_size} bytes).')
+
+    return _copy_pinned(net_array, dtype, start, stop)
+
+
+def as_numpy_struct_array(net_array, item_size: int) -> np.ndarray:
+    """
+    Copy a .NET array of blittable structures (for example, `Guid[]`) into a new `numpy` array of raw bytes.
+
+    Like `as_numpy_array()`, this function pins `net_array` and copies its contents in a single block of memory.
+
+    Args:
+        net_array: The .NET array of blittable structures to copy.
+        item_size: The size (in bytes) of each element of `net_array`; for example, 16 for `Guid[]`.
+
+    Returns:
+        The one-dimensional `numpy` array of `V<item_size>` values each containing the bytes of one element of
+        `net_array` (in the layout of the element in .NET memory).
+
+    Raises:
+        ValueError: If the size of the elements of `net_array` differs from `item_size`.
+    """
+    net_item_size = Marshal.SizeOf(net_array.GetType().GetElementType())
+    if net_item_size != item_size:
+        raise ValueError(f'The elements of the .NET array ({net_item_size} bytes) do not have the size'
+                         f' {item_size} bytes.')
+
+    return _copy_pinned(net_array, np.dtype(f'V{item_size}'), 0, None)
+
+
+def _copy_pinned(net_array, dtype, start: int, stop: Optional[int]) -> np.ndarray:
+    stop = net_array.Length if stop is None else min(stop, net_array.Length)
+    result = np.empty(max(stop - start, 0), dtype=dtype)
+    if result.nbytes == 0:
+        return result
+
+    handle = GCHandle.Alloc(net_array, GCHandleType.Pinned)
+    try:
+        ctypes.memmove(result.ctypes.data,
+                       handle.AddrOfPinnedObject().ToInt64() + start * result.itemsize,
+                       result.nbytes)
+    finally:
+        handle.Free()
+    return result
@@ -16,22 +16,30 @@
 #
 
 from collections import namedtuple
-from typing import Iterable, List, Tuple
+import functools
+import pathlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import uuid
 
 import deal
 import option
+import pandas as pd
 import toolz.curried as toolz
 
 from orchid import (
+    data_frame_cache as dfc,
     dot_net_dom_access as dna,
     native_data_frame_adapter as dfa,
     native_monitor_adapter as nma,
     native_time_series_adapter as tsa,
+    native_treatment_curve_adapter as ntc,
     native_project_user_data_adapter as uda,
     native_well_adapter as nwa,
     net_quantity as onq,
     searchable_data_frames as sdf,
     searchable_project_objects as spo,
+    time_series_cache as tsc,
     unit_system as units,
 )
 from orchid.project_store import ProjectStore
@@ -64,6 +72,7 @@ class Project(dna.IdentifiedDotNetAdapter):
         """
         super().__init__(project_loader.native_project())
         self._project_loader = project_loader
+        self._data_frame_cache = None
 
     azimuth = dna.transformed_dom_property('azimuth', 'The azimuth of the project measured east of north.',
                                            toolz.compose(onq.as_measurement(units.Common.ANGLE),
@@ -86,7 +95,109 @@ class Project(dna.IdentifiedDotNetAdapter):
         Returns:
             An `spo.SearchableProjectObjects` for all the data frames of this project.
         """
-        return sdf.SearchableDataFrames(dfa.NativeDataFrameAdapterIdentified, self.dom_object.DataFrames.Items)
+        return sdf.SearchableDataFrames(functools.partial(dfa.NativeDataFrameAdapterIdentified,
+                                                          conversion_cache=self._data_frame_cache),
+                                        self.dom_object.DataFrames.Items)
+
+    def all_pandas_data_frames(self, max_workers: Optional[int] = None) -> Dict[uuid.UUID, pd.DataFrame]:
+        """
+        Convert all the data frames of this project to `pandas` `DataFrame` instances.
+
+        Unlike calling `pandas_data_frame()` on each item of `data_frames()`, this method reads each .NET data frame
+        in this process but types and assembles the `pandas` data frames in a pool of worker processes. (See
+        `dfa.all_pandas_data_frames()` for details.)
+
+        Args:
+            max_workers: The maximum number of worker processes.
+
+        Returns:
+            A dictionary mapping the object ID of each data frame of this project to its `pandas` `DataFrame`.
+        """
+        return dfa.all_pandas_data_frames(self.data_frames(), max_workers=max_workers)
+
+    @property
+    def data_frame_cache(self) -> Optional[dfc.DataFrameCache]:
+        """The cache of converted data frames of this project if enabled; otherwise, `None`."""
+        return self._data_frame_cache
+
+    def enable_data_frame_cache(self, max_bytes: int = dfc.DEFAULT_MAX_BYTES) -> dfc.DataFrameCache:
+        """
+        Enable caching of the `pandas` data frames converted from the data frames of this project.
+
+        Once enabled, repeated calls to `pandas_data_frame()` on the data frames returned by `data_frames()` return
+        a copy of the previous conversion (until the underlying .NET data frame changes or the cache evicts the
+        conversion) instead of converting the .NET data frame again.
+
+        Args:
+            max_bytes: The memory budget of the cache in bytes. When exceeded, the cache evicts the least recently
+            used conversions.
+
+        Returns:
+            The newly created cache.
+        """
+        self._data_frame_cache = dfc.DataFrameCache(max_bytes)
+        return self._data_frame_cache
+
+    def disable_data_frame_cache(self) -> None:
+        """Disable (and discard) the cache of converted data frames of this project."""
+        self._data_frame_cache = None
+
+    def enable_time_series_cache(self, directory: Union[str, pathlib.Path],
+                                 max_bytes: int = tsc.DEFAULT_MAX_BYTES) -> tsc.TimeSeriesCache:
+        """
+        Cache the samples of the time series (monitor and treatment curves) of this project on disk.
+
+        Once enabled, the first call to `data_points()` of a curve stores its samples as memory-mappable `.npy`
+        files in `directory`. Later calls, even in other processes, read these files instead of converting the
+        samples from .NET. The cached samples are identified by the path, the size and the modification time of
+        the project file and by the object ID of the curve; therefore, changing the project file invalidates them.
+
+        Args:
+            directory: The directory containing the cached files. Many projects may share one directory.
+            max_bytes: The disk budget of the cache in bytes. The cache removes the least recently used samples
+            when adding samples would exceed this budget.
+
+        Returns:
+            The newly enabled cache.
+        """
+        result = tsc.TimeSeriesCache(directory, max_bytes)
+        tsc.register_project(dna.NetObjectIdentity(self.dom_object), result,
+                             tsc.project_fingerprint(self._project_loader.project_pathname))
+        return result
+
+    def disable_time_series_cache(self) -> None:
+        """Stop caching the samples of the time series of this project (without removing any cached files)."""
+        tsc.unregister_project(dna.NetObjectIdentity(self.dom_object))
+
+    @deal.pre(lambda _self, directory, format='parquet': format in dfa.ARROW_FILE_SUFFIXES)
+    def export_data_frames(self, directory: Union[str, pathlib.Path], format: str = 'parquet') -> List[pathlib.Path]:
+        """
+        Export all the data frames of this project to files in `directory`; one file per data frame.
+
+        Each file contains the Apache Arrow table returned by `to_arrow()` (including the object ID, name and
+        display name of the data frame as table metadata). The name of each file combines the name and the object
+        ID of the exported data frame.
+
+        This method requires the optional `pyarrow` package.
+
+        Args:
+            directory: The directory in which to write the files. This method creates the directory if needed.
+            format: Either 'parquet' to write Apache Parquet files or 'arrow' to write (memory-mappable) Arrow IPC
+            files.
+
+        Returns:
+            The paths of the written files.
+        """
+        target_directory = pathlib.Path(directory)
+        target_directory.mkdir(parents=True, exist_ok=True)
+
+        def export_data_frame(data_frame):
+            file_stem = re.sub(r'[^\w\-. ]', '_', f'{data_frame.name}_{data_frame.object_id}')
+            target_path = target_directory.joinpath(f'{file_stem}{dfa.ARROW_FILE_SUFFIXES[format]}')
+            dfa.write_arrow_table(data_frame.to_arrow(), target_path, format)
+            return target_path
+
+        return [export_data_frame(data_frame) for data_frame in self.data_frames()]
 
     def default_well_colors(self) -> List[Tuple[float, float, float]]:
         """
@@ -150,6 +261,24 @@ class Project(dna.IdentifiedDotNetAdapter):
         """
         return spo.SearchableProjectObjects(tsa.NativeTimeSeriesAdapter, self.dom_object.WellTimeSeriesList.Items)
 
+    def treatment_curve_frame(self, stages: Optional[Iterable] = None,
+                              curve_types: Optional[Iterable[ntc.TreatmentCurveTypes]] = None) -> pd.DataFrame:
+        """
+        Return the treatment curves of many stages as a single, long-format `pandas` `DataFrame`.
+
+        Args:
+            stages: The stages whose treatment curves are sought. If `None`, use every stage of every well in
+            this project.
+            curve_types: The types of treatment curves sought. If `None`, return all treatment curves.
+
+        Returns:
+            A `DataFrame` with the columns, `stage_id`, `curve_type`, `timestamp` and `value`. See
+            `native_treatment_curve_adapter.treatment_curve_frame()`.
+        """
+        if stages is None:
+            stages = toolz.concat(well.stages().all_objects() for well in self.wells().all_objects())
+        return ntc.treatment_curve_frame(stages, curve_types)
+
     @property
     def user_data(self) -> uda.NativeProjectUserDataAdapter:
         return uda.NativeProjectUserDataAdapter(self.dom_object.ProjectUserData)
@@ -0,0 +1,201 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""A bounded, least-recently-used, process-wide cache of loaded projects."""
+
+import collections
+import pathlib
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+
+import deal
+
+from orchid import time_series_cache as tsc
+
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024 * 1024
+"""The default memory budget (in bytes) of a `ProjectCache`."""
+
+_CacheEntry = collections.namedtuple('_CacheEntry', ['resolved_pathname', 'size', 'project'])
+
+
+class ProjectCache:
+    """
+    Shares loaded projects among all the clients in a process that load the same project file.
+
+    The cache identifies each project by the fingerprint (see `time_series_cache.project_fingerprint()`) of its
+    file; that is, by the resolved path, the size and the modification time of that file. Changing the project
+    file (for example, by saving it) causes the next load to read the changed file.
+
+    Because the memory used by a loaded (.NET) project is not available to Python, the cache estimates this memory
+    by the size of the project file. When adding a project would exceed the memory budget, the cache removes the
+    least recently used projects. (A project larger than the entire budget is never cached.) Removing a project
+    from the cache does not invalidate that project; it simply allows the project to be garbage collected once no
+    client refers to it.
+
+    All clients share the **same** `Project` instance; clients must treat cached projects as read-only.
+
+    All methods of this class are thread-safe. Concurrent loads of the same project file load it only once.
+    """
+
+    @deal.pre(lambda _self, max_bytes=DEFAULT_MAX_BYTES: max_bytes > 0)
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Construct an empty cache.
+
+        Args:
+            max_bytes: The memory budget of this cache in bytes (estimated by the sizes of the project files).
+        """
+        self._max_bytes = max_bytes
+        self._entries: 'collections.OrderedDict[str, _CacheEntry]' = collections.OrderedDict()
+        self._loading_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, project_pathname: Union[str, pathlib.Path]) -> bool:
+        with self._lock:
+            return tsc.project_fingerprint(project_pathname) in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        """The estimated memory (in bytes) used by all the cached projects."""
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    @property
+    def max_bytes(self) -> int:
+        """The memory budget (in bytes) of this cache."""
+        return self._max_bytes
+
+    def evict(self, project_pathname: Optional[Union[str, pathlib.Path]] = None) -> None:
+        """
+        Remove the project loaded from `project_pathname` (or, if `None`, all projects) from this cache.
+
+        Args:
+            project_pathname: The path of the project file of the project to remove.
+        """
+        with self._lock:
+            if project_pathname is None:
+                self._entries.clear()
+                return
+
+            self._evict_resolved_pathname(str(pathlib.Path(project_pathname).resolve()))
+
+    def get_or_load(self, project_pathname: Union[str, pathlib.Path], load: Callable[[str], Any]):
+        """
+        Return the project loaded from `project_pathname`, invoking `load` if that project is not cached.
+
+        Args:
+            project_pathname: The path of the project file.
+            load: A callable that loads the project from the (`str`) path supplied as its only argument.
+
+        Returns:
+            The (shared) project.
+        """
+        resolved_path = pathlib.Path(project_pathname).resolve()
+        fingerprint = tsc.project_fingerprint(resolved_path)
+        with self._lock:
+            maybe_cached = self._lookup(fingerprint)
+            if maybe_cached is not None:
+                return maybe_cached
+            loading_lock = self._loading_locks.setdefault(fingerprint, threading.Lock())
+
+        # Load outside the cache lock so that (lengthy) loads of different projects do not wait on one another.
+        with loading_lock:
+            with self._lock:
+                maybe_cached = self._lookup(fingerprint)
+            if maybe_cached is not None:
+                return maybe_cached
+
+            try:
+                loaded = load(str(project_pathname))
+                self._add(fingerprint, _CacheEntry(str(resolved_path), resolved_path.stat().st_size, loaded))
+            finally:
+                with self._lock:
+                    self._loading_locks.pop(fingerprint, None)
+            return loaded
+
+    def _lookup(self, fingerprint: str):
+        maybe_entry = self._entries.get(fingerprint)
+        if maybe_entry is None:
+            return None
+
+        self._entries.move_to_end(fingerprint)
+        return maybe_entry.project
+
+    def _add(self, fingerprint: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            # Projects loaded from earlier versions of the same file are stale.
+            self._evict_resolved_pathname(entry.resolved_pathname)
+            if entry.size > self._max_bytes:
+                return
+
+            current_bytes = sum(cached.size for cached in self._entries.values())
+            while self._entries and current_bytes + entry.size > self._max_bytes:
+                _, least_recently_used = self._entries.popitem(last=False)
+                current_bytes -= least_recently_used.size
+            self._entries[fingerprint] = entry
+
+    def _evict_resolved_pathname(self, resolved_pathname: str) -> None:
+        for fingerprint in [f for f, e in self._entries.items() if e.resolved_pathname == resolved_pathname]:
+            del self._entries[fingerprint]
+
+
+_process_cache: Optional[ProjectCache] = None
+_process_cache_lock = threading.Lock()
+
+
+def enable_project_cache(max_bytes: int = DEFAULT_MAX_BYTES) -> ProjectCache:
+    """
+    Share the projects loaded by `orchid.load_project()` among all its callers in this process.
+
+    Once enabled, `orchid.load_project()` returns the **same** `Project` instance to all callers loading the same
+    (unchanged) project file. Callers must not change these shared projects.
+
+    Calling this function again replaces the existing cache (discarding all the projects it contains).
+
+    Args:
+        max_bytes: The memory budget of the cache in bytes (estimated by the sizes of the project files).
+
+    Returns:
+        The newly enabled cache. Use its `evict()` method to remove projects from the cache.
+    """
+    global _process_cache
+    with _process_cache_lock:
+        _process_cache = ProjectCache(max_bytes)
+        return _process_cache
+
+
+def disable_project_cache() -> None:
+    """Stop sharing loaded projects and discard all the cached projects."""
+    global _process_cache
+    with _process_cache_lock:
+        _process_cache = None
+
+
+def process_project_cache() -> Optional[ProjectCache]:
+    """
+    Return the process-wide project cache.
+
+    Returns:
+        The cache enabled by `enable_project_cache()`; `None` if no cache is enabled.
+    """
+    with _process_cache_lock:
+        return _process_cache
@@ -104,6 +104,11 @@ class ProjectStore:
         self._native_project = None
         self._in_context = False
 
+    @property
+    def project_pathname(self) -> pathlib.Path:
+        """The path of the data file of the project."""
+        return self._project_pathname
+
     def native_project(self):
         """
         Return the native (.NET) Orchid project.
@@ -119,6 +124,9 @@ class ProjectStore:
         """
         Load a project from the path, `self._project_pathname`.
 
+        The .NET project file reader always reads the complete project (including all curves and data frames);
+        the SDK offers no option to read only part of a project.
+
         Examples:
             >>> load_path = orchid.training_data_path().joinpath('frankNstein_Bakken_UTM13_FEET.ifrac')
             >>> store = ProjectStore(pathname_to_str(load_path))
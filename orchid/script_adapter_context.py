@@ -13,7 +13,9 @@
 #
 
 
+import contextlib
 import sys
+import threading
 
 import orchid.configuration
 
@@ -61,21 +63,65 @@ class ScriptAdapterContext:
 
     For information on Python context managers, see
     [the Python docs](https://docs.python.org/3.8/library/stdtypes.html#context-manager-types)
+
+    The context is reference counted and re-entrant. Only entering the outermost context initializes the
+    `ScriptAdapter`, and only exiting the outermost context shuts it down. Nested contexts (for example, the
+    contexts entered by many calls inside a `session()`) share the single initialized `ScriptAdapter`.
     """
 
     def __enter__(self):
-        try:
-            ScriptAdapter.Init()
-            return self
-        # TODO: Correct exception type / DEADFALL issue
-        except InvalidOperationException as ioe:
-            if 'REVEAL-CORE-0xDEADFA11' in ioe.Message:
-                print('Orchid licensing error. Please contact Orchid technical support.')
-                sys.exit(-1)
-            else:
-                raise
+        global _active_context_count
+
+        with _active_context_lock:
+            if _active_context_count == 0:
+                _init_script_adapter()
+            _active_context_count += 1
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        ScriptAdapter.Shutdown()
+        global _active_context_count
+
+        with _active_context_lock:
+            _active_context_count -= 1
+            if _active_context_count == 0:
+                ScriptAdapter.Shutdown()
         # Returning no value will propagate the exception to the caller in the normal way
         return
+
+
+_active_context_lock = threading.RLock()
+_active_context_count = 0
+
+
+def _init_script_adapter():
+    try:
+        ScriptAdapter.Init()
+    # TODO: Correct exception type / DEADFALL issue
+    except InvalidOperationException as ioe:
+        if 'REVEAL-CORE-0xDEADFA11' in ioe.Message:
+            print('Orchid licensing error. Please contact Orchid technical support.')
+            sys.exit(-1)
+        else:
+            raise
+
+
+@contextlib.contextmanager
+def session():
+    """
+    Keep the .NET `ScriptAdapter` initialized for the duration of a `with` block.
+
+    Without a session, every operation that requires the `ScriptAdapter` (reading or writing a project,
+    converting the samples of a time series, and so on) initializes the `ScriptAdapter` before the operation and
+    shuts it down after the operation. Inside a session, all these operations share one initialized
+    `ScriptAdapter`. Sessions may be nested.
+
+    Example:
+
+    >>> with orchid.session():
+    >>>     all_data_points = [curve.data_points() for curve in stage.treatment_curves().values()]
+
+    Returns:
+        Yields `None`.
+    """
+    with ScriptAdapterContext():
+        yield
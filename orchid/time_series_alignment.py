@@ -0,0 +1,120 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""Functions that resample many time series (curves) onto a single, common time grid."""
+
+from typing import Iterable, Union
+
+import datetime as dt
+import deal
+import numpy as np
+import pandas as pd
+
+from orchid import script_adapter_context as sac
+
+
+_NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+def _interpolate(grid: np.ndarray, x: np.ndarray, y: np.ndarray, _step: int) -> np.ndarray:
+    return np.interp(grid, x, y, left=np.nan, right=np.nan)
+
+
+def _forward_fill(grid: np.ndarray, x: np.ndarray, y: np.ndarray, _step: int) -> np.ndarray:
+    previous = np.searchsorted(x, grid, side='right') - 1
+    result = y[np.maximum(previous, 0)]
+    result[(previous < 0) | (grid > x[-1])] = np.nan
+    return result
+
+
+def _mean(grid: np.ndarray, x: np.ndarray, y: np.ndarray, step: int) -> np.ndarray:
+    # Each grid point labels the bin starting at that point (like `pandas.Series.resample`)
+    bins = (x - grid[0]) // step
+    counts = np.bincount(bins, minlength=len(grid))
+    sums = np.bincount(bins, weights=y, minlength=len(grid))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+ALIGNMENT_METHODS = {
+    'interpolate': _interpolate,
+    'ffill': _forward_fill,
+    'mean': _mean,
+}
+"""Maps the name of each alignment method to the function resampling one series onto the common grid."""
+
+
+@deal.pre(lambda series, freq='1min', how='interpolate': how in ALIGNMENT_METHODS)
+@deal.pre(lambda series, freq='1min', how='interpolate': pd.to_timedelta(freq).value > 0)
+def align_time_series(series: Iterable, freq: Union[str, dt.timedelta, pd.Timedelta] = '1min',
+                      how: str = 'interpolate') -> pd.DataFrame:
+    """
+    Resample many time series onto one common time grid producing a single, wide `pandas` `DataFrame`.
+
+    This function reads the raw sample arrays of every series inside one `ScriptAdapter` session. It then
+    resamples each series onto the common grid using vectorized `numpy` operations; it creates no intermediate
+    `pandas` `Series` (or `DatetimeIndex`) for any individual series.
+
+    The common grid starts at the earliest sample (of any series) and ends at the latest sample (of any series)
+    with points separated by `freq`. The grid points are aligned to multiples of `freq` since the Unix epoch. A
+    series has no (`NaN`) values at grid points outside the time range of its samples.
+
+    The available methods are:
+
+    - 'interpolate': Linearly interpolate between the samples surrounding each grid point.
+    - 'ffill': Use the value of the latest sample at or before each grid point.
+    - 'mean': Average the samples in the interval from each grid point up to (but excluding) the next grid point.
+
+    Args:
+        series: The time series (for example, `NativeTreatmentCurveAdapter` or `NativeTimeSeriesAdapter`
+        instances) to align.
+        freq: The interval between grid points; for example, '10s', '1min' or `datetime.timedelta(seconds=30)`.
+        how: The method used to calculate the value of each series at each grid point.
+
+    Returns:
+        A `DataFrame` indexed by the (UTC) grid times with one column per series named by the series name.
+    """
+    step = pd.to_timedelta(freq).value
+
+    names = []
+    sample_arrays = []
+    with sac.session():
+        for time_series in series:
+            unix_time_stamps, magnitudes = time_series.sample_arrays()
+            names.append(time_series.name)
+            sample_arrays.append((np.asarray(unix_time_stamps, dtype=np.int64) * _NANOSECONDS_PER_SECOND,
+                                  np.asarray(magnitudes, dtype=np.float64)))
+
+    non_empty = [x for x, _ in sample_arrays if len(x) > 0]
+    if non_empty:
+        grid_start = min(x[0] for x in non_empty) // step * step
+        grid_stop = max(x[-1] for x in non_empty)
+        grid = np.arange(grid_start, grid_stop + 1, step, dtype=np.int64)
+    else:
+        grid = np.empty(0, dtype=np.int64)
+
+    resample = ALIGNMENT_METHODS[how]
+
+    def align(x, y):
+        if len(x) == 0 or len(grid) == 0:
+            return np.full(len(grid), np.nan)
+        return resample(grid, x, y, step)
+
+    result = pd.DataFrame(data=dict(enumerate(align(x, y) for x, y in sample_arrays)),
+                          index=pd.DatetimeIndex(grid.view('datetime64[ns]'), tz='UTC'))
+    result.columns = names
+    return result
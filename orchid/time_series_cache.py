@@ -0,0 +1,279 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""A bounded, least-recently-used, on-disk cache of the samples of time series (curves)."""
+
+import hashlib
+import os
+import pathlib
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+import uuid
+
+import deal
+import numpy as np
+
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+"""The default disk budget (in bytes) of a `TimeSeriesCache`."""
+
+_TIME_STAMPS_SUFFIX = '.time_stamps.npy'
+_MAGNITUDES_SUFFIX = '.magnitudes.npy'
+
+SampleArrays = Tuple[np.ndarray, np.ndarray]
+"""The `int64` Unix time stamps (in seconds) and the `float64` magnitudes of the samples of a time series."""
+
+
+def project_fingerprint(project_pathname: Union[str, pathlib.Path]) -> str:
+    """
+    Calculate a fingerprint identifying the current contents of a project file.
+
+    The fingerprint depends on the resolved path, the size and the modification time of the project file. Saving
+    the project file (or replacing it) changes its fingerprint.
+
+    Args:
+        project_pathname: The path of the `.ifrac` file of the project.
+
+    Returns:
+        The (hexadecimal) fingerprint.
+    """
+    project_path = pathlib.Path(project_pathname).resolve()
+    project_stat = project_path.stat()
+    return hashlib.sha256(f'{project_path}|{project_stat.st_size}|{project_stat.st_mtime_ns}'.encode()).hexdigest()
+
+
+def series_key(fingerprint: str, series_object_id: uuid.UUID) -> str:
+    """
+    Calculate the key identifying the samples of one time series of one project file.
+
+    Args:
+        fingerprint: The fingerprint of the project file (see `project_fingerprint()`).
+        series_object_id: The object ID of the time series.
+
+    Returns:
+        The key (usable as a file name).
+    """
+    return hashlib.sha256(f'{fingerprint}|{series_object_id}'.encode()).hexdigest()
+
+
+class TimeSeriesCache:
+    """
+    Caches the samples of time series as memory-mappable `.npy` files up to a disk budget.
+
+    Each entry consists of two `.npy` files: the time stamps and the magnitudes of the samples. Reading an entry
+    maps these files into memory (read-only) instead of reading them. When adding an entry would exceed the disk
+    budget, the cache removes the least recently used entries. (The cache records the use of an entry by updating
+    the modification time of its files.) An entry larger than the entire budget is never cached.
+
+    All methods of this class are thread-safe; however, multiple processes sharing a single cache directory may
+    occasionally remove entries used by one another.
+
+    On Windows, a file cannot be removed or replaced while any array read from it remains mapped into memory.
+    Consequently, the cache skips (and leaves in place) an entry whose files it cannot remove, and it does not
+    cache samples whose files it cannot write; a later removal, once the arrays are released, succeeds.
+    """
+
+    @deal.pre(lambda _self, directory, max_bytes=DEFAULT_MAX_BYTES: max_bytes > 0)
+    def __init__(self, directory: Union[str, pathlib.Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Construct a cache storing its entries in `directory`.
+
+        Args:
+            directory: The directory containing the cached files. This constructor creates it if necessary.
+            max_bytes: The disk budget of this cache in bytes.
+        """
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return all(path.exists() for path in self._entry_paths(key))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entry_sizes())
+
+    @property
+    def current_bytes(self) -> int:
+        """The disk space (in bytes) currently used by all cached entries."""
+        with self._lock:
+            return sum(self._entry_sizes().values())
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """The directory containing the cached files."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """The disk budget (in bytes) of this cache."""
+        return self._max_bytes
+
+    def clear(self) -> None:
+        """Remove all entries from this cache."""
+        with self._lock:
+            for key in self._entry_sizes():
+                self.evict(key)
+
+    def evict(self, key: str) -> bool:
+        """
+        Remove the entry identified by `key` (if any) from this cache.
+
+        Args:
+            key: Identifies the entry to remove.
+
+        Returns:
+            `False` if the files of the entry could not be removed (for example, on Windows, because an array read
+            from the entry is still mapped into memory); otherwise, `True`.
+        """
+        with self._lock:
+            result = True
+            for path in self._entry_paths(key):
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    result = False
+            return result
+
+    def get_or_load(self, key: str, load: Callable[[], SampleArrays]) -> SampleArrays:
+        """
+        Return the sample arrays identified by `key`, invoking `load` if those samples are not cached.
+
+        Args:
+            key: Identifies the samples of interest (see `series_key()`).
+            load: A callable of no arguments that returns the sample arrays if they are not cached.
+
+        Returns:
+            The time stamps and the magnitudes of the samples. Cached arrays are read-only, memory-mapped arrays.
+        """
+        with self._lock:
+            maybe_cached = self._load(key)
+        if maybe_cached is not None:
+            return maybe_cached
+
+        # Load outside the lock so that (possibly lengthy) loads of different time series do not wait on one another.
+        loaded = load()
+        self._add(key, loaded)
+        return loaded
+
+    def _entry_paths(self, key: str) -> Tuple[pathlib.Path, pathlib.Path]:
+        return (self._directory.joinpath(f'{key}{_TIME_STAMPS_SUFFIX}'),
+                self._directory.joinpath(f'{key}{_MAGNITUDES_SUFFIX}'))
+
+    def _entry_sizes(self) -> Dict[str, int]:
+        result = {}
+        for time_stamps_path in self._directory.glob(f'*{_TIME_STAMPS_SUFFIX}'):
+            key = time_stamps_path.name[:-len(_TIME_STAMPS_SUFFIX)]
+            try:
+                result[key] = sum(path.stat().st_size for path in self._entry_paths(key))
+            except FileNotFoundError:
+                pass
+        return result
+
+    def _load(self, key: str) -> Optional[SampleArrays]:
+        try:
+            result = tuple(np.load(path, mmap_mode='r') for path in self._entry_paths(key))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        for path in self._entry_paths(key):
+            os.utime(path)
+        return result
+
+    def _add(self, key: str, sample_arrays: SampleArrays) -> None:
+        size = sum(array.nbytes for array in sample_arrays)
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            if not self.evict(key):
+                return
+            self._prune(self._max_bytes - size)
+            for path, array in zip(self._entry_paths(key), sample_arrays):
+                # Write to a temporary file and then rename it so that no reader ever maps a partially written file.
+                temporary_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+                try:
+                    with open(temporary_path, 'wb') as temporary_file:
+                        np.save(temporary_file, array)
+                    os.replace(temporary_path, path)
+                except OSError:
+                    # Do not cache a partially written entry; the caller still receives the loaded samples.
+                    temporary_path.unlink(missing_ok=True)
+                    self.evict(key)
+                    return
+
+    def _prune(self, max_bytes: int) -> None:
+        entry_sizes = self._entry_sizes()
+
+        def last_use(key):
+            try:
+                return self._entry_paths(key)[0].stat().st_mtime_ns
+            except FileNotFoundError:
+                return 0
+
+        current_bytes = sum(entry_sizes.values())
+        for key in sorted(entry_sizes, key=last_use):
+            if current_bytes <= max_bytes:
+                break
+            if self.evict(key):
+                current_bytes -= entry_sizes[key]
+
+
+_project_caches: Dict[Hashable, Tuple[TimeSeriesCache, str]] = {}
+_project_caches_lock = threading.Lock()
+
+
+def register_project(project_key: Hashable, cache: TimeSeriesCache, fingerprint: str) -> None:
+    """
+    Use `cache` for the samples of all the time series of the loaded project identified by `project_key`.
+
+    Args:
+        project_key: Identifies the loaded project (for example, by the identity of its .NET `IProject`). The key
+        must distinguish projects loaded from different files; therefore, the project object ID, which copies of
+        a project file share, is not a suitable key.
+        cache: The cache storing the samples.
+        fingerprint: The fingerprint of the file from which the project was loaded (see `project_fingerprint()`).
+    """
+    with _project_caches_lock:
+        _project_caches[project_key] = (cache, fingerprint)
+
+
+def unregister_project(project_key: Hashable) -> None:
+    """
+    Stop caching the samples of the time series of the loaded project identified by `project_key`.
+
+    Args:
+        project_key: Identifies the loaded project (see `register_project()`).
+    """
+    with _project_caches_lock:
+        _project_caches.pop(project_key, None)
+
+
+def project_cache(project_key: Hashable) -> Optional[Tuple[TimeSeriesCache, str]]:
+    """
+    Return the cache (and the project file fingerprint) registered for a loaded project.
+
+    Args:
+        project_key: Identifies the loaded project (see `register_project()`).
+
+    Returns:
+        The registered cache and fingerprint; `None` if no cache is registered.
+    """
+    with _project_caches_lock:
+        return _project_caches.get(project_key)
@@ -0,0 +1,117 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""Functions that reduce the number of samples of a time series while preserving its visual appearance."""
+
+import math
+
+import deal
+import numpy as np
+
+
+@deal.pre(lambda x, y, max_points: max_points > 2)
+def minmax_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Calculate the indices of the samples retained by min/max decimation.
+
+    This function divides the samples into (at most) `max_points / 2` buckets of consecutive samples and retains
+    the samples having the minimum and the maximum value in each bucket. Because it retains every extreme value, a
+    plot of the retained samples has the same envelope as a plot of all the samples.
+
+    Args:
+        x: The (sorted) independent values (for example, the time stamps) of the samples.
+        y: The dependent values of the samples.
+        max_points: The maximum number of retained samples.
+
+    Returns:
+        The sorted indices of the retained samples.
+    """
+    sample_count = len(y)
+    if sample_count <= max_points:
+        return np.arange(sample_count)
+
+    bucket_size = math.ceil(sample_count / (max_points // 2))
+    bucket_count = math.ceil(sample_count / bucket_size)
+    padding = bucket_count * bucket_size - sample_count
+    is_nan = np.isnan(y)
+    bucket_starts = np.arange(bucket_count) * bucket_size
+    # Ignore `NaN` values when searching for extremes; padding values are never extreme.
+    for_min = np.concatenate([np.where(is_nan, np.inf, y), np.full(padding, np.inf)]).reshape(bucket_count, -1)
+    for_max = np.concatenate([np.where(is_nan, -np.inf, y), np.full(padding, -np.inf)]).reshape(bucket_count, -1)
+    result = np.unique(np.concatenate([bucket_starts + np.argmin(for_min, axis=1),
+                                       bucket_starts + np.argmax(for_max, axis=1)]))
+    return result[result < sample_count]
+
+
+@deal.pre(lambda x, y, max_points: max_points > 2)
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Calculate the indices of the samples retained by Largest-Triangle-Three-Buckets (LTTB) decimation.
+
+    This function always retains the first and the last sample. It divides the remaining samples into
+    `max_points - 2` buckets and, from each bucket, retains the sample forming the largest triangle with the
+    previously retained sample and the average of the next bucket. See Sveinn Steinarsson, "Downsampling Time
+    Series for Visual Representation" (2013).
+
+    The algorithm is inherently sequential; however, this function computes the bucket averages in a vectorized
+    manner and performs a single pass over the samples.
+
+    Args:
+        x: The (sorted) independent values (for example, the time stamps) of the samples.
+        y: The dependent values of the samples.
+        max_points: The maximum number of retained samples.
+
+    Returns:
+        The sorted indices of the retained samples.
+    """
+    sample_count = len(y)
+    if sample_count <= max_points:
+        return np.arange(sample_count)
+
+    # Measure `x` from its first value to preserve precision when summing (for example, Unix time stamps)
+    x = np.asarray(x, dtype=np.float64) - x[0]
+    # Treat `NaN` values as zero for the calculation of the triangle areas
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    bucket_count = max_points - 2
+    # Bucket `i` contains the samples with indices in `[bucket_edges[i], bucket_edges[i + 1])`. The "next bucket"
+    # of the last bucket contains only the last sample.
+    bucket_edges = (np.floor(np.arange(bucket_count + 1) * (sample_count - 2) / bucket_count) + 1).astype(np.int64)
+    next_bucket_starts = bucket_edges[1:]
+    next_bucket_stops = np.append(bucket_edges[2:], sample_count)
+    x_sums = np.concatenate([[0.0], np.cumsum(x)])
+    y_sums = np.concatenate([[0.0], np.cumsum(y)])
+    next_counts = next_bucket_stops - next_bucket_starts
+    next_x_averages = (x_sums[next_bucket_stops] - x_sums[next_bucket_starts]) / next_counts
+    next_y_averages = (y_sums[next_bucket_stops] - y_sums[next_bucket_starts]) / next_counts
+
+    result = np.empty(max_points, dtype=np.int64)
+    result[0], result[-1] = 0, sample_count - 1
+    previous = 0
+    for bucket_no in range(bucket_count):
+        start, stop = bucket_edges[bucket_no], bucket_edges[bucket_no + 1]
+        areas = np.abs((x[previous] - next_x_averages[bucket_no]) * (y[start:stop] - y[previous]) -
+                       (x[previous] - x[start:stop]) * (next_y_averages[bucket_no] - y[previous]))
+        previous = start + int(np.argmax(areas))
+        result[bucket_no + 1] = previous
+    return result
+
+
+DECIMATION_METHODS = {
+    'minmax': minmax_indices,
+    'lttb': lttb_indices,
+}
+"""Maps the name of each decimation method to the function calculating the indices of the retained samples."""
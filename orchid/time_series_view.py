@@ -0,0 +1,184 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""A lazy view of a time window of a time series (curve)."""
+
+import datetime as dt
+from typing import Optional, Tuple, Union
+
+import deal
+import numpy as np
+import pandas as pd
+import pendulum
+
+from orchid import time_series_alignment as tsa
+
+
+def _later(a: Optional[pendulum.DateTime], b: Optional[pendulum.DateTime]) -> Optional[pendulum.DateTime]:
+    if a is None or b is None:
+        return b if a is None else a
+    return max(a, b)
+
+
+def _earlier(a: Optional[pendulum.DateTime], b: Optional[pendulum.DateTime]) -> Optional[pendulum.DateTime]:
+    if a is None or b is None:
+        return b if a is None else a
+    return min(a, b)
+
+
+class TimeSeriesView:
+    """
+    A view of the samples of a time series in a (closed) time window.
+
+    Creating or slicing a view reads no samples. The first operation that needs samples reads the raw sample
+    arrays in the window of this view (see `BaseTimeSeriesAdapter.sample_arrays()`); this view keeps those
+    arrays so that later operations on the same view read no samples. Each operation calculates its result
+    directly from the raw sample arrays. For example, the maximum pressure during a stage is calculated by
+
+    > pressure_curve.view()[stage.start_time:stage.stop_time].max()
+
+    Note that a view limits the samples converted to `pandas` and those kept by the view, but not the samples
+    converted by .NET. The Orchid SDK converts **all** the samples of the curve to arrays before this view
+    selects those in its window. (A `time_series_cache.TimeSeriesCache` avoids repeating that conversion for
+    other views of the same curve.)
+    """
+
+    def __init__(self, time_series, start: Optional[pendulum.DateTime] = None,
+                 stop: Optional[pendulum.DateTime] = None):
+        """
+        Construct an instance viewing the samples of `time_series` from `start` to `stop`.
+
+        Args:
+            time_series: The time series (typically, a `BaseTimeSeriesAdapter`) to view.
+            start: The earliest time of a viewed sample. If `None`, start with the first sample.
+            stop: The latest time of a viewed sample. If `None`, stop with the last sample.
+        """
+        self._time_series = time_series
+        self._start = start
+        self._stop = stop
+        self._sample_arrays = None
+
+    @property
+    def name(self) -> str:
+        """The name of the viewed time series."""
+        return self._time_series.name
+
+    @property
+    def start(self) -> Optional[pendulum.DateTime]:
+        """The earliest time of a viewed sample (or `None` if viewing from the first sample)."""
+        return self._start
+
+    @property
+    def stop(self) -> Optional[pendulum.DateTime]:
+        """The latest time of a viewed sample (or `None` if viewing to the last sample)."""
+        return self._stop
+
+    @deal.pre(lambda _self, key: isinstance(key, slice) and key.step is None)
+    def __getitem__(self, key: slice) -> 'TimeSeriesView':
+        """
+        Narrow this view to the samples from `key.start` to `key.stop` (both inclusive).
+
+        Args:
+            key: The slice of times; for example, `view[stage.start_time:stage.stop_time]`.
+
+        Returns:
+            A new view of the samples in both this view and the slice.
+        """
+        return TimeSeriesView(self._time_series, _later(self._start, key.start), _earlier(self._stop, key.stop))
+
+    def sample_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read the raw sample arrays in this view.
+
+        This method reads the arrays from the viewed time series only once; later calls return the same arrays.
+
+        Returns:
+            A tuple of the `int64` Unix time stamps (in seconds) and of the magnitudes of the viewed samples.
+        """
+        if self._sample_arrays is None:
+            self._sample_arrays = self._time_series.sample_arrays(self._start, self._stop)
+        return self._sample_arrays
+
+    def data_points(self) -> pd.Series:
+        """
+        Read the samples in this view.
+
+        Returns:
+            The `pandas` time `Series` of the viewed samples.
+        """
+        return self._time_series.data_points(start=self._start, stop=self._stop)
+
+    def max(self) -> float:
+        """
+        Calculate the maximum magnitude of the samples in this view.
+
+        Returns:
+            The maximum magnitude or `NaN` if this view has no samples.
+        """
+        _, magnitudes = self.sample_arrays()
+        return float(np.max(magnitudes)) if len(magnitudes) > 0 else np.nan
+
+    def mean(self) -> float:
+        """
+        Calculate the mean magnitude of the samples in this view.
+
+        Returns:
+            The mean magnitude or `NaN` if this view has no samples.
+        """
+        _, magnitudes = self.sample_arrays()
+        return float(np.mean(magnitudes)) if len(magnitudes) > 0 else np.nan
+
+    def argmax(self) -> Optional[pendulum.DateTime]:
+        """
+        Find the time of the sample with the maximum magnitude in this view.
+
+        Returns:
+            The (UTC) time of the (first) sample with the maximum magnitude or `None` if this view has no samples.
+        """
+        unix_time_stamps, magnitudes = self.sample_arrays()
+        if len(magnitudes) == 0:
+            return None
+        return pendulum.from_timestamp(int(unix_time_stamps[np.argmax(magnitudes)]), tz='UTC')
+
+    def integrate(self) -> float:
+        """
+        Integrate the magnitudes of the samples in this view over time using the trapezoidal rule.
+
+        For example, integrating a slurry rate curve (in barrels per minute) results in a volume. Because this
+        method measures time in seconds, the result, in this example, is in "barrel-seconds per minute"; that is,
+        60 times the volume in barrels.
+
+        Returns:
+            The integral (in units of magnitude times seconds) or 0.0 if this view has fewer than two samples.
+        """
+        unix_time_stamps, magnitudes = self.sample_arrays()
+        if len(magnitudes) < 2:
+            return 0.0
+        return float(np.sum((magnitudes[1:] + magnitudes[:-1]) * np.diff(unix_time_stamps)) / 2.0)
+
+    def resample(self, freq: Union[str, dt.timedelta, pd.Timedelta] = '1min', how: str = 'mean') -> pd.Series:
+        """
+        Resample the samples in this view onto a regular time grid.
+
+        Args:
+            freq: The interval between grid points. See `orchid.align_time_series`.
+            how: The method used to calculate the value at each grid point. See `orchid.align_time_series`.
+
+        Returns:
+            The `pandas` time `Series` of resampled values indexed by the (UTC) grid times.
+        """
+        return tsa.align_time_series([self], freq=freq, how=how).iloc[:, 0]
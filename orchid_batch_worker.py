@@ -0,0 +1,68 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""
+The main loop of the worker processes started by `orchid.batch.map_projects()`.
+
+The worker processes are started using the "spawn" method; each one imports the module defining its main loop.
+Importing the `orchid` package initializes .NET. Consequently, this module is **not** part of that package and
+imports nothing from it unless the worker must load projects using `orchid.load_project()`.
+"""
+
+import multiprocessing.connection
+import traceback
+from typing import Callable, Optional
+
+
+def run_worker(connection: multiprocessing.connection.Connection, func: Callable, load: Optional[Callable]):
+    """
+    Analyze each project path received on `connection` until receiving `None`.
+
+    Args:
+        connection: The worker end of the pipe connecting this worker to `orchid.batch.map_projects()`.
+        func: The analysis function called with each loaded project.
+        load: The function to load a project from its path. If `None`, use `orchid.load_project`.
+    """
+    if load is None:
+        # Only this case imports `orchid` (and, therefore, initializes .NET), once per worker process.
+        import orchid
+        load = orchid.load_project
+        session = orchid.session()
+    else:
+        session = _NullSession()
+
+    with session:
+        while True:
+            project_pathname = connection.recv()
+            if project_pathname is None:
+                return
+
+            try:
+                project = load(project_pathname)
+                value = func(project)
+                del project
+                connection.send((project_pathname, value, None))
+            except Exception:
+                connection.send((project_pathname, None, traceback.format_exc()))
+
+
+class _NullSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return
@@ -0,0 +1,157 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""
+The typing of the columns of .NET `DataTable` instances and the assembly of `pandas` `DataFrame` instances.
+
+`orchid.native_data_frame_adapter` copies the cells of each .NET column (in the process hosting .NET) into a
+`ColumnBuffer`; that is, into picklable values that are not yet typed (for example, a `numpy` array of .NET
+ticks). The functions of this module type those buffers and assemble `DataFrame` instances in any process; for
+example, in the worker processes started by `orchid.native_data_frame_adapter.all_pandas_data_frames()`.
+
+These worker processes are started using the "spawn" method; each one imports the module defining the functions
+that it calls. Importing the `orchid` package initializes .NET. Consequently, this module is **not** part of that
+package and imports nothing from it.
+"""
+
+import dataclasses
+import uuid
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import pandas as pd
+import pendulum
+import toolz.curried as toolz
+
+
+NANOSECONDS_PER_TICK = 100
+UNIX_EPOCH_TICKS = 621355968000000000  # The ticks of `DateTime(1970, 1, 1)`
+
+_NANOSECONDS_PER_MICROSECOND = 1000
+_TICKS_PER_MICROSECOND = 10
+_TICKS_PER_MILLISECOND = 10000
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class ColumnBuffer:
+    """
+    The values of a single .NET column copied into picklable Python objects but not yet typed.
+
+    Attributes:
+        typer: The function of `values` and `is_missing` returning the typed array. (To be picklable, this
+        function must be defined at the top level of this module.)
+        values: The copied values; for example, a `numpy` array of .NET ticks.
+        is_missing: The boolean mask identifying the missing (null or sentinel) values.
+    """
+    typer: Callable[[Any, np.ndarray], Any]
+    values: Any
+    is_missing: np.ndarray
+
+    def to_array(self):
+        """
+        Type the values of this buffer.
+
+        Returns:
+            A `numpy` array, a `pandas` extension array or (for a column converted cell by cell) a `list`.
+        """
+        return self.typer(self.values, self.is_missing)
+
+
+def assemble_data_frame(column_names: Sequence[str], column_buffers: Sequence[ColumnBuffer]) -> pd.DataFrame:
+    """
+    Type the buffers of all the columns of a .NET `DataTable` and assemble the resulting `pandas` `DataFrame`.
+
+    Args:
+        column_names: The names of the columns in column order.
+        column_buffers: The buffer of each column in column order.
+
+    Returns:
+        The `pandas` `DataFrame`; an empty `DataFrame` if `column_buffers` is empty.
+    """
+    if not column_buffers:
+        return pd.DataFrame()
+
+    return pd.DataFrame(data={name: column_buffer.to_array()
+                              for name, column_buffer in zip(column_names, column_buffers)},
+                        columns=list(column_names),
+                        index=pd.RangeIndex(0, len(column_buffers[0].is_missing)))
+
+
+def values_array(values, _is_missing):
+    # The values were typed when copied.
+    return values
+
+
+def missing_values_array(_values, is_missing: np.ndarray) -> np.ndarray:
+    # Consistent with `pandas` inference, a column containing **only** missing values has `object` dtype.
+    return np.full(len(is_missing), None, dtype=object)
+
+
+def _nanoseconds_to_array(nanoseconds: np.ndarray, is_nat: np.ndarray, dtype):
+    with_nat = np.where(is_nat, np.iinfo(np.int64).min, nanoseconds)
+    return with_nat.view(dtype)
+
+
+def date_time_offset_array(utc_ticks: np.ndarray, is_nat: np.ndarray):
+    # Consistent with `orchid.net_date_time.as_date_time`, truncate the .NET time point to an integral number of
+    # milliseconds.
+    millisecond_ticks = utc_ticks - utc_ticks % _TICKS_PER_MILLISECOND
+    unix_nanoseconds = (millisecond_ticks - UNIX_EPOCH_TICKS) * NANOSECONDS_PER_TICK
+    return toolz.pipe(_nanoseconds_to_array(unix_nanoseconds, is_nat, 'datetime64[ns]'),
+                      lambda ts: pd.to_datetime(ts, utc=True),
+                      lambda ts: ts.tz_convert(pendulum.UTC),
+                      lambda ts: ts.array)
+
+
+def time_span_array(ticks: np.ndarray, is_nat: np.ndarray):
+    # Consistent with `orchid.net_date_time.as_duration`, round the .NET time span to the nearest microsecond
+    # (rounding half to even).
+    quotient, remainder = np.divmod(ticks, _TICKS_PER_MICROSECOND)
+    microseconds = (quotient +
+                    (remainder > _TICKS_PER_MICROSECOND // 2) +
+                    ((remainder == _TICKS_PER_MICROSECOND // 2) & (quotient % 2 == 1)))
+    nanoseconds = microseconds * _NANOSECONDS_PER_MICROSECOND
+    return pd.array(_nanoseconds_to_array(nanoseconds, is_nat, 'timedelta64[ns]'), dtype='timedelta64[ns]')
+
+
+def guid_array(guid_bytes: np.ndarray, is_null: np.ndarray) -> np.ndarray:
+    result = guid_bytes_to_uuids(guid_bytes)
+    result[is_null] = None
+    return result
+
+
+def guid_bytes_to_uuids(guid_bytes: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of 16-byte values to `uuid.UUID` instances.
+
+    The 16-byte values are typically the result of `orchid.native_data_frame_adapter.net_guids_to_bytes()`.
+
+    Callers that only compare or join object IDs need not perform this conversion at all; those that need
+    `uuid.UUID` instances can convert only the values that they actually use. This function creates a single
+    `uuid.UUID` instance for each distinct value of `guid_bytes` and shares that instance among all the items
+    having that value.
+
+    Args:
+        guid_bytes: The `V16` array to convert.
+
+    Returns:
+        The `numpy` array (of `object` dtype) of `uuid.UUID` instances.
+    """
+    distinct_values, distinct_value_nos = np.unique(guid_bytes, return_inverse=True)
+    distinct_uuids = np.empty(len(distinct_values), dtype=object)
+    distinct_uuids[:] = [uuid.UUID(bytes=value.tobytes()) for value in distinct_values]
+    return distinct_uuids[distinct_value_nos.reshape(-1)]
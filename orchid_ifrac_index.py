@@ -0,0 +1,124 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+"""
+Read summary metadata from `.ifrac` files without .NET.
+
+An `.ifrac` file is a zip archive containing the JSON document, `project.json`. The functions in this module read
+that document directly from the archive, parsing it (using `ijson`) incrementally as it streams out of the archive
+so that they never hold the entire (possibly very large) document in memory.
+
+Importing the `orchid` package initializes .NET. Consequently, this module is **not** part of that package and
+imports nothing from it; it neither loads the Orchid assemblies nor reads the project using .NET.
+"""
+
+import dataclasses
+import pathlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import zipfile
+
+import ijson
+
+
+PROJECT_DOCUMENT_NAME = 'project.json'
+"""The name of the JSON document (in an `.ifrac` archive) describing the project."""
+
+_OBJECT_PREFIX = 'Object'
+_WELL_PREFIX = 'Object.Wells.item'
+_STAGE_PREFIX = 'Object.Wells.item.Stages.item'
+
+# The serialized JSON may wrap the items of an array in an object with a `$values` member (when preserving
+# references). Removing this member from each prefix allows a single set of prefixes to match both forms.
+_VALUES_MEMBER = '.$values'
+
+ParseEvent = Tuple[str, str, Any]
+"""An `ijson` parse event: the prefix (path) of the event, the event name and the (scalar) value."""
+
+
+@dataclasses.dataclass(frozen=True)
+class WellSummary:
+    name: Optional[str]
+    stage_count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class IfracSummary:
+    path: pathlib.Path
+    name: Optional[str]
+    properties: Dict[str, Any]
+    """The scalar (string, number, boolean and null) members of the serialized project object."""
+    wells: List[WellSummary]
+
+
+def read_summary(ifrac_pathname: Union[str, pathlib.Path]) -> IfracSummary:
+    """
+    Read the summary metadata of the project stored in an `.ifrac` file.
+
+    Args:
+        ifrac_pathname: The path of the `.ifrac` file.
+
+    Returns:
+        The name and scalar properties of the project and the names and stage counts of its wells.
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a zip archive.
+        KeyError: If the archive contains no `project.json` document.
+    """
+    ifrac_path = pathlib.Path(ifrac_pathname)
+    with zipfile.ZipFile(ifrac_path) as archive:
+        with archive.open(PROJECT_DOCUMENT_NAME) as project_document:
+            return _summarize(ifrac_path, ijson.parse(project_document, use_float=True))
+
+
+def read_summaries(ifrac_pathnames: Iterable[Union[str, pathlib.Path]]) -> Iterator[IfracSummary]:
+    """
+    Read the summary metadata of the projects stored in many `.ifrac` files, one file at a time.
+
+    Args:
+        ifrac_pathnames: The paths of the `.ifrac` files; for example, `pathlib.Path(archive).rglob('*.ifrac')`.
+
+    Returns:
+        An iterator over the summaries of the projects (in the order of `ifrac_pathnames`).
+    """
+    for ifrac_pathname in ifrac_pathnames:
+        yield read_summary(ifrac_pathname)
+
+
+def _summarize(ifrac_path: pathlib.Path, events: Iterable[ParseEvent]) -> IfracSummary:
+    properties = {}
+    wells = []
+    well_name = None
+    stage_count = 0
+    for prefix, event, value in events:
+        prefix = prefix.replace(_VALUES_MEMBER, '')
+        parent, _, member = prefix.rpartition('.')
+        if event == 'start_map' and prefix == _WELL_PREFIX:
+            well_name, stage_count = None, 0
+        elif event == 'end_map' and prefix == _WELL_PREFIX:
+            wells.append(WellSummary(well_name, stage_count))
+        elif event == 'start_map' and prefix == _STAGE_PREFIX:
+            stage_count += 1
+        elif _is_scalar_event(event) and parent == _OBJECT_PREFIX:
+            properties[member] = value
+        elif _is_scalar_event(event) and prefix == f'{_WELL_PREFIX}.Name':
+            well_name = value
+
+    return IfracSummary(ifrac_path, properties.get('Name'), properties, wells)
+
+
+def _is_scalar_event(event: str) -> bool:
+    return event in ('string', 'number', 'boolean', 'null')
@@ -31,6 +31,9 @@ from orchid import (
 
 from tests import stub_net as tsn
 
+# noinspection PyUnresolvedReferences
+from System import Array, Double, Int64
+
 
 class StubBaseTimeSeriesAdapter(bca.BaseTimeSeriesAdapter):
     def __init__(self, adaptee=None, net_project_callable=None):
@@ -53,7 +56,7 @@ class TestBaseCurveAdapter(unittest.TestCase):
 
         with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                                  spec=loader.as_python_time_series_arrays,
-                                 return_value=tsn.StubPythonTimesSeriesArraysDto((), ())):
+                                 return_value=tsn.StubPythonTimesSeriesArraysDto(Array[Double]([]), Array[Int64]([]))):
             actual_data_points = sut.data_points()
         assert_that(actual_data_points.empty, is_(True))
 
@@ -71,6 +74,117 @@ class TestBaseCurveAdapter(unittest.TestCase):
         sample_values = (16.12, -90.80, -27.59,)
         assert_equal_data_points(name, object_id, sample_values, start_time)
 
+    def test_net_arrays_data_points_time_series(self):
+        sample_values = [-149.037, 16.12, -90.80]
+        unix_time_stamps = [1556645814, 1556645815, 1556645816]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'vena')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=tsn.StubPythonTimesSeriesArraysDto(Array[Double](sample_values),
+                                                                                 Array[Int64](unix_time_stamps))):
+            actual_data_points = sut.data_points()
+
+        expected_data_points = pd.Series(data=sample_values,
+                                         index=pd.DatetimeIndex(np.array(unix_time_stamps, dtype='datetime64[s]'),
+                                                                tz='UTC'),
+                                         name='vena')
+        pdt.assert_series_equal(actual_data_points, expected_data_points)
+
+    def test_windowed_data_points_time_series(self):
+        start_time = pendulum.parse('2021-02-28T13:15:01Z')
+        sample_values = [16.12, -90.80, -27.59, 149.04, 53.83]
+        unix_time_stamps = [int(start_time.add(seconds=offset).timestamp()) for offset in range(len(sample_values))]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'fenestra')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+
+        for start, stop, expected_values in [
+            (start_time.add(seconds=1), start_time.add(seconds=3), sample_values[1:4]),
+            (start_time.add(seconds=1, microseconds=1), None, sample_values[2:]),
+            (None, start_time.add(seconds=1, microseconds=999999), sample_values[:2]),
+            (start_time.add(seconds=3), start_time.add(seconds=1), []),
+        ]:
+            with self.subTest(f'Data points from {start} to {stop}'):
+                with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                         spec=loader.as_python_time_series_arrays,
+                                         return_value=tsn.StubPythonTimesSeriesArraysDto(
+                                             Array[Double](sample_values), Array[Int64](unix_time_stamps))):
+                    actual_data_points = sut.data_points(start=start, stop=stop)
+
+                assert_that(actual_data_points.tolist(), equal_to(expected_values))
+
+    def test_decimated_data_points_time_series(self):
+        start_time = pendulum.parse('2021-02-28T13:15:01Z')
+        sample_values = [0.0, 1.0, 9.0, 1.0, 0.0, -1.0, -9.0, -1.0, 0.0, 1.0]
+        unix_time_stamps = [int(start_time.add(seconds=offset).timestamp()) for offset in range(len(sample_values))]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'decimatio')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+
+        for method in ['minmax', 'lttb']:
+            with self.subTest(f'Decimate data points using "{method}"'):
+                with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                         spec=loader.as_python_time_series_arrays,
+                                         return_value=tsn.StubPythonTimesSeriesArraysDto(
+                                             Array[Double](sample_values), Array[Int64](unix_time_stamps))):
+                    actual_data_points = sut.data_points(max_points=4, method=method)
+
+                assert_that(len(actual_data_points), equal_to(4))
+                assert_that(actual_data_points.max(), equal_to(9.0))
+                assert_that(actual_data_points.min(), equal_to(-9.0))
+
+    def test_data_points_in_time_range_includes_end_points(self):
+        start_time = pendulum.parse('2019-04-30T17:36:54Z')
+        sample_values = [-149.037, 16.12, -90.80, -27.59]
+        unix_time_stamps = [int(start_time.add(seconds=offset).timestamp()) for offset in range(len(sample_values))]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'spatium')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=tsn.StubPythonTimesSeriesArraysDto(Array[Double](sample_values),
+                                                                                 Array[Int64](unix_time_stamps))):
+            actual_data_points = sut.data_points_in_time_range(pendulum.period(start_time.add(seconds=1),
+                                                                               start_time.add(seconds=2)))
+
+        assert_that(actual_data_points.tolist(), equal_to(sample_values[1:3]))
+
+    def test_data_points_in_unit_converts_magnitudes(self):
+        start_time = pendulum.parse('2019-04-30T17:36:54Z')
+        sample_values = [-40.0, 32.0, 212.0]
+        unix_time_stamps = [int(start_time.add(seconds=offset).timestamp()) for offset in range(len(sample_values))]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'calor')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+        sut.sampled_quantity_unit = unittest.mock.MagicMock(name='stub_sampled_quantity_unit',
+                                                            return_value=units.UsOilfield.TEMPERATURE)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=tsn.StubPythonTimesSeriesArraysDto(Array[Double](sample_values),
+                                                                                 Array[Int64](unix_time_stamps))):
+            actual_data_points = sut.data_points(in_unit=units.Metric.TEMPERATURE)
+
+        np.testing.assert_allclose(actual_data_points.to_numpy(), [-40.0, 0.0, 100.0], atol=1e-12)
+        assert_that(actual_data_points.name, equal_to('calor'))
+
+    def test_data_points_and_compact_data_points_with_float32_magnitudes(self):
+        start_time = pendulum.parse('2019-04-30T17:36:54Z')
+        sample_values = [-149.037, 16.12, -90.80, -27.59]
+        unix_time_stamps = [int(start_time.add(seconds=offset).timestamp()) for offset in range(len(sample_values))]
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_D, 'parvus')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=tsn.StubPythonTimesSeriesArraysDto(Array[Double](sample_values),
+                                                                                 Array[Int64](unix_time_stamps))):
+            actual_data_points = sut.data_points(dtype=np.float32)
+            actual_compact_data_points = sut.compact_data_points()
+
+        assert_that(actual_data_points.dtype, equal_to(np.float32))
+        assert_that(actual_compact_data_points.interval, equal_to(1))
+        pdt.assert_series_equal(actual_compact_data_points.to_series(), actual_data_points)
+
     @unittest.mock.patch('orchid.dot_net_dom_access.IdentifiedDotNetAdapter.expect_project_units',
                          name='stub_expect_project_units',
                          new_callable=unittest.mock.PropertyMock)
@@ -134,8 +248,8 @@ def assert_equal_data_points(name, object_id, sample_values, start_time):
         toolz.map(lambda dt: int(dt.timestamp())),
         list,
     )
-    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(sample_values,
-                                                                            stub_unix_time_stamps)
+    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(Array[Double](list(sample_values)),
+                                                                            Array[Int64](stub_unix_time_stamps))
     with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                              spec=loader.as_python_time_series_arrays,
                              return_value=stub_python_time_series_arrays_dto):
@@ -0,0 +1,99 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import os
+import pathlib
+import subprocess
+import sys
+import time
+import unittest
+
+import deal
+from hamcrest import assert_that, equal_to, calling, raises, contains_inanyorder, has_length
+
+from orchid import batch
+import orchid_batch_worker
+
+
+# Worker processes are started using "spawn"; therefore, these stubs must be defined at the top level.
+def stub_load(project_pathname):
+    if project_pathname == 'ruptus':
+        os._exit(3)
+    return project_pathname
+
+
+def stub_analyze(project):
+    if project == 'lentus':
+        time.sleep(30)
+    if project == 'malus':
+        raise ValueError(project)
+    return project.upper()
+
+
+def _by_name(results):
+    return {result.path.name: result for result in results}
+
+
+# Test ideas
+# - Results of all projects streamed back
+# - Exception raised by analysis reported for that project only
+# - Analysis exceeding timeout reported as timed out
+# - Worker process exiting reported for that project only
+# - Non-positive processes or timeout raises error
+# - Importing the worker module does not import the `orchid` package (and so does not initialize .NET)
+class TestBatch(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_map_projects_returns_result_of_each_project(self):
+        actual = list(batch.map_projects(['alpha', 'beta', 'gamma'], stub_analyze, processes=2, load=stub_load))
+
+        assert_that([(r.path, r.value, r.succeeded) for r in actual],
+                    contains_inanyorder((pathlib.Path('alpha'), 'ALPHA', True),
+                                        (pathlib.Path('beta'), 'BETA', True),
+                                        (pathlib.Path('gamma'), 'GAMMA', True)))
+
+    def test_map_projects_reports_failures_per_project(self):
+        actual = _by_name(batch.map_projects(['alpha', 'malus', 'lentus', 'ruptus', 'beta'], stub_analyze,
+                                             processes=2, timeout=5, load=stub_load))
+
+        assert_that(actual, has_length(5))
+        assert_that(actual['alpha'].value, equal_to('ALPHA'))
+        assert_that(actual['beta'].value, equal_to('BETA'))
+        assert_that('ValueError: malus' in actual['malus'].error, equal_to(True))
+        assert_that((actual['lentus'].succeeded, actual['lentus'].timed_out), equal_to((False, True)))
+        assert_that((actual['ruptus'].succeeded, actual['ruptus'].timed_out), equal_to((False, False)))
+
+    def test_non_positive_processes_or_timeout_raises_error(self):
+        for kwargs in [{'processes': 0}, {'timeout': 0}]:
+            with self.subTest(f'Map projects with {kwargs}'):
+                assert_that(calling(lambda: list(batch.map_projects(['alpha'], stub_analyze, load=stub_load,
+                                                                    **kwargs))),
+                            raises(deal.PreContractError))
+
+    def test_import_worker_module_does_not_import_orchid_package(self):
+        completed = subprocess.run([sys.executable, '-c',
+                                    'import sys; import orchid_batch_worker; print("orchid" in sys.modules)'],
+                                   cwd=pathlib.Path(orchid_batch_worker.__file__).parent, capture_output=True,
+                                   text=True, check=True)
+
+        assert_that(completed.stdout.strip(), equal_to('False'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+
+from hamcrest import assert_that, equal_to, is_, none
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from orchid import compact_time_series as cts
+
+
+START_UNIX_SECONDS = 1612137600  # 2021-02-01T00:00:00Z
+
+
+# Test ideas
+# - Regularly sampled series stores an interval and no offsets
+# - Irregularly sampled series stores int32 offsets
+# - Series spanning more than the int32 range stores int64 offsets
+# - Expanding a compact series produces the same time series as the sample arrays
+# - Empty series expands to an empty time series
+# - Series with equal samples are equal
+class TestCompactTimeSeries(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_regularly_sampled_series_stores_interval(self):
+        unix_time_stamps = np.arange(5, dtype=np.int64) * 30 + START_UNIX_SECONDS
+        sut = cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, np.arange(5.0), 'regularis')
+
+        assert_that(sut.interval, equal_to(30))
+        assert_that(sut.offsets, is_(none()))
+        assert_that(sut.magnitudes.dtype, equal_to(np.float32))
+        np.testing.assert_array_equal(sut.unix_time_stamps(), unix_time_stamps)
+
+    def test_irregularly_sampled_series_stores_int32_offsets(self):
+        unix_time_stamps = np.array([0, 1, 3, 7], dtype=np.int64) + START_UNIX_SECONDS
+        sut = cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, np.arange(4.0), 'irregularis')
+
+        assert_that(sut.interval, is_(none()))
+        assert_that(sut.offsets.dtype, equal_to(np.int32))
+        assert_that(sut.nbytes, equal_to(4 * 4 + 4 * 4))
+        np.testing.assert_array_equal(sut.unix_time_stamps(), unix_time_stamps)
+
+    def test_very_long_series_stores_int64_offsets(self):
+        unix_time_stamps = np.array([0, 1, 2 ** 32], dtype=np.int64)
+        sut = cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, np.arange(3.0), 'longus')
+
+        assert_that(sut.offsets.dtype, equal_to(np.int64))
+        np.testing.assert_array_equal(sut.unix_time_stamps(), unix_time_stamps)
+
+    def test_to_series_expands_sample_times(self):
+        unix_time_stamps = np.array([0, 1, 3, 7], dtype=np.int64) + START_UNIX_SECONDS
+        magnitudes = np.array([16.12, -90.80, -27.59, 149.04])
+        sut = cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, magnitudes, 'expansio', np.float64)
+
+        expected = pd.Series(data=magnitudes, index=pd.DatetimeIndex(unix_time_stamps.view('datetime64[s]'),
+                                                                     tz='UTC'),
+                             name='expansio')
+        pdt.assert_series_equal(sut.to_series(), expected)
+
+    def test_empty_series_expands_to_empty_time_series(self):
+        sut = cts.CompactTimeSeries.from_sample_arrays(np.empty(0, dtype=np.int64), np.empty(0), 'vacuus')
+
+        assert_that(len(sut), equal_to(0))
+        assert_that(sut.to_series().empty, is_(True))
+
+    def test_series_with_equal_samples_are_equal(self):
+        unix_time_stamps = np.array([0, 1, 3, 7], dtype=np.int64) + START_UNIX_SECONDS
+        magnitudes = np.array([16.12, np.nan, -27.59, 149.04])
+        sut = cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, magnitudes, 'aequalis')
+
+        assert_that(sut == cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, magnitudes, 'aequalis'),
+                    is_(True))
+        assert_that(sut == cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps, magnitudes * 2, 'aequalis'),
+                    is_(False))
+        assert_that(sut == cts.CompactTimeSeries.from_sample_arrays(unix_time_stamps[:3] + np.array([0, 1, 2]),
+                                                                    magnitudes[:3], 'aequalis'),
+                    is_(False))
+
+
+if __name__ == '__main__':
+    unittest.main()
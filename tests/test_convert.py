@@ -18,7 +18,8 @@
 import decimal
 import unittest
 
-from hamcrest import assert_that, equal_to
+from hamcrest import assert_that, equal_to, close_to
+import numpy as np
 import toolz.curried as toolz
 
 from orchid import (
@@ -35,6 +36,7 @@ DONT_CARE_MAGNITUDE = 3.14159265
 
 # Test ideas
 # - source and target not same physical quantity
+# - magnitudes_to_unit agrees with to_unit for every pair of units measuring the same physical quantity
 class TestConvert(unittest.TestCase):
     """Implements the unit tests for the orchid.convert module."""
     def test_canary(self):
@@ -70,6 +72,29 @@ class TestConvert(unittest.TestCase):
                 expected = units.make_measurement(target_unit, target_magnitude)
                 tcm.assert_that_measurements_close_to(actual, expected, tolerance)
 
+    def test_linear_conversion_of_temperature_has_offset(self):
+        scale, offset = oc.linear_conversion(units.UsOilfield.TEMPERATURE, units.Metric.TEMPERATURE)
+
+        assert_that(scale, close_to(5.0 / 9.0, 1e-12))
+        assert_that(offset, close_to(-160.0 / 9.0, 1e-12))
+
+    def test_linear_conversion_of_pressure_has_no_offset(self):
+        scale, offset = oc.linear_conversion(units.Metric.PRESSURE, units.UsOilfield.PRESSURE)
+
+        assert_that(scale, close_to(0.1450377, 1e-7))
+        assert_that(offset, equal_to(0.0))
+
+    def test_magnitudes_to_unit_agrees_with_to_unit(self):
+        source_magnitudes = np.array([-40.0, 0.0, 156.6, 9347.1])
+        for source_unit, target_unit in zip(toolz.concatv(units.UsOilfield, units.Metric),
+                                            toolz.concatv(units.Metric, units.UsOilfield)):
+            with self.subTest(f'Converting magnitudes in {source_unit} to {target_unit}'):
+                actual = oc.magnitudes_to_unit(target_unit, source_unit, source_magnitudes)
+
+                expected = [oc.to_unit(target_unit, units.make_measurement(source_unit, m)).magnitude
+                            for m in source_magnitudes]
+                np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
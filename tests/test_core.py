@@ -15,12 +15,15 @@
 # This file is part of Orchid and related technologies.
 #
 
+import threading
 import unittest
+import unittest.mock
 
 import deal
-from hamcrest import assert_that, equal_to, is_, calling, raises
+from hamcrest import assert_that, equal_to, is_, calling, raises, same_instance
 
 import orchid
+from orchid import core
 
 
 class TestCoreLoadProject(unittest.TestCase):
@@ -37,5 +40,61 @@ class TestCoreLoadProject(unittest.TestCase):
         assert_that(calling(orchid.load_project).with_args('\t'), raises(deal.PreContractError))
 
 
+
+# Test ideas
+# - Async load returns a future whose result is the loaded project
+# - Async load reports progress in order
+# - Async load failure reported by the future and by progress
+# - Queued async load can be cancelled
+@unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+class TestCoreLoadProjectAsync(unittest.TestCase):
+    def test_canary(self, _stub_script_adapter):
+        assert_that(2 + 2, is_(equal_to(4)))
+
+    def test_whitespace_pathname_load_project_async_raises_exception(self, _stub_script_adapter):
+        assert_that(calling(orchid.load_project_async).with_args('\t'), raises(deal.PreContractError))
+
+    def test_load_project_async_result_is_loaded_project_and_reports_progress(self, _stub_script_adapter):
+        stub_project = unittest.mock.MagicMock(name='stub_project')
+        progress = []
+        with unittest.mock.patch('orchid.core._load_project', return_value=stub_project):
+            future = orchid.load_project_async(' fictus.ifrac ', lambda p, s: progress.append((p, s)))
+            actual = future.result(timeout=5)
+
+        assert_that(actual, is_(same_instance(stub_project)))
+        assert_that(progress, equal_to([('fictus.ifrac', core.LoadProgress.QUEUED),
+                                        ('fictus.ifrac', core.LoadProgress.LOADING),
+                                        ('fictus.ifrac', core.LoadProgress.LOADED)]))
+
+    def test_load_project_async_reports_failure(self, _stub_script_adapter):
+        progress = []
+        with unittest.mock.patch('orchid.core._load_project', side_effect=FileNotFoundError('absens.ifrac')):
+            future = orchid.load_project_async('absens.ifrac', lambda _, s: progress.append(s))
+
+            assert_that(calling(future.result).with_args(timeout=5), raises(FileNotFoundError))
+        assert_that(progress[-1], equal_to(core.LoadProgress.FAILED))
+
+    def test_queued_load_project_async_can_be_cancelled(self, _stub_script_adapter):
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_load(_pathname):
+            loading.set()
+            release.wait(5)
+            return unittest.mock.MagicMock(name='stub_project')
+
+        progress = []
+        with unittest.mock.patch('orchid.core._load_project', side_effect=slow_load):
+            running = orchid.load_project_async('lentus.ifrac')
+            loading.wait(5)
+            queued = orchid.load_project_async('exspectans.ifrac', lambda _, s: progress.append(s))
+
+            assert_that(queued.cancel(), equal_to(True))
+            release.set()
+            running.result(timeout=5)
+
+        assert_that(progress, equal_to([core.LoadProgress.QUEUED, core.LoadProgress.CANCELLED]))
+
+
 if __name__ == '__main__':
     unittest.main()
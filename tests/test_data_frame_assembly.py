@@ -0,0 +1,86 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import pathlib
+import pickle
+import subprocess
+import sys
+import unittest
+import uuid
+
+from hamcrest import assert_that, equal_to
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+import orchid_data_frame_assembly as dfas
+
+
+# Test ideas
+# - Assembled data frame has typed columns in column order
+# - Assembled data frame of no columns is empty
+# - Buffers survive pickling
+# - Time span ticks round half to even microsecond
+# - Importing the module does not import the `orchid` package (and so does not initialize .NET)
+class TestDataFrameAssembly(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_assemble_data_frame_types_each_column_in_column_order(self):
+        signum = uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d')
+        column_buffers = [
+            dfas.ColumnBuffer(dfas.values_array, np.array([1.5, np.nan]), np.array([False, True])),
+            dfas.ColumnBuffer(dfas.guid_array, np.array([signum.bytes, bytes(16)], dtype='V16'),
+                              np.array([False, True])),
+            dfas.ColumnBuffer(dfas.missing_values_array, None, np.array([True, True])),
+        ]
+
+        actual = dfas.assemble_data_frame(['pondus', 'signum', 'vacuus'], column_buffers)
+
+        pdt.assert_frame_equal(actual, pd.DataFrame(data={'pondus': [1.5, np.nan],
+                                                          'signum': [signum, None],
+                                                          'vacuus': [None, None]}))
+
+    def test_assemble_data_frame_of_no_columns_is_empty(self):
+        pdt.assert_frame_equal(dfas.assemble_data_frame([], []), pd.DataFrame())
+
+    def test_column_buffer_of_ticks_survives_pickling(self):
+        # 1 January 2023 00:00:00.123 UTC (plus 4567 ticks truncated to milliseconds)
+        utc_ticks = np.array([638081280001234567, 0])
+        sut = dfas.ColumnBuffer(dfas.date_time_offset_array, utc_ticks, np.array([False, True]))
+
+        actual = pickle.loads(pickle.dumps(sut)).to_array()
+
+        assert_that(list(pd.Series(actual).astype(str)), equal_to(['2023-01-01 00:00:00.123000+00:00', 'NaT']))
+
+    def test_time_span_array_rounds_half_to_even_microsecond(self):
+        actual = dfas.time_span_array(np.array([14, 15, 25, 26]), np.zeros(4, dtype=bool))
+
+        assert_that(list(pd.Series(actual).dt.microseconds), equal_to([1, 2, 2, 3]))
+
+    def test_import_module_does_not_import_orchid_package(self):
+        completed = subprocess.run([sys.executable, '-c',
+                                    'import sys; import orchid_data_frame_assembly; print("orchid" in sys.modules)'],
+                                   cwd=pathlib.Path(dfas.__file__).parent, capture_output=True,
+                                   text=True, check=True)
+
+        assert_that(completed.stdout.strip(), equal_to('False'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+import unittest
+import unittest.mock
+
+import deal
+from hamcrest import assert_that, equal_to, calling, raises, is_, is_not, same_instance
+import pandas as pd
+import pandas.testing as pdt
+
+from orchid import data_frame_cache as dfc
+
+
+def _make_data_frame(row_count):
+    return pd.DataFrame(data={'valor': [float(i) for i in range(row_count)]})
+
+
+# Test ideas
+# - Repeated access converts only once
+# - Returned data frame is a copy
+# - Least recently used data frame evicted when budget exceeded
+# - Data frame larger than budget never cached
+class TestDataFrameCache(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_ctor_non_positive_max_bytes_raises_exception(self):
+        assert_that(calling(dfc.DataFrameCache).with_args(0), raises(deal.PreContractError))
+
+    def test_repeated_get_or_convert_converts_once(self):
+        sut = dfc.DataFrameCache()
+        stub_convert = unittest.mock.MagicMock(name='stub_convert', return_value=_make_data_frame(3))
+
+        first = sut.get_or_convert('clavis', stub_convert)
+        second = sut.get_or_convert('clavis', stub_convert)
+
+        stub_convert.assert_called_once_with()
+        pdt.assert_frame_equal(first, second)
+
+    def test_get_or_convert_returns_copy(self):
+        sut = dfc.DataFrameCache()
+        stub_convert = unittest.mock.MagicMock(name='stub_convert', return_value=_make_data_frame(3))
+
+        first = sut.get_or_convert('clavis', stub_convert)
+        first.loc[0, 'valor'] = -1.0
+        second = sut.get_or_convert('clavis', stub_convert)
+
+        assert_that(second, is_not(same_instance(first)))
+        assert_that(second.loc[0, 'valor'], equal_to(0.0))
+
+    def test_least_recently_used_evicted_when_budget_exceeded(self):
+        data_frame_size = int(_make_data_frame(100).memory_usage(index=True, deep=True).sum())
+        sut = dfc.DataFrameCache(max_bytes=2 * data_frame_size)
+
+        sut.get_or_convert('primus', lambda: _make_data_frame(100))
+        sut.get_or_convert('secundus', lambda: _make_data_frame(100))
+        sut.get_or_convert('primus', lambda: _make_data_frame(100))
+        sut.get_or_convert('tertius', lambda: _make_data_frame(100))
+
+        assert_that('primus' in sut, is_(True))
+        assert_that('secundus' in sut, is_(False))
+        assert_that('tertius' in sut, is_(True))
+        assert_that(sut.current_bytes, equal_to(2 * data_frame_size))
+
+    def test_data_frame_larger_than_budget_not_cached(self):
+        sut = dfc.DataFrameCache(max_bytes=16)
+
+        actual = sut.get_or_convert('magnus', lambda: _make_data_frame(100))
+
+        pdt.assert_frame_equal(actual, _make_data_frame(100))
+        assert_that(len(sut), equal_to(0))
+
+    def test_evict_removes_data_frame(self):
+        sut = dfc.DataFrameCache()
+        sut.get_or_convert('clavis', lambda: _make_data_frame(3))
+
+        sut.evict('clavis')
+
+        assert_that('clavis' in sut, is_(False))
+        assert_that(sut.current_bytes, equal_to(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
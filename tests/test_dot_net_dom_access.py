@@ -26,7 +26,7 @@ from orchid import (
 )
 
 # noinspection PyUnresolvedReferences
-from System import DateTime, DateTimeKind, Guid
+from System import DateTime, DateTimeKind, Guid, Version
 
 
 def increment(n):
@@ -56,6 +56,20 @@ class DotNetAdapterTest(unittest.TestCase):
         assert_that(calling(dna.IdentifiedDotNetAdapter).with_args(None), raises(deal.PreContractError))
 
 
+class NetObjectIdentityTest(unittest.TestCase):
+    @staticmethod
+    def test_identities_of_same_net_object_are_equal():
+        net_object = Version(3, 14)
+
+        assert_that(dna.NetObjectIdentity(net_object), equal_to(dna.NetObjectIdentity(net_object)))
+        assert_that(hash(dna.NetObjectIdentity(net_object)), equal_to(hash(dna.NetObjectIdentity(net_object))))
+
+    @staticmethod
+    def test_identities_of_equal_but_different_net_objects_differ():
+        # `Version` overrides `Equals`; `NetObjectIdentity` must not use it.
+        assert_that(dna.NetObjectIdentity(Version(3, 14)) == dna.NetObjectIdentity(Version(3, 14)), equal_to(False))
+
+
 class IdentifiedDotNetAdapterTest(unittest.TestCase):
     @staticmethod
     def test_canary():
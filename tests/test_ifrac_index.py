@@ -0,0 +1,125 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+
+from hamcrest import assert_that, equal_to, calling, raises, is_, none
+
+import orchid_ifrac_index as ifi
+
+
+def _write_ifrac(directory, name, project_document):
+    result = pathlib.Path(directory).joinpath(name)
+    with zipfile.ZipFile(result, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(ifi.PROJECT_DOCUMENT_NAME, json.dumps(project_document))
+        archive.writestr('data.bin', b'\0' * 16)
+    return result
+
+
+PROJECT_DOCUMENT = {
+    'Object': {
+        'Name': 'frankNstein_Bakken',
+        'ProjectUnits': 'UsOilfield',
+        'Azimuth': 14.5,
+        'Wells': [
+            {'Name': 'Demo_1H', 'Stages': [{'Name': '1'}, {'Name': '2'}, {'Name': '3'}]},
+            {'Name': 'Demo_2H', 'Stages': []},
+        ],
+    },
+}
+
+
+# Test ideas
+# - Summary includes project name, scalar properties, well names and stage counts
+# - Items wrapped in `$values` members are summarized
+# - Document without wells has no well summaries
+# - Archive without project document raises error
+# - Summaries of many files read in order
+# - Importing the module does not import the `orchid` package (and so does not initialize .NET)
+class TestIfracIndex(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_summary_includes_project_and_wells(self):
+        ifrac_path = _write_ifrac(self._directory.name, 'bakken.ifrac', PROJECT_DOCUMENT)
+
+        actual = ifi.read_summary(ifrac_path)
+
+        assert_that(actual.path, equal_to(ifrac_path))
+        assert_that(actual.name, equal_to('frankNstein_Bakken'))
+        assert_that(actual.properties, equal_to({'Name': 'frankNstein_Bakken', 'ProjectUnits': 'UsOilfield',
+                                                 'Azimuth': 14.5}))
+        assert_that(actual.wells, equal_to([ifi.WellSummary('Demo_1H', 3), ifi.WellSummary('Demo_2H', 0)]))
+
+    def test_summary_of_items_wrapped_in_values_members(self):
+        project_document = {'Object': {'$id': '1', 'Name': 'referens',
+                                       'Wells': {'$id': '2', '$values': [
+                                           {'$id': '3', 'Name': 'Demo_3H',
+                                            'Stages': {'$id': '4', '$values': [{'$id': '5'}, {'$id': '6'}]}},
+                                       ]}}}
+        ifrac_path = _write_ifrac(self._directory.name, 'referens.ifrac', project_document)
+
+        actual = ifi.read_summary(ifrac_path)
+
+        assert_that(actual.name, equal_to('referens'))
+        assert_that(actual.wells, equal_to([ifi.WellSummary('Demo_3H', 2)]))
+
+    def test_summary_of_document_without_wells(self):
+        ifrac_path = _write_ifrac(self._directory.name, 'vacuus.ifrac', {'Object': {}})
+
+        actual = ifi.read_summary(ifrac_path)
+
+        assert_that(actual.name, is_(none()))
+        assert_that(actual.wells, equal_to([]))
+
+    def test_archive_without_project_document_raises_error(self):
+        ifrac_path = pathlib.Path(self._directory.name).joinpath('sine_documento.ifrac')
+        with zipfile.ZipFile(ifrac_path, 'w') as archive:
+            archive.writestr('data.bin', b'\0')
+
+        assert_that(calling(ifi.read_summary).with_args(ifrac_path), raises(KeyError))
+
+    def test_read_summaries_in_order(self):
+        ifrac_paths = [_write_ifrac(self._directory.name, f'{name}.ifrac', {'Object': {'Name': name}})
+                       for name in ['alpha', 'beta', 'gamma']]
+
+        actual = [summary.name for summary in ifi.read_summaries(ifrac_paths)]
+
+        assert_that(actual, equal_to(['alpha', 'beta', 'gamma']))
+
+    def test_import_does_not_import_orchid_package(self):
+        completed = subprocess.run([sys.executable, '-c',
+                                    'import sys; import orchid_ifrac_index; print("orchid" in sys.modules)'],
+                                   cwd=pathlib.Path(ifi.__file__).parent, capture_output=True, text=True,
+                                   check=True)
+
+        assert_that(completed.stdout.strip(), equal_to('False'))
+
+
+if __name__ == '__main__':
+    unittest.main()
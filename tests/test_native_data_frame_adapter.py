@@ -12,10 +12,13 @@
 # and may not be used in any way not expressly authorized by the Company.
 #
 
+import importlib.util
+import pathlib
+import tempfile
 import unittest
 import uuid
 
-from hamcrest import assert_that, equal_to, calling, raises
+from hamcrest import assert_that, equal_to, calling, contains_string, raises
 import pendulum
 
 import pandas as pd
@@ -23,6 +26,7 @@ import pandas.testing as pdt
 import toolz.curried as toolz
 
 from orchid import (
+    data_frame_cache as dfc,
     native_data_frame_adapter as dfa,
 )
 
@@ -415,6 +419,48 @@ class TestNativeDataFrameAdapter(unittest.TestCase):
         assert_that(calling(sut.pandas_data_frame).with_args(),
                     raises(dfa.DataFrameAdapterDateTimeOffsetMinValueError, pattern=expect))
 
+    def test_net_data_frame_with_min_date_time_offset_in_later_row_reports_row(self):
+        table_data_dto = tsn.TableDataDto([pendulum.DateTime],
+                                          [{'postea': pendulum.datetime(2022, 3, 4, 5, 6, 7)},
+                                           {'postea': pendulum.DateTime.min}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        expect = (f'Unexpectedly found `DateTimeOffset.MinValue`'
+                  f' at row, 1, and column, "postea", of Orchid `DataFrame`.')
+        assert_that(calling(sut.pandas_data_frame).with_args(),
+                    raises(dfa.DataFrameAdapterDateTimeOffsetMinValueError, pattern=expect))
+
+    def test_net_data_frame_with_int_column_containing_db_null_produces_float_column(self):
+        table_data_dto = tsn.TableDataDto([int],
+                                          [{'numerus': 17}, {'numerus': None}, {'numerus': -3}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = pd.DataFrame(data={'numerus': [17.0, float('nan'), -3.0]})
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_net_data_frame_with_only_db_null_values_produces_object_column(self):
+        table_data_dto = tsn.TableDataDto([float, str],
+                                          [{'vacuus': None, 'inanis': None}, {'vacuus': None, 'inanis': None}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_net_data_frame_with_guid_column_produces_correct_pandas_data_frame(self):
+        table_data_dto = tsn.TableDataDto([uuid.UUID],
+                                          [{'signum': uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d')},
+                                           {'signum': None}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
     def test_net_data_frame_with_max_date_time_offset_produces_nat_cell_in_pandas_data_frame(self):
         table_data_dto = tsn.TableDataDto([pendulum.DateTime],
                                           [{'dies': pendulum.DateTime.max}],
@@ -436,6 +482,268 @@ class TestNativeDataFrameAdapter(unittest.TestCase):
         expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
         pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
 
+    def test_pandas_data_frame_with_columns_only_converts_selected_columns_in_order(self):
+        table_data_dto = tsn.TableDataDto([str, int, float],
+                                          [{'cana': 'imbris', 'querula': -203, 'recidebimus': 8.700},
+                                           {'cana': 'privat', 'querula': 111, 'recidebimus': 52.02}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_data_frame = sut.pandas_data_frame(columns=['recidebimus', 'cana'])
+
+        expected_data_frame = pd.DataFrame(data={'recidebimus': [8.700, 52.02], 'cana': ['imbris', 'privat']})
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_pandas_data_frame_with_row_filter_only_converts_matching_rows(self):
+        table_data_dto = tsn.TableDataDto([str, int],
+                                          [{'cana': 'imbris', 'querula': -203},
+                                           {'cana': 'privat', 'querula': 111},
+                                           {'cana': 'desperant', 'querula': -44}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_data_frame = sut.pandas_data_frame(row_filter='querula < 0')
+
+        expected_data_frame = pd.DataFrame(data={'cana': ['imbris', 'desperant'], 'querula': [-203, -44]})
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_pandas_data_frame_with_unknown_column_raises_error(self):
+        table_data_dto = tsn.TableDataDto([str], [{'cana': 'imbris'}], toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        assert_that(calling(sut.pandas_data_frame).with_args(columns=['cana', 'ignotus']),
+                    raises(KeyError, pattern='ignotus'))
+
+    def test_pandas_data_frame_with_conversion_cache_caches_conversion(self):
+        table_data_dto = tsn.TableDataDto([str, float],
+                                          [{'cana': 'imbris', 'recidebimus': 8.700},
+                                           {'cana': 'privat', 'recidebimus': 52.02}],
+                                          toolz.identity)
+        stub_net_data_frame = tsn.create_stub_net_data_frame(object_id=tsn.DONT_CARE_ID_A, name='memoria',
+                                                             table_data_dto=table_data_dto)
+        conversion_cache = dfc.DataFrameCache()
+        sut = dfa.NativeDataFrameAdapterIdentified(stub_net_data_frame, conversion_cache=conversion_cache)
+
+        first = sut.pandas_data_frame()
+        first.loc[0, 'recidebimus'] = -1.0
+        second = sut.pandas_data_frame()
+
+        assert_that(len(conversion_cache), equal_to(1))
+        assert_that(second.loc[0, 'recidebimus'], equal_to(8.700))
+
+    def test_pandas_data_frame_compact_converts_low_cardinality_strings_to_categories(self):
+        table_data_dto = tsn.TableDataDto([str, str],
+                                          [{'puteus': 'Demo_1H', 'signum': 'alpha'},
+                                           {'puteus': 'Demo_1H', 'signum': 'beta'},
+                                           {'puteus': 'Demo_2H', 'signum': 'gamma'},
+                                           {'puteus': 'Demo_1H', 'signum': 'delta'}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame(compact=True)
+
+        assert_that(str(actual_data_frame.dtypes['puteus']), equal_to('category'))
+        assert_that(str(actual_data_frame.dtypes['signum']), equal_to('object'))
+        pdt.assert_frame_equal(actual_data_frame.astype({'puteus': 'object'}), sut.pandas_data_frame())
+
+    def test_pandas_data_frame_compact_downcasts_numeric_columns_without_loss(self):
+        table_data_dto = tsn.TableDataDto([int, float, float],
+                                          [{'numerus': 3, 'dimidium': 0.5, 'tertia': 1 / 3},
+                                           {'numerus': -203, 'dimidium': 2.25, 'tertia': 2 / 3}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame(compact=True)
+
+        assert_that([str(dtype) for dtype in actual_data_frame.dtypes], equal_to(['int16', 'float32', 'float64']))
+        pdt.assert_frame_equal(actual_data_frame, sut.pandas_data_frame(), check_dtype=False)
+
+    def test_pandas_data_frame_compact_converts_low_cardinality_guids_to_categories(self):
+        signum = uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d')
+        table_data_dto = tsn.TableDataDto([uuid.UUID],
+                                          [{'signum': signum}, {'signum': None}, {'signum': signum},
+                                           {'signum': signum}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame(compact=True)
+
+        assert_that(str(actual_data_frame.dtypes['signum']), equal_to('category'))
+        assert_that(list(actual_data_frame['signum'].cat.categories), equal_to([signum]))
+        assert_that(actual_data_frame['signum'].isna().tolist(), equal_to([False, True, False, False]))
+
+    def test_pandas_data_frame_compact_supports_common_pandas_operations(self):
+        signa = [uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d'), uuid.UUID('00112233-4455-6677-8899-aabbccddeeff')]
+        table_data_dto = tsn.TableDataDto([uuid.UUID, int],
+                                          [{'signum': signa[0], 'numerus': 1}, {'signum': None, 'numerus': 2},
+                                           {'signum': signa[1], 'numerus': 3}, {'signum': signa[0], 'numerus': 4},
+                                           {'signum': signa[1], 'numerus': 5}, {'signum': signa[0], 'numerus': 6}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame(compact=True)
+
+        assert_that(repr(actual_data_frame), contains_string(str(signa[0])))
+        assert_that(actual_data_frame.to_csv(), contains_string(str(signa[1])))
+        assert_that(actual_data_frame[actual_data_frame['signum'] == signa[0]]['numerus'].tolist(),
+                    equal_to([1, 4, 6]))
+        assert_that(actual_data_frame['signum'].isin([signa[1]]).tolist(),
+                    equal_to([False, False, True, False, True, False]))
+        assert_that(len(pd.concat([actual_data_frame, actual_data_frame])), equal_to(12))
+        assert_that(actual_data_frame.merge(actual_data_frame, on='signum').shape, equal_to((14, 3)))
+
+    def test_net_guids_to_bytes_produces_uuid_byte_order(self):
+        signa = [uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d'), uuid.UUID('00112233-4455-6677-8899-aabbccddeeff')]
+
+        actual = dfa.net_guids_to_bytes([Guid(str(signum)) for signum in signa] + [DBNull.Value])
+
+        assert_that(str(actual.dtype), equal_to('|V16'))
+        assert_that([value.tobytes() for value in actual], equal_to([signum.bytes for signum in signa] + [bytes(16)]))
+        assert_that(list(dfa.guid_bytes_to_uuids(actual[:2])), equal_to(signa))
+        assert_that(list(actual == dfa.uuids_to_guid_bytes([signa[1]])[0]), equal_to([False, True, False]))
+
+    def test_guid_bytes_to_uuids_shares_instance_among_equal_values(self):
+        signa = [uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d'), uuid.UUID('00112233-4455-6677-8899-aabbccddeeff')]
+
+        actual = dfa.guid_bytes_to_uuids(dfa.uuids_to_guid_bytes([signa[0], signa[1], signa[0]]))
+
+        assert_that(list(actual), equal_to([signa[0], signa[1], signa[0]]))
+        assert_that(actual[0] is actual[2], equal_to(True))
+
+    def test_guid_bytes_column_returns_uuid_bytes_of_column(self):
+        signa = [uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d'), uuid.UUID('00112233-4455-6677-8899-aabbccddeeff')]
+        table_data_dto = tsn.TableDataDto([uuid.UUID, int],
+                                          [{'signum': signa[0], 'numerus': 1}, {'signum': None, 'numerus': 2},
+                                           {'signum': signa[1], 'numerus': 3}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual = sut.guid_bytes_column('signum')
+
+        assert_that([value.tobytes() for value in actual], equal_to([signa[0].bytes, bytes(16), signa[1].bytes]))
+        assert_that([value.tobytes() for value in sut.guid_bytes_column('signum', row_filter='numerus > 2')],
+                    equal_to([signa[1].bytes]))
+
+    def test_guid_bytes_column_of_non_guid_column_raises_error(self):
+        table_data_dto = tsn.TableDataDto([uuid.UUID, int], [{'signum': None, 'numerus': 1}], toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        assert_that(calling(sut.guid_bytes_column).with_args('numerus'), raises(TypeError, pattern='numerus'))
+
+    def test_iter_pandas_chunks_of_empty_net_data_frame_yields_no_chunks(self):
+        sut = _create_sut(tsn.TableDataDto([], [], toolz.identity))
+
+        assert_that(list(sut.iter_pandas_chunks()), equal_to([]))
+
+    def test_iter_pandas_chunks_yields_chunks_with_continuous_index(self):
+        table_data_dto = tsn.TableDataDto([str, float],
+                                          [{'verbum': 'alpha', 'pondus': 1.5},
+                                           {'verbum': 'beta', 'pondus': -2.25},
+                                           {'verbum': 'gamma', 'pondus': 3.125},
+                                           {'verbum': 'delta', 'pondus': 0.5},
+                                           {'verbum': 'epsilon', 'pondus': 7.75}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_chunks = list(sut.iter_pandas_chunks(chunk_rows=2))
+
+        assert_that([len(chunk) for chunk in actual_chunks], equal_to([2, 2, 1]))
+        pdt.assert_frame_equal(pd.concat(actual_chunks), sut.pandas_data_frame())
+
+    def test_iter_pandas_chunks_yields_stable_dtypes(self):
+        table_data_dto = tsn.TableDataDto([int, pendulum.DateTime],
+                                          [{'numerus': 3, 'tempus': pendulum.datetime(2023, 1, 2, 3, 4, 5)},
+                                           {'numerus': None, 'tempus': None},
+                                           {'numerus': 5, 'tempus': pendulum.datetime(2023, 6, 7, 8, 9, 10)}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_chunks = list(sut.iter_pandas_chunks(chunk_rows=1))
+
+        for chunk in actual_chunks:
+            with self.subTest(f'Chunk starting at row {chunk.index[0]} has stable dtypes'):
+                assert_that(str(chunk.dtypes['numerus']), equal_to('Int64'))
+                assert_that(chunk.dtypes['tempus'], equal_to(actual_chunks[0].dtypes['tempus']))
+
+    def test_iter_pandas_chunks_with_out_of_range_value_yields_object_column(self):
+        table_data_dto = tsn.TableDataDto([pendulum.DateTime],
+                                          [{'futurum': pendulum.datetime(2017, 4, 29, 11, 2, 17, 456000)},
+                                           {'futurum': pendulum.datetime(3017, 4, 29, 11, 2, 17, 123000)}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_chunks = list(sut.iter_pandas_chunks(chunk_rows=1))
+
+        assert_that(pd.api.types.is_datetime64tz_dtype(actual_chunks[0].dtypes['futurum']), equal_to(True))
+        assert_that(str(actual_chunks[1].dtypes['futurum']), equal_to('object'))
+        assert_that(actual_chunks[1].loc[1, 'futurum'], equal_to(pendulum.datetime(3017, 4, 29, 11, 2, 17, 123000)))
+
+    def test_net_data_frame_with_too_large_time_span_produces_nat_cell_in_pandas_data_frame(self):
+        table_data_dto = tsn.TableDataDto([pendulum.Duration],
+                                          [{'spatium': pendulum.duration(days=36526)},
+                                           {'spatium': pendulum.duration(hours=1, microseconds=731)},
+                                           {'spatium': None}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = pd.DataFrame(data={'spatium': [pd.NaT,
+                                                             pd.Timedelta(hours=1, microseconds=731),
+                                                             pd.NaT]},
+                                           dtype='timedelta64[ns]')
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_net_data_frame_with_date_time_offset_beyond_pandas_bounds_produces_object_column(self):
+        table_data_dto = tsn.TableDataDto([pendulum.DateTime],
+                                          [{'futurum': pendulum.datetime(3017, 4, 29, 11, 2, 17, 123000)},
+                                           {'futurum': pendulum.datetime(2017, 4, 29, 11, 2, 17, 456000)}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'Requires optional `pyarrow` package')
+    def test_to_arrow_produces_typed_arrow_table_with_metadata(self):
+        table_data_dto = tsn.TableDataDto([str, int, float],
+                                          [{'cana': 'imbris', 'querula': -203, 'recidebimus': 8.700},
+                                           {'cana': None, 'querula': None, 'recidebimus': 52.02}],
+                                          toolz.identity)
+        stub_net_data_frame = tsn.create_stub_net_data_frame(object_id=tsn.DONT_CARE_ID_B, name='sagitta',
+                                                             display_name='sagitta 1', table_data_dto=table_data_dto)
+        sut = dfa.NativeDataFrameAdapterIdentified(stub_net_data_frame)
+
+        actual = sut.to_arrow()
+
+        assert_that([str(field.type) for field in actual.schema], equal_to(['string', 'int32', 'double']))
+        assert_that(actual.to_pydict(), equal_to({'cana': ['imbris', None],
+                                                  'querula': [-203, None],
+                                                  'recidebimus': [8.700, 52.02]}))
+        assert_that(actual.schema.metadata, equal_to({b'orchid.object_id': tsn.DONT_CARE_ID_B.encode(),
+                                                      b'orchid.name': b'sagitta',
+                                                      b'orchid.display_name': b'sagitta 1'}))
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'Requires optional `pyarrow` package')
+    def test_to_arrow_converts_guid_column_to_uuid_bytes(self):
+        signum = uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d')
+        table_data_dto = tsn.TableDataDto([uuid.UUID], [{'signum': signum}, {'signum': None}], toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual = sut.to_arrow()
+
+        assert_that([str(field.type) for field in actual.schema], equal_to(['fixed_size_binary[16]']))
+        assert_that(actual.to_pydict(), equal_to({'signum': [signum.bytes, None]}))
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'Requires optional `pyarrow` package')
+    def test_write_arrow_table_with_keyword_arguments(self):
+        import pyarrow as pa
+        import pyarrow.feather as pf
+
+        table = pa.Table.from_arrays([pa.array([8.700, 52.02])], names=['recidebimus'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory).joinpath('sagitta.arrow')
+
+            dfa.write_arrow_table(table=table, path=path, file_format='arrow')
+
+            assert_that(pf.read_table(str(path)).to_pydict(), equal_to({'recidebimus': [8.700, 52.02]}))
+
     def test_potentially_corrupted(self):
         tag = ' (Potentially Corrupted)'
         for name, expected in [
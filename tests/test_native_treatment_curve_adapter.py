@@ -107,6 +107,72 @@ class TestTreatmentCurveAdapter(unittest.TestCase):
         tse.assert_time_series_equal(expected_name, start_time_point, values, create_sut)
 
 
+@unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+class TestTreatmentCurveFrame(unittest.TestCase):
+    def test_canary(self, _stub_script_adapter):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_treatment_curve_frame_of_no_stages_is_empty(self, _stub_script_adapter):
+        actual = tca.treatment_curve_frame([])
+
+        assert_that(list(actual.columns), equal_to(['stage_id', 'curve_type', 'timestamp', 'value']))
+        assert_that(len(actual), equal_to(0))
+
+    def test_treatment_curve_frame_concatenates_requested_curves(self, stub_script_adapter):
+        first_stage = create_stub_stage(tsn.DONT_CARE_ID_A, {
+            tca.TreatmentCurveTypes.TREATING_PRESSURE: ([1612137600, 1612137601], [7354.3, 7361.9]),
+            tca.TreatmentCurveTypes.SLURRY_RATE: ([1612137600], [79.7]),
+        })
+        second_stage = create_stub_stage(tsn.DONT_CARE_ID_B, {
+            tca.TreatmentCurveTypes.TREATING_PRESSURE: ([1612224000], [6991.0]),
+        })
+
+        actual = tca.treatment_curve_frame([first_stage, second_stage],
+                                           [tca.TreatmentCurveTypes.TREATING_PRESSURE])
+
+        expected = pd.DataFrame(data={
+            'stage_id': pd.Categorical([tsn.DONT_CARE_ID_A, tsn.DONT_CARE_ID_A, tsn.DONT_CARE_ID_B],
+                                       categories=[tsn.DONT_CARE_ID_A, tsn.DONT_CARE_ID_B]),
+            'curve_type': pd.Categorical([tca.TreatmentCurveTypes.TREATING_PRESSURE.value] * 3,
+                                         categories=[tca.TreatmentCurveTypes.TREATING_PRESSURE.value]),
+            'timestamp': pd.DatetimeIndex(np.array([1612137600, 1612137601, 1612224000], dtype='datetime64[s]'),
+                                          tz='UTC'),
+            'value': [7354.3, 7361.9, 6991.0],
+        })
+        pdt.assert_frame_equal(actual, expected)
+        assert_that(stub_script_adapter.Init.call_count, equal_to(1))
+
+    def test_treatment_curve_frame_gathers_repeated_stages_and_curve_types_once(self, _stub_script_adapter):
+        stage = create_stub_stage(tsn.DONT_CARE_ID_A, {
+            tca.TreatmentCurveTypes.TREATING_PRESSURE: ([1612137600, 1612137601], [7354.3, 7361.9]),
+            tca.TreatmentCurveTypes.SLURRY_RATE: ([1612137600], [79.7]),
+        })
+
+        actual = tca.treatment_curve_frame([stage, stage],
+                                           [tca.TreatmentCurveTypes.SLURRY_RATE,
+                                            tca.TreatmentCurveTypes.TREATING_PRESSURE,
+                                            tca.TreatmentCurveTypes.SLURRY_RATE])
+
+        assert_that(list(actual['stage_id'].cat.categories), equal_to([tsn.DONT_CARE_ID_A]))
+        assert_that(list(actual['curve_type'].cat.categories),
+                    equal_to([tca.TreatmentCurveTypes.SLURRY_RATE.value,
+                              tca.TreatmentCurveTypes.TREATING_PRESSURE.value]))
+        assert_that(actual['value'].tolist(), equal_to([79.7, 7354.3, 7361.9]))
+
+
+def create_stub_stage(object_id, curve_samples):
+    def create_stub_curve(unix_time_stamps, magnitudes):
+        result = unittest.mock.MagicMock(name='stub_treatment_curve')
+        result.sample_arrays.return_value = (np.array(unix_time_stamps, dtype=np.int64),
+                                             np.array(magnitudes, dtype=np.float64))
+        return result
+
+    result = unittest.mock.MagicMock(name='stub_stage')
+    result.object_id = object_id
+    result.treatment_curves.return_value = toolz.valmap(lambda samples: create_stub_curve(*samples), curve_samples)
+    return result
+
+
 def create_sut(name='', display_name='', sampled_quantity_name='', suffix='', project=None):
     stub_net_treatment_curve = tsn.create_stub_net_treatment_curve(name, display_name, sampled_quantity_name,
                                                                    suffix, project=project)
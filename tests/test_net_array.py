@@ -0,0 +1,82 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+import uuid
+
+from hamcrest import assert_that, equal_to, calling, raises
+import numpy as np
+
+from orchid import net_array
+
+# noinspection PyUnresolvedReferences
+from System import Array, Byte, Double, Guid, Int32, Int64
+
+
+class TestNetArray(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_as_numpy_array_copies_all_elements(self):
+        for net_array_type, values, dtype in [
+            (Double, [-3.125, 0.0, 2.718, 1e300], np.float64),
+            (Int64, [-2 ** 62, 0, 1712345678], np.int64),
+            (Byte, [0, 127, 255], np.uint8),
+        ]:
+            with self.subTest(f'Copy .NET {net_array_type.__name__}[] to {np.dtype(dtype)}'):
+                actual = net_array.as_numpy_array(Array[net_array_type](values), dtype)
+
+                assert_that(actual.dtype, equal_to(np.dtype(dtype)))
+                assert_that(actual.tolist(), equal_to(values))
+
+    def test_as_numpy_array_copies_only_requested_elements(self):
+        values = [-3.125, 0.0, 2.718, 1e300, 6.02e23]
+        for start, stop in [(0, None), (1, 3), (2, None), (4, 5), (3, 3), (3, 17)]:
+            with self.subTest(f'Copy elements [{start}:{stop}]'):
+                actual = net_array.as_numpy_array(Array[Double](values), np.float64, start, stop)
+
+                assert_that(actual.tolist(), equal_to(values[start:stop]))
+
+    def test_as_numpy_array_of_empty_net_array_is_empty(self):
+        actual = net_array.as_numpy_array(Array[Double]([]), np.float64)
+
+        assert_that(actual.shape, equal_to((0,)))
+
+    def test_as_numpy_array_with_dtype_of_different_size_raises_error(self):
+        for net_array_type, values, dtype in [
+            (Int32, [-3, 0, 7], np.float64),
+            (Double, [-3.125, 0.0], np.uint8),
+        ]:
+            with self.subTest(f'Copy .NET {net_array_type.__name__}[] to {np.dtype(dtype)} raises error'):
+                assert_that(calling(net_array.as_numpy_array).with_args(Array[net_array_type](values), dtype),
+                            raises(ValueError, pattern='do not have the size'))
+
+    def test_as_numpy_struct_array_copies_bytes_of_all_elements(self):
+        signa = [uuid.UUID('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d'), uuid.UUID('00112233-4455-6677-8899-aabbccddeeff')]
+
+        actual = net_array.as_numpy_struct_array(Array[Guid]([Guid(str(signum)) for signum in signa]), 16)
+
+        assert_that(actual.dtype, equal_to(np.dtype('V16')))
+        # The bytes of a .NET `Guid` in memory are the bytes of `Guid.ToByteArray()`.
+        assert_that([value.tobytes() for value in actual], equal_to([signum.bytes_le for signum in signa]))
+
+    def test_as_numpy_struct_array_with_different_item_size_raises_error(self):
+        net_guids = Array[Guid]([Guid('5e3c7bc6-2d0a-4b6b-9e3b-2a6c3f0c6e8d')])
+
+        assert_that(calling(net_array.as_numpy_struct_array).with_args(net_guids, 8),
+                    raises(ValueError, pattern='do not have the size'))
+
+
+if __name__ == '__main__':
+    unittest.main()
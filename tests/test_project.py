@@ -16,17 +16,25 @@
 #
 
 import decimal
+import importlib.util
+import pathlib
+import tempfile
 import unittest
 import unittest.mock
 import uuid
 
 import deal
-from hamcrest import assert_that, equal_to, contains_exactly, calling, raises
+from hamcrest import assert_that, equal_to, contains_exactly, calling, raises, is_, same_instance
+import pandas as pd
+import pandas.testing as pdt
+import toolz.curried as toolz
 
 from orchid import (
+    dot_net_dom_access as dna,
     measurement as om,
     project as onp,
     project_store as loader,
+    time_series_cache as tsc,
     unit_system as units)
 from tests import (
     stub_net as tsn,
@@ -81,6 +89,24 @@ class TestProject(unittest.TestCase):
                 assert_that(sut.data_frames().all_display_names(), contains_exactly(*expected_display_names))
                 assert_that(sut.data_frames().all_names(), contains_exactly(*expected_names))
 
+    def test_all_pandas_data_frames_converts_every_data_frame(self):
+        data_frame_dtos = (
+            {'object_id': tsn.DONT_CARE_ID_B, 'name': 'partes',
+             'table_data_dto': tsn.TableDataDto([str, float], [{'locus': 'alpha', 'valor': 1.5}], toolz.identity)},
+            {'object_id': tsn.DONT_CARE_ID_C, 'name': 'cunctas',
+             'table_data_dto': tsn.TableDataDto([int], [{'numerus': 3}, {'numerus': 5}], toolz.identity)},
+        )
+        stub_native_project = tsn.create_stub_net_project(data_frame_dtos=data_frame_dtos)
+        sut = create_sut(stub_native_project)
+
+        actual = sut.all_pandas_data_frames(max_workers=2)
+
+        assert_that(set(actual.keys()), equal_to({uuid.UUID(tsn.DONT_CARE_ID_B), uuid.UUID(tsn.DONT_CARE_ID_C)}))
+        pdt.assert_frame_equal(actual[uuid.UUID(tsn.DONT_CARE_ID_B)],
+                               pd.DataFrame(data={'locus': ['alpha'], 'valor': [1.5]}))
+        pdt.assert_frame_equal(actual[uuid.UUID(tsn.DONT_CARE_ID_C)],
+                               pd.DataFrame(data={'numerus': [3, 5]}))
+
     def test_default_well_colors_if_no_default_well_colors(self):
         stub_native_project = tsn.create_stub_net_project(name='exsistet')
         sut = create_sut(stub_native_project)
@@ -100,6 +126,54 @@ class TestProject(unittest.TestCase):
         # noinspection PyTypeChecker
         assert_that(sut.default_well_colors(), contains_exactly(*expected_default_well_colors))
 
+    def test_enable_time_series_cache_with_max_bytes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            project_path = pathlib.Path(directory).joinpath('fictus.ifrac')
+            project_path.write_bytes(b'\0' * 16)
+            sut = create_sut(tsn.create_stub_net_project(), project_pathname=str(project_path))
+
+            actual = sut.enable_time_series_cache(pathlib.Path(directory).joinpath('cache'), max_bytes=1024)
+            self.addCleanup(sut.disable_time_series_cache)
+
+            assert_that(actual.max_bytes, equal_to(1024))
+            assert_that(tsc.project_cache(dna.NetObjectIdentity(sut.dom_object))[0], is_(same_instance(actual)))
+
+    def test_export_data_frames_unknown_format_raises_exception(self):
+        sut = create_sut(tsn.create_stub_net_project())
+
+        assert_that(calling(sut.export_data_frames).with_args('dont_care', format='bogus'),
+                    raises(deal.PreContractError))
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'Requires optional `pyarrow` package')
+    def test_export_data_frames_writes_one_file_per_data_frame_with_metadata(self):
+        import pyarrow.feather as pf
+        import pyarrow.parquet as pq
+
+        data_frame_dtos = (
+            {'object_id': tsn.DONT_CARE_ID_B, 'display_name': 'adamanti', 'name': 'partes/unus',
+             'table_data_dto': tsn.TableDataDto([str, float], [{'locus': 'alpha', 'valor': 1.5}], toolz.identity)},
+            {'object_id': tsn.DONT_CARE_ID_C, 'display_name': 'indicium', 'name': 'cunctas',
+             'table_data_dto': tsn.TableDataDto([int], [{'numerus': 3}, {'numerus': 5}], toolz.identity)},
+        )
+        for export_format, suffix, read_table in (('parquet', '.parquet', pq.read_table),
+                                                  ('arrow', '.arrow', pf.read_table)):
+            with self.subTest(f'Export data frames to {export_format} files'), \
+                    tempfile.TemporaryDirectory() as directory:
+                sut = create_sut(tsn.create_stub_net_project(data_frame_dtos=data_frame_dtos))
+                target_directory = pathlib.Path(directory).joinpath('exported')
+
+                actual = sut.export_data_frames(target_directory, format=export_format)
+
+                assert_that(actual, equal_to([target_directory.joinpath(f'partes_unus_{tsn.DONT_CARE_ID_B}{suffix}'),
+                                              target_directory.joinpath(f'cunctas_{tsn.DONT_CARE_ID_C}{suffix}')]))
+                first_table = read_table(str(actual[0]))
+                assert_that(first_table.to_pydict(), equal_to({'locus': ['alpha'], 'valor': [1.5]}))
+                assert_that(first_table.schema.metadata,
+                            equal_to({b'orchid.object_id': tsn.DONT_CARE_ID_B.encode(),
+                                      b'orchid.name': b'partes/unus',
+                                      b'orchid.display_name': b'adamanti'}))
+                assert_that(read_table(str(actual[1])).to_pydict(), equal_to({'numerus': [3, 5]}))
+
     def test_fluid_density_returns_fluid_density_in_project_units(self):
         for actual_density, project_units, expected_density, tolerance in (
                 (tsn.MeasurementDto(47.02, units.UsOilfield.DENSITY), units.UsOilfield,
@@ -324,8 +398,8 @@ class TestProject(unittest.TestCase):
                 assert_that(sut.wells().all_names(), contains_exactly(*expected_names))
 
 
-def create_sut(stub_net_project):
-    patched_loader = loader.ProjectStore('dont_care')
+def create_sut(stub_net_project, project_pathname='dont_care'):
+    patched_loader = loader.ProjectStore(project_pathname)
     patched_loader.native_project = unittest.mock.MagicMock(name='stub_project', return_value=stub_net_project)
 
     sut = onp.Project(patched_loader)
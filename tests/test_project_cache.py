@@ -0,0 +1,157 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import pathlib
+import tempfile
+import threading
+import unittest
+import unittest.mock
+
+import deal
+from hamcrest import assert_that, equal_to, calling, raises, is_, is_not, same_instance
+
+from orchid import project_cache as pc
+
+
+def _write_project_file(directory, name, size):
+    result = pathlib.Path(directory).joinpath(name)
+    result.write_bytes(b'\0' * size)
+    return result
+
+
+def _make_stub_load():
+    return unittest.mock.MagicMock(name='stub_load', side_effect=lambda pathname: object())
+
+
+# Test ideas
+# - Repeated loads of the same file load once and share the project
+# - Changing the project file loads the project again
+# - Least recently used projects removed when budget exceeded
+# - Projects larger than budget never cached
+# - Evicting a project (or all projects) loads it again
+# - Concurrent loads of the same file load once
+# - Enabling and disabling the process-wide cache
+class TestProjectCache(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_ctor_non_positive_max_bytes_raises_exception(self):
+        assert_that(calling(pc.ProjectCache).with_args(0), raises(deal.PreContractError))
+
+    def test_repeated_get_or_load_loads_once_and_shares_project(self):
+        project_path = _write_project_file(self._directory.name, 'unus.ifrac', 10)
+        sut = pc.ProjectCache()
+        stub_load = _make_stub_load()
+
+        first = sut.get_or_load(str(project_path), stub_load)
+        second = sut.get_or_load(project_path, stub_load)
+
+        assert_that(second, is_(same_instance(first)))
+        assert_that(stub_load.call_count, equal_to(1))
+        assert_that(project_path in sut, equal_to(True))
+
+    def test_changed_project_file_loads_again(self):
+        project_path = _write_project_file(self._directory.name, 'mutatus.ifrac', 10)
+        sut = pc.ProjectCache()
+        stub_load = _make_stub_load()
+
+        first = sut.get_or_load(project_path, stub_load)
+        project_path.write_bytes(b'\1' * 20)
+        second = sut.get_or_load(project_path, stub_load)
+
+        assert_that(second, is_not(same_instance(first)))
+        assert_that(stub_load.call_count, equal_to(2))
+        assert_that(len(sut), equal_to(1))
+
+    def test_least_recently_used_projects_removed_when_budget_exceeded(self):
+        project_paths = [_write_project_file(self._directory.name, f'{n}.ifrac', 40) for n in ['a', 'b', 'c']]
+        sut = pc.ProjectCache(max_bytes=100)
+        stub_load = _make_stub_load()
+
+        sut.get_or_load(project_paths[0], stub_load)
+        sut.get_or_load(project_paths[1], stub_load)
+        sut.get_or_load(project_paths[0], stub_load)
+        sut.get_or_load(project_paths[2], stub_load)
+
+        assert_that(project_paths[0] in sut, equal_to(True))
+        assert_that(project_paths[1] in sut, equal_to(False))
+        assert_that(sut.current_bytes, equal_to(80))
+
+    def test_project_larger_than_budget_never_cached(self):
+        project_path = _write_project_file(self._directory.name, 'magnus.ifrac', 200)
+        sut = pc.ProjectCache(max_bytes=100)
+
+        sut.get_or_load(project_path, _make_stub_load())
+
+        assert_that(len(sut), equal_to(0))
+
+    def test_evict_removes_projects(self):
+        project_paths = [_write_project_file(self._directory.name, f'{n}.ifrac', 10) for n in ['a', 'b', 'c']]
+        sut = pc.ProjectCache()
+        for project_path in project_paths:
+            sut.get_or_load(project_path, _make_stub_load())
+
+        sut.evict(project_paths[0])
+        assert_that(project_paths[0] in sut, equal_to(False))
+        assert_that(len(sut), equal_to(2))
+
+        sut.evict()
+        assert_that(len(sut), equal_to(0))
+
+    def test_concurrent_loads_of_same_project_load_once(self):
+        project_path = _write_project_file(self._directory.name, 'concurrens.ifrac', 10)
+        sut = pc.ProjectCache()
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_load(_pathname):
+            loading.set()
+            release.wait(5)
+            return object()
+
+        stub_load = unittest.mock.MagicMock(name='stub_load', side_effect=slow_load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(sut.get_or_load(project_path, stub_load)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        loading.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert_that(stub_load.call_count, equal_to(1))
+        assert_that(len({id(result) for result in results}), equal_to(1))
+
+    def test_enable_and_disable_process_project_cache(self):
+        self.addCleanup(pc.disable_project_cache)
+
+        enabled = pc.enable_project_cache(max_bytes=1024)
+        assert_that(pc.process_project_cache(), is_(same_instance(enabled)))
+        assert_that(enabled.max_bytes, equal_to(1024))
+
+        pc.disable_project_cache()
+        assert_that(pc.process_project_cache(), is_(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
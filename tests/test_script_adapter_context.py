@@ -0,0 +1,68 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, calling, raises
+
+from orchid import script_adapter_context as sac
+
+
+# Test ideas
+# - Entering and exiting a single context initializes and shuts down the `ScriptAdapter` once
+# - Nested contexts initialize and shut down the `ScriptAdapter` once
+# - Exiting a context because of an exception still shuts down the `ScriptAdapter`
+@unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+class TestScriptAdapterContext(unittest.TestCase):
+    def test_canary(self, _stub_script_adapter):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_single_context_initializes_and_shuts_down_script_adapter(self, stub_script_adapter):
+        with sac.ScriptAdapterContext():
+            assert_that(stub_script_adapter.Init.call_count, equal_to(1))
+            assert_that(stub_script_adapter.Shutdown.call_count, equal_to(0))
+
+        assert_that(stub_script_adapter.Shutdown.call_count, equal_to(1))
+
+    def test_contexts_in_session_share_initialized_script_adapter(self, stub_script_adapter):
+        with sac.session():
+            for _ in range(3):
+                with sac.ScriptAdapterContext():
+                    pass
+            with sac.session():
+                with sac.ScriptAdapterContext():
+                    pass
+
+            assert_that(stub_script_adapter.Shutdown.call_count, equal_to(0))
+
+        assert_that(stub_script_adapter.Init.call_count, equal_to(1))
+        assert_that(stub_script_adapter.Shutdown.call_count, equal_to(1))
+
+    def test_session_shuts_down_script_adapter_if_error_raised(self, stub_script_adapter):
+        def raise_in_session():
+            with sac.session():
+                with sac.ScriptAdapterContext():
+                    raise ValueError('inanis')
+
+        assert_that(calling(raise_in_session), raises(ValueError))
+        assert_that(stub_script_adapter.Shutdown.call_count, equal_to(1))
+
+        with sac.ScriptAdapterContext():
+            pass
+
+        assert_that(stub_script_adapter.Init.call_count, equal_to(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest.mock
+
+import deal
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from hamcrest import assert_that, equal_to, calling, raises
+
+from orchid import time_series_alignment as tsa
+
+
+START_UNIX_SECONDS = 1612137600  # 2021-02-01T00:00:00Z
+
+
+def create_stub_series(name, unix_seconds, magnitudes):
+    result = unittest.mock.MagicMock(name=name)
+    result.name = name
+    result.sample_arrays.return_value = (np.array(unix_seconds, dtype=np.int64),
+                                         np.array(magnitudes, dtype=np.float64))
+    return result
+
+
+def make_expected(unix_seconds, columns):
+    return pd.DataFrame(data=columns, index=pd.to_datetime(unix_seconds, unit='s', utc=True))
+
+
+# Test ideas
+# - Interpolate linearly at grid points within each series and produce NaN outside each series
+# - Forward fill the latest sample at or before each grid point
+# - Average the samples in each grid interval matching `pandas` resampling
+# - Series without samples produce a column of NaN
+# - Unrecognized method raises an error
+# - Arguments can be passed by keyword
+@unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+class TestTimeSeriesAlignment(unittest.TestCase):
+    def setUp(self):
+        self.pressure = create_stub_series('pressure', [START_UNIX_SECONDS + s for s in (1, 11, 21)],
+                                           [0.0, 10.0, 20.0])
+        self.rate = create_stub_series('rate', [START_UNIX_SECONDS + s for s in (5, 7, 16)], [1.0, 3.0, 5.0])
+        self.grid = [START_UNIX_SECONDS + s for s in (0, 5, 10, 15, 20)]
+
+    def test_canary(self, _stub_script_adapter):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_interpolate_aligns_series_to_common_grid(self, _stub_script_adapter):
+        actual = tsa.align_time_series([self.pressure, self.rate], freq='5s', how='interpolate')
+
+        expected = make_expected(self.grid, {'pressure': [np.nan, 4.0, 9.0, 14.0, 19.0],
+                                             'rate': [np.nan, 1.0, 11.0 / 3.0, 43.0 / 9.0, np.nan]})
+        pdt.assert_frame_equal(actual, expected, check_freq=False)
+
+    def test_ffill_aligns_series_to_common_grid(self, _stub_script_adapter):
+        actual = tsa.align_time_series([self.pressure, self.rate], freq='5s', how='ffill')
+
+        expected = make_expected(self.grid, {'pressure': [np.nan, 0.0, 0.0, 10.0, 10.0],
+                                             'rate': [np.nan, 1.0, 3.0, 3.0, np.nan]})
+        pdt.assert_frame_equal(actual, expected, check_freq=False)
+
+    def test_mean_matches_pandas_resample(self, _stub_script_adapter):
+        actual = tsa.align_time_series([self.rate], freq='5s', how='mean')
+
+        rate_stamps, rate_magnitudes = self.rate.sample_arrays()
+        expected = pd.Series(rate_magnitudes, index=pd.to_datetime(rate_stamps, unit='s', utc=True),
+                             name='rate').resample('5s').mean()
+        pdt.assert_series_equal(actual['rate'], expected, check_freq=False)
+
+    def test_series_without_samples_aligns_to_all_nan(self, _stub_script_adapter):
+        empty = create_stub_series('empty', [], [])
+        actual = tsa.align_time_series([self.pressure, empty], freq='5s')
+
+        assert_that(actual['empty'].isna().all(), equal_to(True))
+        assert_that(len(actual), equal_to(5))
+
+    def test_unrecognized_method_raises_error(self, _stub_script_adapter):
+        assert_that(calling(tsa.align_time_series).with_args([self.pressure], how='cubic'),
+                    raises(deal.PreContractError))
+
+    def test_align_with_keyword_arguments(self, _stub_script_adapter):
+        actual = tsa.align_time_series(series=[self.pressure], freq='5s', how='ffill')
+
+        assert_that(actual['pressure'].tolist()[1:], equal_to([0.0, 0.0, 10.0, 10.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
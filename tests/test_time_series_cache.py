@@ -0,0 +1,192 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+import os
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+import uuid
+
+import deal
+from hamcrest import assert_that, equal_to, calling, raises, is_, is_not
+import numpy as np
+
+from orchid import time_series_cache as tsc
+
+
+def _make_sample_arrays(sample_count):
+    return (np.arange(1612137600, 1612137600 + sample_count, dtype=np.int64),
+            np.linspace(0.0, 1.0, sample_count, dtype=np.float64))
+
+
+def _refuse_mapped(mapped_key, path):
+    # Simulate Windows refusing to remove or to replace a file that is still mapped into memory
+    if pathlib.Path(path).name.startswith(f'{mapped_key}.'):
+        raise PermissionError(13, 'The process cannot access the file because it is being used', str(path))
+
+
+def _refuse_unlink_mapped(mapped_key):
+    unlink = pathlib.Path.unlink
+
+    def unlink_unless_mapped(path, missing_ok=False):
+        _refuse_mapped(mapped_key, path)
+        return unlink(path, missing_ok=missing_ok)
+
+    return unittest.mock.patch.object(pathlib.Path, 'unlink', unlink_unless_mapped)
+
+
+def _refuse_replace_mapped(mapped_key):
+    replace = os.replace
+
+    def replace_unless_mapped(source, target):
+        _refuse_mapped(mapped_key, target)
+        return replace(source, target)
+
+    return unittest.mock.patch('os.replace', replace_unless_mapped)
+
+
+# Test ideas
+# - Repeated access loads once
+# - Cached arrays are read-only memory maps
+# - Least recently used samples removed when budget exceeded
+# - Samples larger than budget never cached
+# - Samples whose files are mapped (on Windows) are skipped when pruning and when replacing
+# - Changing project file changes fingerprint
+# - Projects registered with different keys use different caches
+class TestTimeSeriesCache(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_ctor_non_positive_max_bytes_raises_exception(self):
+        assert_that(calling(tsc.TimeSeriesCache).with_args(self._directory.name, 0),
+                    raises(deal.PreContractError))
+
+    def test_repeated_get_or_load_loads_once(self):
+        sut = tsc.TimeSeriesCache(self._directory.name)
+        expected_time_stamps, expected_magnitudes = _make_sample_arrays(5)
+        stub_load = unittest.mock.MagicMock(name='stub_load',
+                                            return_value=(expected_time_stamps, expected_magnitudes))
+
+        sut.get_or_load('clavis', stub_load)
+        actual_time_stamps, actual_magnitudes = sut.get_or_load('clavis', stub_load)
+
+        stub_load.assert_called_once_with()
+        np.testing.assert_array_equal(actual_time_stamps, expected_time_stamps)
+        np.testing.assert_array_equal(actual_magnitudes, expected_magnitudes)
+        assert_that(actual_magnitudes.flags.writeable, is_(False))
+
+    def test_cached_samples_shared_by_caches_using_same_directory(self):
+        tsc.TimeSeriesCache(self._directory.name).get_or_load('clavis', lambda: _make_sample_arrays(5))
+
+        sut = tsc.TimeSeriesCache(self._directory.name)
+
+        assert_that('clavis' in sut, is_(True))
+        assert_that(len(sut), equal_to(1))
+
+    def test_least_recently_used_samples_removed_when_budget_exceeded(self):
+        entry_bytes = sum(array.nbytes for array in _make_sample_arrays(100))
+        sut = tsc.TimeSeriesCache(self._directory.name, max_bytes=int(entry_bytes * 2.5))
+
+        sut.get_or_load('prima', lambda: _make_sample_arrays(100))
+        sut.get_or_load('secunda', lambda: _make_sample_arrays(100))
+        # Record an earlier use of 'secunda' so that 'prima' becomes the most recently used
+        for path in pathlib.Path(self._directory.name).glob('secunda.*'):
+            os.utime(path, ns=(0, 0))
+        sut.get_or_load('tertia', lambda: _make_sample_arrays(100))
+
+        assert_that('prima' in sut, is_(True))
+        assert_that('secunda' in sut, is_(False))
+        assert_that('tertia' in sut, is_(True))
+
+    def test_samples_larger_than_budget_never_cached(self):
+        sut = tsc.TimeSeriesCache(self._directory.name, max_bytes=16)
+
+        sut.get_or_load('clavis', lambda: _make_sample_arrays(100))
+
+        assert_that('clavis' in sut, is_(False))
+
+    def test_prune_skips_samples_held_open_by_returned_arrays(self):
+        entry_bytes = sum(array.nbytes for array in _make_sample_arrays(100))
+        sut = tsc.TimeSeriesCache(self._directory.name, max_bytes=int(entry_bytes * 1.5))
+        sut.get_or_load('prima', lambda: _make_sample_arrays(100))
+        # The second access returns the arrays mapped from the cached files
+        _, held_magnitudes = sut.get_or_load('prima', lambda: _make_sample_arrays(100))
+
+        with _refuse_unlink_mapped('prima'):
+            actual_time_stamps, _ = sut.get_or_load('secunda', lambda: _make_sample_arrays(100))
+
+        assert_that(isinstance(held_magnitudes, np.memmap), is_(True))
+        np.testing.assert_array_equal(held_magnitudes, _make_sample_arrays(100)[1])
+        np.testing.assert_array_equal(actual_time_stamps, _make_sample_arrays(100)[0])
+        assert_that('prima' in sut, is_(True))
+
+    def test_samples_not_cached_if_mapped_files_cannot_be_replaced(self):
+        sut = tsc.TimeSeriesCache(self._directory.name)
+
+        with _refuse_replace_mapped('prima'):
+            actual_time_stamps, _ = sut.get_or_load('prima', lambda: _make_sample_arrays(5))
+
+        np.testing.assert_array_equal(actual_time_stamps, _make_sample_arrays(5)[0])
+        assert_that('prima' in sut, is_(False))
+        assert_that(list(pathlib.Path(self._directory.name).iterdir()), equal_to([]))
+
+    def test_clear_removes_all_samples(self):
+        sut = tsc.TimeSeriesCache(self._directory.name)
+        sut.get_or_load('prima', lambda: _make_sample_arrays(3))
+        sut.get_or_load('secunda', lambda: _make_sample_arrays(3))
+
+        sut.clear()
+
+        assert_that(len(sut), equal_to(0))
+        assert_that(sut.current_bytes, equal_to(0))
+
+    def test_project_fingerprint_changes_if_project_file_changes(self):
+        project_path = pathlib.Path(self._directory.name).joinpath('project.ifrac')
+        project_path.write_bytes(b'prima')
+        before = tsc.project_fingerprint(project_path)
+
+        project_path.write_bytes(b'secunda')
+
+        assert_that(tsc.project_fingerprint(project_path), is_not(equal_to(before)))
+        assert_that(tsc.series_key(before, uuid.UUID(int=1)),
+                    is_not(equal_to(tsc.series_key(before, uuid.UUID(int=2)))))
+
+    def test_projects_registered_with_different_keys_use_different_caches(self):
+        first_key, second_key = object(), object()
+        first_cache = tsc.TimeSeriesCache(pathlib.Path(self._directory.name).joinpath('prima'))
+        second_cache = tsc.TimeSeriesCache(pathlib.Path(self._directory.name).joinpath('secunda'))
+        self.addCleanup(tsc.unregister_project, first_key)
+        self.addCleanup(tsc.unregister_project, second_key)
+
+        tsc.register_project(first_key, first_cache, 'prima')
+        tsc.register_project(second_key, second_cache, 'secunda')
+
+        assert_that(tsc.project_cache(first_key), equal_to((first_cache, 'prima')))
+        assert_that(tsc.project_cache(second_key), equal_to((second_cache, 'secunda')))
+
+        tsc.unregister_project(first_key)
+        assert_that(tsc.project_cache(first_key), is_(None))
+        assert_that(tsc.project_cache(second_key), equal_to((second_cache, 'secunda')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#  Copyright (c) 2017-2024 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+import unittest
+
+import deal
+from hamcrest import assert_that, equal_to, calling, raises, is_, less_than_or_equal_to, has_items
+import numpy as np
+
+from orchid import time_series_decimation as tsd
+
+
+def _make_samples(sample_count):
+    x = np.arange(1612137600, 1612137600 + sample_count, dtype=np.int64)
+    y = np.sin(np.arange(sample_count) / 50.0)
+    return x, y
+
+
+# Test ideas
+# - Few samples retained unchanged
+# - Result never exceeds maximum points and is sorted
+# - Min/max retains global extremes
+# - LTTB retains first and last samples and isolated spikes
+# - Arguments can be passed by keyword
+class TestTimeSeriesDecimation(unittest.TestCase):
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_too_few_max_points_raises_exception(self):
+        x, y = _make_samples(10)
+        for decimate in tsd.DECIMATION_METHODS.values():
+            with self.subTest(f'{decimate.__name__} requires more than two points'):
+                assert_that(calling(decimate).with_args(x, y, 2), raises(deal.PreContractError))
+
+    def test_decimation_with_keyword_arguments(self):
+        x, y = _make_samples(7)
+        for decimate in tsd.DECIMATION_METHODS.values():
+            with self.subTest(f'{decimate.__name__} accepts keyword arguments'):
+                assert_that(decimate(x=x, y=y, max_points=7).tolist(), equal_to(list(range(7))))
+
+    def test_samples_not_exceeding_max_points_retained(self):
+        x, y = _make_samples(7)
+        for decimate in tsd.DECIMATION_METHODS.values():
+            with self.subTest(f'{decimate.__name__} retains all samples'):
+                assert_that(decimate(x, y, 7).tolist(), equal_to(list(range(7))))
+
+    def test_decimation_returns_at_most_max_points_sorted_indices(self):
+        x, y = _make_samples(10007)
+        for decimate in tsd.DECIMATION_METHODS.values():
+            for max_points in [3, 100, 1001]:
+                with self.subTest(f'{decimate.__name__} retains at most {max_points} samples'):
+                    actual = decimate(x, y, max_points)
+
+                    assert_that(len(actual), is_(less_than_or_equal_to(max_points)))
+                    assert_that(bool(np.all(np.diff(actual) > 0)), is_(True))
+
+    def test_decimation_retains_isolated_spikes(self):
+        x, y = _make_samples(10000)
+        y[4321], y[8765] = 100.0, -100.0
+        y[17] = np.nan
+        for decimate in tsd.DECIMATION_METHODS.values():
+            with self.subTest(f'{decimate.__name__} retains spikes'):
+                assert_that(decimate(x, y, 500).tolist(), has_items(4321, 8765))
+
+    def test_lttb_retains_first_and_last_samples(self):
+        x, y = _make_samples(1000)
+
+        actual = tsd.lttb_indices(x, y, 50)
+
+        assert_that(len(actual), equal_to(50))
+        assert_that((actual[0], actual[-1]), equal_to((0, 999)))
+
+
+if __name__ == '__main__':
+    unittest.main()
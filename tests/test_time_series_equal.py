@@ -27,6 +27,9 @@ from tests import (
     stub_net as tsn,
 )
 
+# noinspection PyUnresolvedReferences
+from System import Array, Double, Int64
+
 
 def assert_time_series_equal(expected_name, start_time_point, values, create_sut_func):
     """
@@ -44,8 +47,8 @@ def assert_time_series_equal(expected_name, start_time_point, values, create_sut
         toolz.map(lambda dt: int(dt.timestamp())),
         list,
     )
-    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(values,
-                                                                            stub_unix_time_stamps)
+    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(Array[Double](list(values)),
+                                                                            Array[Int64](stub_unix_time_stamps))
     with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                              spec=loader.as_python_time_series_arrays,
                              return_value=stub_python_time_series_arrays_dto):
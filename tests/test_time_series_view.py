@@ -0,0 +1,120 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2024 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest.mock
+
+import deal
+from hamcrest import assert_that, equal_to, is_, none, close_to, calling, raises
+import numpy as np
+import pendulum
+
+from orchid import time_series_view as tsv
+
+
+START_TIME = pendulum.parse('2021-02-01T00:00:00Z')
+
+
+class StubTimeSeries:
+    def __init__(self, name, unix_time_stamps, magnitudes):
+        self.name = name
+        self._unix_time_stamps = np.array(unix_time_stamps, dtype=np.int64)
+        self._magnitudes = np.array(magnitudes, dtype=np.float64)
+        self.requested_windows = []
+
+    def sample_arrays(self, start=None, stop=None):
+        self.requested_windows.append((start, stop))
+        in_window = np.ones(len(self._unix_time_stamps), dtype=bool)
+        if start is not None:
+            in_window &= self._unix_time_stamps >= start.timestamp()
+        if stop is not None:
+            in_window &= self._unix_time_stamps <= stop.timestamp()
+        return self._unix_time_stamps[in_window], self._magnitudes[in_window]
+
+
+def create_stub_time_series(magnitudes, name='pressio'):
+    unix_time_stamps = [int(START_TIME.add(seconds=offset).timestamp()) for offset in range(len(magnitudes))]
+    return StubTimeSeries(name, unix_time_stamps, magnitudes)
+
+
+# Test ideas
+# - Creating and slicing a view reads no samples
+# - Slicing a sliced view views the intersection of both windows
+# - Aggregations only read the samples in the viewed window
+# - Repeated aggregations of the same view read the samples once
+# - Aggregations of an empty view
+# - Slicing with a step raises an error
+class TestTimeSeriesView(unittest.TestCase):
+    def setUp(self):
+        self.stub_time_series = create_stub_time_series([1.0, 4.0, 9.0, 2.0, 7.0, 3.0])
+
+    def test_canary(self):
+        assert_that(2 + 2, equal_to(4))
+
+    def test_creating_and_slicing_view_reads_no_samples(self):
+        tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=1):START_TIME.add(seconds=3)]
+
+        assert_that(self.stub_time_series.requested_windows, equal_to([]))
+
+    def test_slicing_sliced_view_views_intersection_of_windows(self):
+        sut = tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=1):][:START_TIME.add(seconds=4)]
+        sut = sut[START_TIME:START_TIME.add(seconds=5)]
+
+        assert_that(sut.start, equal_to(START_TIME.add(seconds=1)))
+        assert_that(sut.stop, equal_to(START_TIME.add(seconds=4)))
+
+    def test_aggregations_only_read_viewed_window(self):
+        sut = tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=3):START_TIME.add(seconds=5)]
+
+        assert_that(sut.max(), equal_to(7.0))
+        assert_that(sut.mean(), equal_to(4.0))
+        assert_that(sut.argmax(), equal_to(START_TIME.add(seconds=4)))
+        assert_that(sut.integrate(), close_to((2.0 + 7.0) / 2 + (7.0 + 3.0) / 2, 1e-12))
+        assert_that(set(self.stub_time_series.requested_windows),
+                    equal_to({(START_TIME.add(seconds=3), START_TIME.add(seconds=5))}))
+
+    def test_repeated_aggregations_of_view_read_samples_once(self):
+        sut = tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=1):]
+
+        sut.max()
+        sut.mean()
+        sut.argmax()
+        sut.integrate()
+
+        assert_that(self.stub_time_series.requested_windows, equal_to([(START_TIME.add(seconds=1), None)]))
+
+    def test_aggregations_of_empty_view(self):
+        sut = tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=10):]
+
+        assert_that(np.isnan(sut.max()), is_(True))
+        assert_that(np.isnan(sut.mean()), is_(True))
+        assert_that(sut.argmax(), is_(none()))
+        assert_that(sut.integrate(), equal_to(0.0))
+
+    @unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+    def test_resample_averages_viewed_samples(self, _stub_script_adapter):
+        sut = tsv.TimeSeriesView(self.stub_time_series)[START_TIME.add(seconds=2):]
+
+        actual = sut.resample('2s', how='mean')
+
+        assert_that(actual.tolist(), equal_to([5.5, 5.0]))
+        assert_that(actual.name, equal_to('pressio'))
+
+    def test_slicing_with_step_raises_error(self):
+        sut = tsv.TimeSeriesView(self.stub_time_series)
+
+        assert_that(calling(sut.__getitem__).with_args(slice(START_TIME, None, 2)), raises(deal.PreContractError))
+
+
+if __name__ == '__main__':
+    unittest.main()